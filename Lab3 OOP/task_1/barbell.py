@@ -1,4 +1,9 @@
-from accessify import private
+import os
+import weakref
+from array import array
+from typing import Callable, Iterable, NamedTuple, Sequence
+
+from accessify import private as accessify_private
 
 
 # fmt: off
@@ -8,6 +13,88 @@ class NegativeOrZeroWeightError(Exception): ...
 # fmt: on
 
 
+# Privacy of the validators is checked by 'accessify' on every call unless Python runs with '-O'
+# or the 'DISABLE_ACCESSIFY' environment variable is set, then the methods are left undecorated
+PRIVACY_ENFORCED: bool = __debug__ and os.environ.get("DISABLE_ACCESSIFY") is None
+
+
+def private(func: Callable) -> Callable:
+    """Make the method private if the privacy is enforced, or leave it as is without any runtime overhead."""
+    return accessify_private(func) if PRIVACY_ENFORCED else func
+
+
+# The largest weight which fits to the item of 'array('i')' used by the compact barbell
+COMPACT_MAX_WEIGHT: int = 2 ** (8 * array("i").itemsize - 1) - 1
+
+# The largest 'plates count * total weight' product for which 'Bar.load' runs the exact partition
+MAX_PARTITION_DP_CELLS: int = 2_000_000
+
+
+def _partition_exact(weights: list[int], balance: int) -> list[bool]:
+    """
+    Split the weights between the sides so that the imbalance is minimal using subset sum dynamic programming.
+
+    Parametrs:
+    ---------
+    weights : list[int]
+        Integer weights of the plates to split.
+    balance : int
+        Current weight difference between the left and the right sides of the barbell.
+
+    Returns:
+    -------
+    list[bool]
+        For every weight True if it goes to the left side, or False.
+    """
+    total: int = sum(weights)
+
+    # reachable[i] has bit 's' set if some of the first 'i' weights sum up to 's'
+    reachable: list[int] = [1]
+    for weight in weights:
+        reachable.append(reachable[-1] | (reachable[-1] << weight))
+
+    # The left side gets 's' and the right side gets 'total - s'
+    best: int = min(
+        (s for s in range(total + 1) if (reachable[-1] >> s) & 1),
+        key=lambda s: abs(balance + 2 * s - total),
+    )
+
+    to_left: list[bool] = [False] * len(weights)
+    for i in range(len(weights), 0, -1):
+        if not (reachable[i - 1] >> best) & 1:
+            to_left[i - 1] = True
+            best -= weights[i - 1]
+
+    return to_left
+
+
+def _partition_greedy(weights: list[int], balance: int) -> list[bool]:
+    """
+    Split the weights between the sides placing the heaviest remaining one on the lighter side.
+
+    Parametrs:
+    ---------
+    weights : list[int]
+        Weights of the plates to split.
+    balance : int
+        Current weight difference between the left and the right sides of the barbell.
+
+    Returns:
+    -------
+    list[bool]
+        For every weight True if it goes to the left side, or False.
+    """
+    to_left: list[bool] = [False] * len(weights)
+    for i in sorted(range(len(weights)), key=weights.__getitem__, reverse=True):
+        if balance <= 0:
+            to_left[i] = True
+            balance += weights[i]
+        else:
+            balance -= weights[i]
+
+    return to_left
+
+
 class Plate:
     """
     Represents a plate.
@@ -16,11 +103,40 @@ class Plate:
     ----------
     weight : int
         Contains the weight of the plate.
+
+    Methods:
+    -------
+    def of(weight: int) -> Plate:
+        Return the shared plate with the given weight.
     """
 
+    # Shared plates are kept only while they are used somewhere, so the cache doesn't grow with every weight
+    __slots__ = ("__weight", "__weakref__")
+    __instances: weakref.WeakValueDictionary[int, "Plate"] = weakref.WeakValueDictionary()
+
     def __init__(self, weight: int) -> None:
         self.__weight: int = self._validate_weight(weight)
 
+    @classmethod
+    def of(cls, weight: int) -> "Plate":
+        """
+        Get the shared plate with the given weight, plates are immutable so one instance per weight is enough.
+
+        Parametrs:
+        ---------
+        weight : int
+            Weight of the plate.
+
+        Raises:
+        ------
+        NegativeOrZeroWeightError
+            If weight less than or equal to zero.
+        """
+        plate: Plate | None = cls.__instances.get(weight)
+        if plate is None:
+            plate = cls.__instances[weight] = cls(weight)
+        return plate
+
     @property
     def weight(self) -> int:
         """Get the weight of the plate."""
@@ -49,6 +165,16 @@ class Plate:
             raise TypeError("Left operand must be 'int'")
         return self.__weight + other
 
+    def __eq__(self, other: object) -> bool:
+        """Plates are equal if their weights are equal, so the shared plate equals any other of its weight."""
+        if not isinstance(other, Plate):
+            return NotImplemented
+        return self.__weight == other.__weight
+
+    def __hash__(self) -> int:
+        """Get the hash of the plate weight."""
+        return hash(self.__weight)
+
     @private
     def _validate_weight(self, weight: int) -> int:
         """
@@ -74,6 +200,28 @@ class Plate:
         return weight
 
 
+class Operation(NamedTuple):
+    """
+    Represents the operation on the barbell.
+
+    Attributes:
+    ----------
+    name : str
+        Name of the barbell method: 'add', 'add_to_left', 'add_to_right', 'load', 'pop_left' or 'pop_right'.
+    plates : tuple[Plate, ...]
+        Plates passed to the method, empty for the pops.
+    """
+
+    name: str
+    plates: tuple[Plate, ...] = ()
+
+
+# Names of the logged operations by their codes. The log keeps the code of every operation and the weight
+# of its plate, or for 'load' the weights of the plates with the flags of those put to the left side
+LOG_OPERATIONS: tuple[str, ...] = ("add_to_left", "add_to_right", "pop_left", "pop_right", "load")
+ADD_TO_LEFT, ADD_TO_RIGHT, POP_LEFT, POP_RIGHT, LOAD = range(len(LOG_OPERATIONS))
+
+
 class Bar:
     """
     Represents a barbell.
@@ -82,6 +230,12 @@ class Bar:
     ----------
     max_weight : int
         Contains the maximum weight that the barbell can withstand.
+    compact : bool
+        Sides of the barbell store only the weights of the plates in 'array('i')'.
+    logged : bool
+        The operations are logged to roll back, redo and replay them.
+    log : list[Operation]
+        Contains the operations that brought the barbell from the empty one to the current state.
 
     Methods:
     -------
@@ -100,33 +254,84 @@ class Bar:
     def add(plate: Plate) -> None:
         Add the plate to the side of the barbell where the level of balance factor will be minimal.
 
+    def load(plates: Sequence[Plate]) -> None:
+        Add all the plates at once splitting them between the sides with the minimal balance factor.
+
     def pop_left() -> Plate:
         Remove the last added plate from the left side of the barbell and return it.
 
     def pop_right() -> Plate:
         Remove the last added plate from the right side of the barbell and return it.
 
+    def checkpoint() -> None:
+        Remember the current state of the barbell to roll back to it.
+
+    def drop_checkpoint() -> None:
+        Forget the last checkpoint.
+
+    def rollback() -> None:
+        Revert the operations made after the last checkpoint.
+
+    def redo() -> None:
+        Apply again the operations reverted by the last rollback.
+
+    def replay(program: Iterable[Operation]) -> None:
+        Bring the barbell to the state after the program reusing the already applied operations.
+
     def print_bar() -> None:
         Print the string representation of the barbell.
     """
 
-    def __init__(self, max_weight: int) -> None:
+    def __init__(self, max_weight: int, compact: bool = False, logged: bool = False) -> None:
         self.__max_weight: int = self.__validate_max_weight(max_weight)
-        self.__left_plates: list[Plate] = []
-        self.__right_plates: list[Plate] = []
+        self.__compact: bool = compact
+        self.__left_plates: list[Plate] | array = array("i") if compact else []
+        self.__right_plates: list[Plate] | array = array("i") if compact else []
+        self.__left_weight: int = 0
+        self.__right_weight: int = 0
+        # Codes of the logged operations and their weights, None if the barbell is not logged
+        self.__log_codes: bytearray | None = bytearray() if logged else None
+        self.__log_values: list[int | tuple[tuple[int, ...], bytes]] = []
+        self.__log_size: int = 0
+        self.__checkpoints: list[int] = []
 
     @property
     def max_weight(self) -> int:
         """Get the maximum weight that the barbell can withstand."""
         return self.__max_weight
 
+    @property
+    def compact(self) -> bool:
+        """Get True if the sides of the barbell store only the weights of the plates, or False."""
+        return self.__compact
+
+    @property
+    def logged(self) -> bool:
+        """Get True if the operations of the barbell are logged, or False."""
+        return self.__log_codes is not None
+
+    @property
+    def log(self) -> list[Operation]:
+        """
+        Get the operations that brought the barbell from the empty one to the current state.
+
+        Only the weights are logged, so the operations hold the shared plates of these weights.
+
+        Raises:
+        ------
+        RuntimeError
+            If the barbell is not logged.
+        """
+        self.__validate_logged()
+        return [self.__operation(index) for index in range(self.__log_size)]
+
     def get_total_weight(self) -> int:
         """Get the total weight of the plates on the barbell."""
-        return sum(self.__left_plates) + sum(self.__right_plates)
+        return self.__left_weight + self.__right_weight
 
     def get_balance_factor(self) -> int:
         """Get the weight difference modulus between the left and the right sides of the barbell."""
-        return abs(sum(self.__left_plates) - sum(self.__right_plates))
+        return abs(self.__left_weight - self.__right_weight)
 
     def add_to_left(self, plate: Plate) -> None:
         """
@@ -143,10 +348,19 @@ class Bar:
             If adding a plate will lead to increase in the maximum weight.
         ImbalanceError
             If adding a plate will lead to increase in the acciptable level of imbalance.
+        TypeError
+            If the barbell is compact and the weight of the plate is not an integer.
+        OverflowError
+            If the barbell is compact and the weight of the plate doesn't fit to the item of 'array('i')'.
         """
+        if self.__compact:
+            self.__validate_compact_weights([plate.weight])
         self.__validate_bar(plate)
         self.__validate_bar_balance(plate)
-        self.__left_plates.append(plate)
+        self.__left_plates.append(plate.weight if self.__compact else plate)
+        self.__left_weight += plate.weight
+        if self.__log_codes is not None:
+            self.__record(ADD_TO_LEFT, plate.weight)
 
     def add_to_right(self, plate: Plate) -> None:
         """
@@ -163,10 +377,19 @@ class Bar:
             If adding a plate will lead to increase in the maximum weight.
         ImbalanceError
             If adding a plate will lead to increase in the acciptable level of imbalance.
+        TypeError
+            If the barbell is compact and the weight of the plate is not an integer.
+        OverflowError
+            If the barbell is compact and the weight of the plate doesn't fit to the item of 'array('i')'.
         """
+        if self.__compact:
+            self.__validate_compact_weights([plate.weight])
         self.__validate_bar(plate)
         self.__validate_bar_balance(plate, to_left=False)
-        self.__right_plates.append(plate)
+        self.__right_plates.append(plate.weight if self.__compact else plate)
+        self.__right_weight += plate.weight
+        if self.__log_codes is not None:
+            self.__record(ADD_TO_RIGHT, plate.weight)
 
     def add(self, plate: Plate) -> None:
         """
@@ -184,14 +407,67 @@ class Bar:
         ImbalanceError
             If adding a plate will lead to increase in the acciptable level of imbalance.
         """
-        to_left_balance: int = abs(sum(self.__left_plates) + plate.weight - sum(self.__right_plates))
-        to_right_balance: int = abs(sum(self.__left_plates) - plate.weight - sum(self.__right_plates))
+        to_left_balance: int = abs(self.__left_weight + plate.weight - self.__right_weight)
+        to_right_balance: int = abs(self.__left_weight - plate.weight - self.__right_weight)
 
         if to_left_balance <= to_right_balance:
             self.add_to_left(plate)
         else:
             self.add_to_right(plate)
 
+    def load(self, plates: Sequence[Plate]) -> None:
+        """
+        Add all the plates at once splitting them between the sides with the minimal balance factor.
+
+        The barbell is validated only once for the whole batch and is changed only if the validation passes.
+
+        Parametrs:
+        ---------
+        plates : Sequence[Plate]
+            Plates to add to the barbell.
+
+        Raises:
+        ------
+        MaxWeightExcessError
+            If adding the plates will lead to increase in the maximum weight.
+        ImbalanceError
+            If there is no split of the plates within the acciptable level of imbalance.
+        TypeError
+            If the barbell is compact and some weight of the plates is not an integer.
+        OverflowError
+            If the barbell is compact and some weight of the plates doesn't fit to the item of 'array('i')'.
+        """
+        plates = list(plates)
+        weights: list[int] = [plate.weight for plate in plates]
+        if self.__compact:
+            self.__validate_compact_weights(weights)
+        self.__validate_bar_load(weights)
+
+        balance: int = self.__left_weight - self.__right_weight
+        if all(isinstance(weight, int) for weight in weights) and len(weights) * sum(weights) <= MAX_PARTITION_DP_CELLS:
+            to_left: list[bool] = _partition_exact(weights, balance)
+        else:
+            to_left = _partition_greedy(weights, balance)
+
+        left_plates: list[Plate] = [plate for plate, left in zip(plates, to_left) if left]
+        right_plates: list[Plate] = [plate for plate, left in zip(plates, to_left) if not left]
+        left_weight: int = self.__left_weight + sum(plate.weight for plate in left_plates)
+        right_weight: int = self.__right_weight + sum(plate.weight for plate in right_plates)
+
+        if abs(left_weight - right_weight) >= 20:
+            raise ImbalanceError("Balancing allowed level exceeded")
+
+        if self.__compact:
+            self.__left_plates.extend(plate.weight for plate in left_plates)
+            self.__right_plates.extend(plate.weight for plate in right_plates)
+        else:
+            self.__left_plates.extend(left_plates)
+            self.__right_plates.extend(right_plates)
+        self.__left_weight = left_weight
+        self.__right_weight = right_weight
+        if self.__log_codes is not None:
+            self.__record(LOAD, (tuple(weights), bytes(to_left)))
+
     def pop_left(self) -> Plate:
         """
         Remove the last added plate from the left side of the barbell and return it.
@@ -199,7 +475,7 @@ class Bar:
         Returns:
         -------
         plate : Plate
-            The last plate added to the left side of the barbell.
+            The last plate added to the left side of the barbell, the shared one if the barbell is compact.
 
         Raises:
         ------
@@ -209,11 +485,18 @@ class Bar:
         if not self.__left_plates:
             return None
 
-        left_side: list[Plate] = self.__left_plates[:-1]
-        if abs(sum(left_side) - sum(self.__right_plates)) >= 20:
+        left_weight: int = self.__left_weight - self.__last_weight(self.__left_plates)
+        if abs(left_weight - self.__right_weight) >= 20:
             raise ImbalanceError("Balancing allowed level exceeded")
 
-        return self.__left_plates.pop()
+        self.__left_weight = left_weight
+        plate: Plate | int = self.__left_plates.pop()
+        if self.__compact:
+            plate = Plate.of(plate)
+
+        if self.__log_codes is not None:
+            self.__record(POP_LEFT, plate.weight)
+        return plate
 
     def pop_right(self) -> Plate:
         """
@@ -222,7 +505,7 @@ class Bar:
         Returns:
         -------
         plate : Plate
-            The last plate added to the right side of the barbell.
+            The last plate added to the right side of the barbell, the shared one if the barbell is compact.
 
         Raises:
         ------
@@ -232,21 +515,139 @@ class Bar:
         if not self.__right_plates:
             return None
 
-        right_side: list[Plate] = self.__right_plates[:-1]
-        if abs(sum(self.__left_plates) - sum(right_side)) >= 20:
+        right_weight: int = self.__right_weight - self.__last_weight(self.__right_plates)
+        if abs(self.__left_weight - right_weight) >= 20:
             raise ImbalanceError("Balancing allowed level exceeded")
 
-        return self.__right_plates.pop()
+        self.__right_weight = right_weight
+        plate: Plate | int = self.__right_plates.pop()
+        if self.__compact:
+            plate = Plate.of(plate)
+
+        if self.__log_codes is not None:
+            self.__record(POP_RIGHT, plate.weight)
+        return plate
+
+    def checkpoint(self) -> None:
+        """
+        Remember the current state of the barbell to roll back to it.
+
+        Raises:
+        ------
+        RuntimeError
+            If the barbell is not logged.
+        """
+        self.__validate_logged()
+        self.__checkpoints.append(self.__log_size)
+
+    def drop_checkpoint(self) -> None:
+        """
+        Forget the last checkpoint, the next rollback goes to the one before it.
+
+        Raises:
+        ------
+        RuntimeError
+            If the barbell is not logged.
+        ValueError
+            If there are no checkpoints.
+        """
+        self.__validate_logged()
+        self.__drop_checkpoints_after(self.__log_size)
+        if not self.__checkpoints:
+            raise ValueError("There are no checkpoints")
+        self.__checkpoints.pop()
+
+    def rollback(self) -> None:
+        """
+        Revert the operations made after the last checkpoint, or all of them if there are no checkpoints.
+
+        The reverted operations led from a valid state to a valid state, so the barbell is not validated again.
+        The checkpoint is kept to roll back to it once more. The cost is proportional to the number of the
+        reverted operations and the plates they moved, not to the number of the plates on the barbell.
+
+        Raises:
+        ------
+        RuntimeError
+            If the barbell is not logged.
+        """
+        self.__validate_logged()
+        self.__drop_checkpoints_after(self.__log_size)
+        self.__undo_to(self.__checkpoints[-1] if self.__checkpoints else 0)
+
+    def redo(self) -> None:
+        """
+        Apply again without validation the operations reverted by the last rollback.
+
+        Raises:
+        ------
+        RuntimeError
+            If the barbell is not logged.
+        """
+        self.__validate_logged()
+        while self.__log_size < len(self.__log_codes):
+            self.__move(self.__log_size, forward=True)
+            self.__log_size += 1
+
+    def replay(self, program: Iterable[Operation]) -> None:
+        """
+        Bring the barbell to the state after the program applied to the empty barbell.
+
+        The longest prefix of the program that matches the log is already applied and verified, so it is kept
+        as is. The operations after it are reverted and the rest of the program is applied with validation.
+        If an operation fails the barbell stays in the state after the previous one.
+
+        Parametrs:
+        ---------
+        program : Iterable[Operation]
+            Operations to apply, for example the log of another barbell.
+
+        Raises:
+        ------
+        RuntimeError
+            If the barbell is not logged.
+        ValueError
+            If the operation name is not the name of the barbell method.
+        MaxWeightExcessError
+            If adding a plate will lead to increase in the maximum weight.
+        ImbalanceError
+            If an operation will lead to increase in the acciptable level of imbalance.
+        """
+        self.__validate_logged()
+        program = list(program)
+
+        common: int = 0
+        balance: int = 0
+        while common < min(len(program), self.__log_size):
+            name, left_weights, right_weights = self.__entry(common)
+            if not self.__matches(program[common], common, balance):
+                break
+
+            delta: int = sum(left_weights) - sum(right_weights)
+            balance += -delta if name.startswith("pop") else delta
+            common += 1
+
+        self.__undo_to(common)
+        self.__drop_checkpoints_after(common)
+
+        for operation in program[common:]:
+            if operation.name in ("add", "add_to_left", "add_to_right"):
+                getattr(self, operation.name)(*operation.plates)
+            elif operation.name in ("pop_left", "pop_right"):
+                getattr(self, operation.name)()
+            elif operation.name == "load":
+                self.load(operation.plates)
+            else:
+                raise ValueError(f"Unknown barbell operation '{operation.name}'")
 
     def print_bar(self) -> None:
         """Print the string representation of the barbell."""
-        for plate in self.__left_plates[::-1]:
-            print(f"={plate.weight}", end="")
+        for weight in self.__weights(self.__left_plates[::-1]):
+            print(f"={weight}", end="")
 
         print("=|=============|=", end="")
 
-        for plate in self.__right_plates:
-            print(f"{plate.weight}=", end="")
+        for weight in self.__weights(self.__right_plates):
+            print(f"{weight}=", end="")
 
         print()
 
@@ -254,16 +655,107 @@ class Bar:
         """Get the string representation of the barbell."""
         result = []
 
-        for plate in self.__left_plates[::-1]:
-            result.append(f"={plate.weight}")
+        for weight in self.__weights(self.__left_plates[::-1]):
+            result.append(f"={weight}")
 
         result.append("=|=============|=")
 
-        for plate in self.__right_plates:
-            result.append(f"{plate.weight}=")
+        for weight in self.__weights(self.__right_plates):
+            result.append(f"{weight}=")
 
         return "".join(result)
 
+    def __record(self, code: int, value: int | tuple[tuple[int, ...], bytes]) -> None:
+        """Append the applied operation to the log dropping the operations reverted by the rollback."""
+        if self.__log_size < len(self.__log_codes):
+            del self.__log_codes[self.__log_size :]
+            del self.__log_values[self.__log_size :]
+            self.__drop_checkpoints_after(self.__log_size)
+
+        self.__log_codes.append(code)
+        self.__log_values.append(value)
+        self.__log_size += 1
+
+    def __entry(self, index: int) -> tuple[str, list[int], list[int]]:
+        """Get the name of the logged operation and the weights it added to (or removed from) each side."""
+        code: int = self.__log_codes[index]
+        value: int | tuple[tuple[int, ...], bytes] = self.__log_values[index]
+        if code == LOAD:
+            weights, to_left = value
+            left: list[int] = [weight for weight, left in zip(weights, to_left) if left]
+            return LOG_OPERATIONS[code], left, [weight for weight, left in zip(weights, to_left) if not left]
+        if code in (ADD_TO_LEFT, POP_LEFT):
+            return LOG_OPERATIONS[code], [value], []
+        return LOG_OPERATIONS[code], [], [value]
+
+    def __operation(self, index: int) -> Operation:
+        """Get the logged operation with the shared plates of the logged weights."""
+        code: int = self.__log_codes[index]
+        value: int | tuple[tuple[int, ...], bytes] = self.__log_values[index]
+        if code == LOAD:
+            return Operation(LOG_OPERATIONS[code], tuple(Plate.of(weight) for weight in value[0]))
+        if code in (POP_LEFT, POP_RIGHT):
+            return Operation(LOG_OPERATIONS[code])
+        return Operation(LOG_OPERATIONS[code], (Plate.of(value),))
+
+    def __undo_to(self, log_size: int) -> None:
+        """Revert the logged operations until only the given number of them is applied."""
+        while self.__log_size > log_size:
+            self.__log_size -= 1
+            self.__move(self.__log_size, forward=False)
+
+    def __drop_checkpoints_after(self, log_size: int) -> None:
+        """Forget the checkpoints that point past the given number of applied operations."""
+        while self.__checkpoints and self.__checkpoints[-1] > log_size:
+            self.__checkpoints.pop()
+
+    def __move(self, index: int, forward: bool) -> None:
+        """Apply the logged operation, or revert it, without validation, the plates are put back as shared ones."""
+        name, left_weights, right_weights = self.__entry(index)
+        left_weight: int = sum(left_weights)
+        right_weight: int = sum(right_weights)
+
+        if forward == name.startswith("pop"):
+            del self.__left_plates[len(self.__left_plates) - len(left_weights) :]
+            del self.__right_plates[len(self.__right_plates) - len(right_weights) :]
+            self.__left_weight -= left_weight
+            self.__right_weight -= right_weight
+        elif self.__compact:
+            self.__left_plates.extend(left_weights)
+            self.__right_plates.extend(right_weights)
+            self.__left_weight += left_weight
+            self.__right_weight += right_weight
+        else:
+            self.__left_plates.extend(map(Plate.of, left_weights))
+            self.__right_plates.extend(map(Plate.of, right_weights))
+            self.__left_weight += left_weight
+            self.__right_weight += right_weight
+
+    def __matches(self, operation: Operation, index: int, balance: int) -> bool:
+        """Check if the operation applied to the barbell with the given balance repeats the logged one."""
+        logged: Operation = self.__operation(index)
+        if [plate.weight for plate in operation.plates] != [plate.weight for plate in logged.plates]:
+            return False
+
+        if operation.name == "add":
+            # 'add' puts the plate to the left side unless the left side is heavier
+            return logged.name == ("add_to_left" if balance <= 0 else "add_to_right")
+
+        return operation.name == logged.name
+
+    def __validate_logged(self) -> None:
+        """Raise RuntimeError if the operations of the barbell are not logged."""
+        if self.__log_codes is None:
+            raise RuntimeError("Operations of the barbell are not logged, create it with 'logged=True'")
+
+    def __last_weight(self, side: list[Plate] | array) -> int:
+        """Get the weight of the last added plate on the side of the barbell."""
+        return side[-1] if self.__compact else side[-1].weight
+
+    def __weights(self, side: list[Plate] | array) -> Iterable[int]:
+        """Get the weights of the plates on the side of the barbell."""
+        return side if self.__compact else (plate.weight for plate in side)
+
     @private
     def __validate_max_weight(self, weight: int) -> int:
         """
@@ -306,6 +798,49 @@ class Bar:
         if self.get_total_weight() + plate.weight > self.__max_weight:
             raise MaxWeightExcessError("Maximum weight exceeded")
 
+    @private
+    def __validate_bar_load(self, weights: list[int]) -> None:
+        """
+        Validate the barbell with added batch of plates.
+
+        Parametrs:
+        ---------
+        weights : list[int]
+            Weights of the plates to add on the barbell.
+
+        Raises:
+        ------
+        MaxWeightExcessError
+            If the adding of the plates will lead to increase in the maximum weight.
+        """
+        if self.get_total_weight() + sum(weights) > self.__max_weight:
+            raise MaxWeightExcessError("Maximum weight exceeded")
+
+    @private
+    def __validate_compact_weights(self, weights: list[int]) -> None:
+        """
+        Validate the weights of the plates to store in the compact sides of the barbell.
+
+        Parametrs:
+        ---------
+        weights : list[int]
+            Weights of the plates to add on the barbell.
+
+        Raises:
+        ------
+        TypeError
+            If some weight is not an integer.
+        OverflowError
+            If some weight doesn't fit to the item of 'array('i')'.
+        """
+        for weight in weights:
+            if not isinstance(weight, int):
+                raise TypeError(
+                    f"Weight of the plate on the compact barbell must be 'int', not '{type(weight).__name__}'"
+                )
+            if weight > COMPACT_MAX_WEIGHT:
+                raise OverflowError(f"Weight of the plate on the compact barbell must not exceed {COMPACT_MAX_WEIGHT}")
+
     @private
     def __validate_bar_balance(self, plate: Plate, to_left: bool = True) -> None:
         """
@@ -329,5 +864,5 @@ class Bar:
         else:
             side_coef = -1
 
-        if abs(sum(self.__left_plates) - sum(self.__right_plates) + side_coef * plate.weight) >= 20:
+        if abs(self.__left_weight - self.__right_weight + side_coef * plate.weight) >= 20:
             raise ImbalanceError("Balancing allowed level exceeded")
@@ -0,0 +1,229 @@
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from typing import Callable
+
+from accessify import private
+
+from barbell import Bar, Plate, ImbalanceError, MaxWeightExcessError, NegativeOrZeroWeightError, Operation
+
+
+PLATE_COUNTS: list[int] = [10, 100, 1_000, 10_000]
+PLATE_WEIGHTS: list[int] = [5, 10, 20, 25]
+
+
+class LegacyPlate:
+    """The plate as it was before '__slots__' and interning: one object with '__dict__' per construction."""
+
+    def __init__(self, weight: int) -> None:
+        self.__weight: int = self._validate_weight(weight)
+
+    @property
+    def weight(self) -> int:
+        return self.__weight
+
+    @private
+    def _validate_weight(self, weight: int) -> int:
+        if weight <= 0:
+            raise NegativeOrZeroWeightError("Weight must be greater than zero")
+        return weight
+
+
+def fill_bar(plates_count: int, max_weight: int) -> Bar:
+    """Get the barbell loaded with the given number of 1 kg plates."""
+    bar = Bar(max_weight)
+    plate = Plate(1)
+    for _ in range(plates_count):
+        bar.add(plate)
+    return bar
+
+
+def legacy_add(left_plates: list[Plate], right_plates: list[Plate], plate: Plate, max_weight: int) -> None:
+    """Add the plate the way 'Bar.add' did before the running side totals, re-summing both sides."""
+    to_left_balance: int = abs(sum(left_plates) + plate.weight - sum(right_plates))
+    to_right_balance: int = abs(sum(left_plates) - plate.weight - sum(right_plates))
+    to_left: bool = to_left_balance <= to_right_balance
+
+    if sum(left_plates) + sum(right_plates) + plate.weight > max_weight:
+        raise MaxWeightExcessError("Maximum weight exceeded")
+    if abs(sum(left_plates) - sum(right_plates) + (1 if to_left else -1) * plate.weight) >= 20:
+        raise ImbalanceError("Balancing allowed level exceeded")
+
+    if to_left:
+        left_plates.append(plate)
+    else:
+        right_plates.append(plate)
+
+
+def bench_add(number: int = 1_000) -> None:
+    """Print the mean 'add()' latency for the barbells with different plate counts."""
+    plate = Plate(1)
+
+    print(f"{'plates':>8} | {'legacy, us':>12} | {'running totals, us':>18}")
+    for plates_count in PLATE_COUNTS:
+        left_plates: list[Plate] = [plate] * (plates_count // 2)
+        right_plates: list[Plate] = [plate] * (plates_count - plates_count // 2)
+        max_weight: int = plates_count + number + 10
+        legacy: float = timeit.timeit(lambda: legacy_add(left_plates, right_plates, plate, max_weight), number=number)
+
+        bar: Bar = fill_bar(plates_count, max_weight)
+        current: float = timeit.timeit(lambda: bar.add(plate), number=number)
+
+        print(f"{plates_count:>8} | {legacy / number * 1e6:>12.2f} | {current / number * 1e6:>18.2f}")
+
+
+def bench_load(number: int = 100) -> None:
+    """Print the time of loading the plate configurations one by one with 'add()' and at once with 'load()'."""
+    print(f"{'plates':>8} | {'add(), ms':>10} | {'load(), ms':>10}")
+    for plates_count in PLATE_COUNTS[:3]:
+        plates: list[Plate] = [Plate(weight) for weight in [5, 10, 20, 25] * (plates_count // 4)]
+        max_weight: int = sum(plate.weight for plate in plates)
+
+        def add_one_by_one() -> None:
+            bar = Bar(max_weight)
+            for plate in plates:
+                bar.add(plate)
+
+        by_add: float = timeit.timeit(add_one_by_one, number=number)
+        by_load: float = timeit.timeit(lambda: Bar(max_weight).load(plates), number=number)
+
+        print(f"{plates_count:>8} | {by_add / number * 1e3:>10.3f} | {by_load / number * 1e3:>10.3f}")
+
+
+def measure_memory(factory: Callable[[], object]) -> int:
+    """Get the number of bytes allocated by the factory call and still alive."""
+    tracemalloc.start()
+    result = factory()  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def bench_plates(count: int = 100_000) -> None:
+    """Print the memory and construction throughput of the legacy, slotted and shared plates."""
+    weights: list[int] = PLATE_WEIGHTS * (count // len(PLATE_WEIGHTS))
+    factories: dict[str, Callable[[], list]] = {
+        "legacy Plate()": lambda: [LegacyPlate(weight) for weight in weights],
+        "slotted Plate()": lambda: [Plate(weight) for weight in weights],
+        "Plate.of()": lambda: [Plate.of(weight) for weight in weights],
+    }
+
+    print(f"{'plates':>16} | {'memory, KiB':>12} | {'plates/s':>12}")
+    for name, factory in factories.items():
+        memory: int = measure_memory(factory)
+        seconds: float = timeit.timeit(factory, number=1)
+        print(f"{name:>16} | {memory / 1024:>12.1f} | {len(weights) / seconds:>12.0f}")
+
+
+def bench_bar_memory(count: int = 100_000) -> None:
+    """Print the memory of the barbell filled by 'add()' with plate lists or weight arrays, with and without log."""
+    plates: list[Plate] = [Plate.of(weight) for weight in PLATE_WEIGHTS] * (count // len(PLATE_WEIGHTS))
+    max_weight: int = sum(plate.weight for plate in plates)
+
+    def load_bar(compact: bool, logged: bool) -> Bar:
+        bar = Bar(max_weight, compact=compact, logged=logged)
+        for plate in plates:
+            bar.add(plate)
+        return bar
+
+    print(f"{'bar':>16} | {'memory, KiB':>12}")
+    for compact in (False, True):
+        for logged in (False, True):
+            memory: int = measure_memory(lambda: load_bar(compact, logged))
+            name: str = ("compact" if compact else "list") + (", logged" if logged else "")
+            print(f"{name:>16} | {memory / 1024:>12.1f}")
+
+
+def record_program(operations_count: int) -> list[Operation]:
+    """Get the log of the barbell after the given number of valid adds and pops of 5 kg plates."""
+    bar = Bar(operations_count * 5, logged=True)
+    for i in range(operations_count):
+        if i % 5 == 4:
+            bar.pop_right()
+        else:
+            bar.add(Plate.of(5))
+    return bar.log
+
+
+def bench_replay(number: int = 10) -> None:
+    """
+    Print the time of replaying the program with one changed last operation from scratch and from the log,
+    and the time of rolling back the last 10 operations to the checkpoint and redoing them.
+    """
+    print(f"{'operations':>10} | {'rebuild, ms':>11} | {'replay, ms':>10} | {'rollback, ms':>12}")
+    for operations_count in PLATE_COUNTS[1:]:
+        program: list[Operation] = record_program(operations_count)
+        changed: list[Operation] = program[:-1] + [Operation("pop_left")]
+        max_weight: int = operations_count * 5
+
+        def rebuild() -> None:
+            Bar(max_weight, logged=True).replay(changed)
+
+        bar = Bar(max_weight, logged=True)
+        bar.replay(program)
+
+        def replay() -> None:
+            bar.replay(changed)
+            bar.replay(program)
+
+        checkpointed = Bar(max_weight, logged=True)
+        checkpointed.replay(program[:-10])
+        checkpointed.checkpoint()
+        checkpointed.replay(program)
+
+        def rollback() -> None:
+            checkpointed.rollback()
+            checkpointed.redo()
+
+        by_rebuild: float = timeit.timeit(rebuild, number=number) / number
+        by_replay: float = timeit.timeit(replay, number=number) / number / 2
+        by_rollback: float = timeit.timeit(rollback, number=number) / number
+
+        print(
+            f"{operations_count:>10} | {by_rebuild * 1e3:>11.3f} | "
+            f"{by_replay * 1e3:>10.3f} | {by_rollback * 1e3:>12.3f}"
+        )
+
+
+def time_call(stmt: str, setup: str, number: int, privacy_enforced: bool) -> float:
+    """Get the mean statement time in microseconds measured in a fresh interpreter with the given privacy mode."""
+    env: dict[str, str] = dict(os.environ)
+    if privacy_enforced:
+        env.pop("DISABLE_ACCESSIFY", None)
+    else:
+        env["DISABLE_ACCESSIFY"] = "1"
+
+    code: str = f"import timeit; print(timeit.timeit({stmt!r}, {setup!r}, number={number}))"
+    cwd: str = os.path.dirname(os.path.abspath(__file__))
+    output: str = subprocess.run(
+        [sys.executable, "-c", code], env=env, cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout
+    return float(output) / number * 1e6
+
+
+def bench_privacy(number: int = 10_000) -> None:
+    """Print the per-call cost of every validated method with the privacy enforced and disabled."""
+    setup: str = "from barbell import Bar, Plate; plate = Plate(10); bar = Bar(150)"
+    calls: dict[str, str] = {
+        "Plate._validate_weight": "Plate(10)",
+        "Bar.__validate_max_weight": "Bar(150)",
+        "Bar.__validate_bar(_balance)": "bar.add_to_left(plate); bar.pop_left()",
+        "Bar.__validate_bar_load": "bar.load([])",
+    }
+
+    print(f"{'method':>28} | {'enforced, us':>12} | {'disabled, us':>12} | {'overhead, us':>12}")
+    for name, stmt in calls.items():
+        enforced: float = time_call(stmt, setup, number, privacy_enforced=True)
+        disabled: float = time_call(stmt, setup, number, privacy_enforced=False)
+        print(f"{name:>28} | {enforced:>12.2f} | {disabled:>12.2f} | {enforced - disabled:>12.2f}")
+
+
+if __name__ == "__main__":
+    bench_add()
+    bench_load()
+    bench_plates()
+    bench_bar_memory()
+    bench_replay()
+    bench_privacy()
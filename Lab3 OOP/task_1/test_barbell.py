@@ -1,5 +1,13 @@
+import os
+import subprocess
+import sys
+import weakref
+
 import pytest
-from barbell import ImbalanceError, MaxWeightExcessError, Plate, Bar, NegativeOrZeroWeightError
+from accessify.errors import InaccessibleDueToItsProtectionLevelException
+
+import barbell
+from barbell import ImbalanceError, MaxWeightExcessError, Plate, Bar, NegativeOrZeroWeightError, Operation, private
 
 
 # Fixtires
@@ -126,3 +134,254 @@ def test_bar_to_str(bar_150: Bar, plate_10: Plate) -> None:
 
     bar_150.add_to_right(plate_10)
     assert str(bar_150) == "=10=|=============|=10="
+
+
+@pytest.mark.bar
+def test_bar_running_totals(bar_150: Bar, plate_10: Plate, plate_20: Plate) -> None:
+    bar_150.add(plate_10)
+    bar_150.add(plate_20)
+    bar_150.add(plate_10)
+    assert bar_150.get_total_weight() == 40
+    assert bar_150.get_balance_factor() == 0
+
+    with pytest.raises(ImbalanceError):
+        bar_150.pop_right()
+    assert bar_150.get_total_weight() == 40
+
+    bar_150.pop_left()
+    assert bar_150.get_total_weight() == 30
+    assert bar_150.get_balance_factor() == 10
+
+
+@pytest.mark.bar
+def test_bar_load(bar_150: Bar, plate_10: Plate, plate_20: Plate, plate_30: Plate) -> None:
+    bar_150.load([plate_30, plate_20, plate_10])
+    assert bar_150.get_total_weight() == 60
+    assert bar_150.get_balance_factor() == 0
+
+    bar_150.load([])
+    assert bar_150.get_total_weight() == 60
+
+
+@pytest.mark.bar
+def test_bar_load_is_atomic(bar_150: Bar, plate_10: Plate, plate_30: Plate) -> None:
+    bar_150.add(plate_10)
+
+    with pytest.raises(MaxWeightExcessError):
+        bar_150.load([plate_30] * 5)
+    with pytest.raises(ImbalanceError):
+        bar_150.load([plate_30])
+
+    assert bar_150.get_total_weight() == 10
+    assert str(bar_150) == "=10=|=============|="
+
+
+@pytest.mark.bar
+def test_bar_load_large_batch() -> None:
+    bar = Bar(100_000)
+    bar.load([Plate(weight) for weight in [25, 20, 10, 5] * 500])
+    assert bar.get_total_weight() == 30_000
+    assert bar.get_balance_factor() == 0
+
+
+@pytest.mark.plate
+def test_plate_of() -> None:
+    assert Plate.of(10) is Plate.of(10)
+    assert Plate.of(10).weight == 10
+    assert Plate.of(20) is not Plate.of(10)
+    assert not hasattr(Plate.of(10), "__dict__")
+    with pytest.raises(NegativeOrZeroWeightError):
+        Plate.of(0)
+
+    # The shared plate is not kept by the cache after the last reference to it is dropped
+    plate_ref = weakref.ref(Plate.of(12_345))
+    assert plate_ref() is None
+
+
+@pytest.mark.bar
+def test_bar_compact(plate_10: Plate, plate_20: Plate) -> None:
+    bar = Bar(150, compact=True)
+    assert bar.compact is True
+
+    bar.add(plate_10)
+    bar.add(plate_20)
+    bar.load([plate_10, plate_20])
+    assert bar.get_total_weight() == 60
+    assert bar.get_balance_factor() == 0
+    assert str(bar) == "=20=10=|=============|=20=10="
+
+    plate: Plate = bar.pop_right()
+    assert plate is Plate.of(10)
+    assert bar.get_total_weight() == 50
+
+
+@pytest.mark.bar
+def test_bar_compact_rejects_weights_out_of_array() -> None:
+    bar = Bar(2**40, compact=True)
+    bar.add(Plate(10))
+    for plate in (Plate(10.5), Plate(2**31)):
+        with pytest.raises((TypeError, OverflowError)):
+            bar.add_to_left(plate)
+        with pytest.raises((TypeError, OverflowError)):
+            bar.add_to_right(plate)
+    with pytest.raises(TypeError):
+        bar.load([Plate(10), Plate(10.5)])
+    with pytest.raises(OverflowError):
+        bar.load([Plate(2**31), Plate(2**31)])
+
+    assert bar.get_total_weight() == 10
+    assert str(bar) == "=10=|=============|="
+
+
+@pytest.mark.bar
+def test_bar_log(plate_10: Plate, plate_30: Plate) -> None:
+    bar_150 = Bar(150, logged=True)
+    bar_150.add(plate_10)
+    bar_150.add(plate_10)
+    bar_150.pop_left()
+    assert bar_150.log == [
+        Operation("add_to_left", (plate_10,)),
+        Operation("add_to_right", (plate_10,)),
+        Operation("pop_left"),
+    ]
+
+    with pytest.raises(ImbalanceError):
+        bar_150.add(plate_30)
+    assert len(bar_150.log) == 3
+
+
+@pytest.mark.bar
+def test_bar_rollback_redo(plate_10: Plate, plate_20: Plate) -> None:
+    bar_150 = Bar(150, logged=True)
+    bar_150.add(plate_10)
+    bar_150.checkpoint()
+    bar_150.add(plate_20)
+    bar_150.load([plate_10, plate_20])
+    bar_150.pop_right()
+    state: str = str(bar_150)
+
+    bar_150.rollback()
+    assert str(bar_150) == "=10=|=============|="
+    assert bar_150.get_total_weight() == 10
+    assert bar_150.get_balance_factor() == 10
+
+    bar_150.redo()
+    assert str(bar_150) == state
+    assert bar_150.get_total_weight() == 50
+
+    bar_150.rollback()
+    bar_150.add(plate_10)
+    bar_150.redo()
+    assert str(bar_150) == "=10=|=============|=10="
+
+    bar_150.rollback()
+    assert bar_150.get_total_weight() == 10
+
+    Bar(150, logged=True).rollback()
+
+
+@pytest.mark.bar
+def test_bar_replay(plate_10: Plate, plate_20: Plate, plate_30: Plate) -> None:
+    program: list[Operation] = [
+        Operation("add", (plate_10,)),
+        Operation("add", (plate_20,)),
+        Operation("add", (plate_30,)),
+    ]
+    bar = Bar(150, logged=True)
+    with pytest.raises(ImbalanceError):
+        bar.replay(program)
+    assert bar.get_total_weight() == 30
+
+    program[2] = Operation("load", (plate_10, plate_10))
+    bar.replay(program)
+    assert bar.get_total_weight() == 50
+    assert bar.get_balance_factor() == 10
+
+    state: str = str(bar)
+    bar.replay(bar.log)
+    assert str(bar) == state
+
+    other = Bar(150, compact=True, logged=True)
+    other.replay(bar.log + [Operation("pop_right")])
+    assert other.get_total_weight() == 40
+
+    with pytest.raises(ValueError):
+        bar.replay([Operation("unknown")])
+
+
+@pytest.mark.bar
+def test_bar_drop_checkpoint(plate_10: Plate, plate_20: Plate) -> None:
+    bar = Bar(150, logged=True)
+    bar.add(plate_10)
+    bar.checkpoint()
+    bar.add(plate_20)
+    bar.checkpoint()
+    bar.add(plate_10)
+
+    bar.drop_checkpoint()
+    bar.rollback()
+    assert bar.get_total_weight() == 10
+    bar.drop_checkpoint()
+    with pytest.raises(ValueError):
+        bar.drop_checkpoint()
+    bar.rollback()
+    assert bar.get_total_weight() == 0
+
+
+@pytest.mark.bar
+def test_bar_not_logged(bar_150: Bar, plate_10: Plate) -> None:
+    bar_150.add(plate_10)
+    assert bar_150.logged is False
+    for method in (bar_150.checkpoint, bar_150.rollback, bar_150.redo, bar_150.drop_checkpoint):
+        with pytest.raises(RuntimeError):
+            method()
+    with pytest.raises(RuntimeError):
+        bar_150.replay([])
+    with pytest.raises(RuntimeError):
+        bar_150.log
+
+
+# Privacy tests
+@pytest.mark.plate
+@pytest.mark.bar
+@pytest.mark.skipif(not barbell.PRIVACY_ENFORCED, reason="privacy is not enforced")
+def test_privacy_enforced(plate_10: Plate, bar_150: Bar) -> None:
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        plate_10._validate_weight(10)
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        bar_150._Bar__validate_bar(plate_10)
+
+
+@pytest.mark.plate
+@pytest.mark.bar
+def test_privacy_not_enforced(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(barbell, "PRIVACY_ENFORCED", False)
+
+    def method(self) -> None: ...
+
+    assert private(method) is method
+
+
+@pytest.mark.plate
+@pytest.mark.bar
+@pytest.mark.parametrize("disabled", [False, True])
+def test_privacy_modes(disabled: bool) -> None:
+    env: dict[str, str] = dict(os.environ)
+    env.pop("DISABLE_ACCESSIFY", None)
+    if disabled:
+        env["DISABLE_ACCESSIFY"] = "1"
+    code: str = (
+        'from barbell import Bar, Plate; Bar(150)._Bar__validate_bar(Plate(10)); Plate(10)._validate_weight(10)'
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+
+    if disabled:
+        assert result.returncode == 0, result.stderr
+    else:
+        assert "InaccessibleDueToItsProtectionLevelException" in result.stderr
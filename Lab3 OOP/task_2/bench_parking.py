@@ -0,0 +1,217 @@
+import asyncio
+import os
+import random
+import string
+import subprocess
+import sys
+import threading
+import time
+import timeit
+import tracemalloc
+
+from parking import (
+    AsyncParking,
+    Car,
+    CompactRegistry,
+    MemoryRegistry,
+    Parking,
+    RegistrationRegistry,
+    ThreadSafeParking,
+)
+
+
+CARS_COUNTS: list[int] = [10, 100, 1_000, 10_000, 100_000]
+
+
+def registration_numbers(count: int) -> list[str]:
+    """Get the given number of distinct registration numbers matching the pattern 'LdddLL'."""
+    letters: str = string.ascii_uppercase
+    return [
+        f"{letters[i // 676_000 % 26]}{i % 1000:03d}{letters[i // 1000 // 26 % 26]}{letters[i // 1000 % 26]}"
+        for i in range(count)
+    ]
+
+
+def bench_lookup(number: int = 1_000) -> None:
+    """Print the mean lookup, departure and arrival time for the parkings with different parked cars count."""
+    print(f"{'cars':>8} | {'lookup, us':>10} | {'leave + park, us':>16}")
+    for cars_count in CARS_COUNTS:
+        cars: list[Car] = [Car("BMW", "B1", number) for number in registration_numbers(cars_count)]
+        parking = Parking(cars_count)
+        for car in cars:
+            parking.register_car_parking(car)
+
+        middle: Car = cars[cars_count // 2]
+
+        def leave_and_park() -> None:
+            parking.register_car_leave(middle.registration_number)
+            parking.register_car_parking(middle)
+
+        lookup: float = timeit.timeit(
+            lambda: parking.get_car_by_registration_number(middle.registration_number), number=number
+        )
+        leave: float = timeit.timeit(leave_and_park, number=number)
+        print(f"{cars_count:>8} | {lookup / number * 1e6:>10.2f} | {leave / number * 1e6:>16.2f}")
+
+        Car.registration_numbers.clear()
+
+
+def bench_slots(slots_count: int = 50_000, number: int = 1_000) -> None:
+    """Print the slot assignment and release time and the rendering time of the half occupied parking."""
+    cars: list[Car] = [Car("BMW", "B1", number) for number in registration_numbers(slots_count)]
+    parking = Parking(slots_count)
+    for car in cars:
+        parking.register_car_parking(car)
+    for car in cars[::2]:
+        parking.register_car_leave(car)
+
+    middle: Car = cars[slots_count // 2 + 1]
+
+    def leave_and_park() -> None:
+        parking.register_car_leave(middle)
+        parking.register_car_parking(middle)
+
+    slot: float = timeit.timeit(leave_and_park, number=number) / number
+    render: float = timeit.timeit(lambda: str(parking), number=10) / 10
+    print(f"{slots_count} slots: leave + park {slot * 1e6:.2f} us, str() {render * 1e3:.2f} ms")
+
+    Car.registration_numbers.clear()
+
+
+def bench_registry(numbers_count: int = 1_000_000, number: int = 100_000) -> None:
+    """
+    Print the memory and the membership check time of the registries with the given number of plates.
+    The memory of the number strings themselves is not counted, they are shared with the input list.
+    """
+    numbers: list[str] = registration_numbers(numbers_count)
+    missing: list[str] = registration_numbers(numbers_count + number)[-number:]
+    probes: list[str] = numbers[:: max(1, numbers_count // number)] + missing
+
+    print(f"{'registry':>16} | {'memory, MiB':>11} | {'check, ns':>9}")
+    for registry_type in (MemoryRegistry, CompactRegistry):
+        tracemalloc.start()
+        registry: RegistrationRegistry = registry_type()
+        for registration_number in numbers:
+            registry.add(registration_number)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        seconds: float = timeit.timeit(lambda: [probe in registry for probe in probes], number=1)
+        print(f"{registry_type.__name__:>16} | {memory / 2**20:>11.1f} | {seconds / len(probes) * 1e9:>9.0f}")
+
+
+def bench_bulk_create(cars_count: int = 100_000) -> None:
+    """Print the throughput of creating the cars one by one and with 'Car.bulk_create'."""
+    rows: list[tuple[str, str, str]] = [("BMW", "B1", number) for number in registration_numbers(cars_count)]
+
+    def one_by_one() -> None:
+        registry = MemoryRegistry()
+        for row in rows:
+            Car(*row, registry=registry)
+
+    by_one: float = timeit.timeit(one_by_one, number=1)
+    by_bulk: float = timeit.timeit(lambda: Car.bulk_create(rows, MemoryRegistry()), number=1)
+    print(f"{'Car()':>16}: {cars_count / by_one:>12.0f} cars/s")
+    print(f"{'Car.bulk_create':>16}: {cars_count / by_bulk:>12.0f} cars/s")
+
+
+def report_gates(name: str, waits: list[float], seconds: float) -> None:
+    """Print the gate throughput and the wait latency percentiles."""
+    waits.sort()
+    p50: float = waits[len(waits) // 2]
+    p99: float = waits[min(len(waits) - 1, len(waits) * 99 // 100)]
+    print(f"{name:>8} | {len(waits) / seconds:>12.0f} | {p50 * 1e3:>8.2f} | {p99 * 1e3:>8.2f}")
+
+
+def bench_gates(
+    slots_count: int = 100, gates_count: int = 200, cars_count: int = 20_000, max_dwell: float = 0.001
+) -> None:
+    """
+    Print the throughput and the wait latency of the gates parking more cars at once than the parking fits.
+    Every gate parks its share of the cars one after another, every car stays up to 'max_dwell' seconds.
+    """
+    rows: list[tuple[str, str, str]] = [("BMW", "B1", number) for number in registration_numbers(cars_count)]
+    cars, _ = Car.bulk_create(rows, MemoryRegistry())
+    dwells: list[float] = [random.uniform(0, max_dwell) for _ in cars]
+
+    print(f"{slots_count} slots, {gates_count} gates, {cars_count} cars")
+    print(f"{'gates':>8} | {'cars/s':>12} | {'p50, ms':>8} | {'p99, ms':>8}")
+
+    async def run_async() -> list[float]:
+        gate = AsyncParking(Parking(slots_count))
+        waits: list[float] = []
+
+        async def run_gate(index: int) -> None:
+            for car, dwell in zip(cars[index::gates_count], dwells[index::gates_count]):
+                start: float = time.perf_counter()
+                await gate.register_car_parking(car)
+                waits.append(time.perf_counter() - start)
+                await asyncio.sleep(dwell)
+                gate.register_car_leave(car)
+
+        await asyncio.gather(*(run_gate(index) for index in range(gates_count)))
+        return waits
+
+    start: float = time.perf_counter()
+    waits: list[float] = asyncio.run(run_async())
+    report_gates("asyncio", waits, time.perf_counter() - start)
+
+    thread_gate = ThreadSafeParking(Parking(slots_count))
+    thread_waits: list[float] = []
+
+    def run_thread_gate(index: int) -> None:
+        for car, dwell in zip(cars[index::gates_count], dwells[index::gates_count]):
+            start: float = time.perf_counter()
+            thread_gate.register_car_parking(car)
+            # list.append is atomic, so the waits need no lock
+            thread_waits.append(time.perf_counter() - start)
+            time.sleep(dwell)
+            thread_gate.register_car_leave(car)
+
+    start = time.perf_counter()
+    threads: list[threading.Thread] = [threading.Thread(target=run_thread_gate, args=(i,)) for i in range(gates_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    report_gates("threads", thread_waits, time.perf_counter() - start)
+
+
+def time_call(stmt: str, setup: str, number: int, privacy_enforced: bool) -> float:
+    """Get the mean statement time in microseconds in a fresh interpreter, as 'time_call' of the task 1 bench."""
+    env: dict[str, str] = dict(os.environ)
+    if privacy_enforced:
+        env.pop("DISABLE_ACCESSIFY", None)
+    else:
+        env["DISABLE_ACCESSIFY"] = "1"
+
+    code: str = f"import timeit; print(timeit.timeit({stmt!r}, {setup!r}, number={number}))"
+    cwd: str = os.path.dirname(os.path.abspath(__file__))
+    output: str = subprocess.run(
+        [sys.executable, "-c", code], env=env, cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout
+    return float(output) / number * 1e6
+
+
+def bench_privacy(number: int = 10_000) -> None:
+    """Print the per-call cost of every validated method with the privacy enforced and disabled."""
+    setup: str = "from parking import Car, Parking"
+    calls: dict[str, str] = {
+        "Car.__validate_registration_number": "Car('BMW', 'B1', 'B111CD'); Car.registration_numbers.clear()",
+        "Parking.__validate_max_car_count": "Parking(10)",
+    }
+
+    print(f"{'method':>36} | {'enforced, us':>12} | {'disabled, us':>12} | {'overhead, us':>12}")
+    for name, stmt in calls.items():
+        enforced: float = time_call(stmt, setup, number, privacy_enforced=True)
+        disabled: float = time_call(stmt, setup, number, privacy_enforced=False)
+        print(f"{name:>36} | {enforced:>12.2f} | {disabled:>12.2f} | {enforced - disabled:>12.2f}")
+
+
+if __name__ == "__main__":
+    bench_lookup()
+    bench_slots()
+    bench_registry()
+    bench_bulk_create()
+    bench_gates()
+    bench_privacy()
@@ -1,6 +1,14 @@
+import asyncio
+import heapq
+import os
 import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
 from functools import singledispatchmethod
-from accessify import private
+from typing import Callable, Iterable
+from accessify import private as accessify_private
 
 # fmt: off
 class RegistrationNumberError(Exception): ...
@@ -9,6 +17,208 @@ class CarDoesNotExists(Exception): ...
 # fmt: on
 
 
+# Same switch as in the barbell of task 1, the tasks are separate directories and share no modules
+PRIVACY_ENFORCED: bool = __debug__ and os.environ.get("DISABLE_ACCESSIFY") is None
+
+
+def private(func: Callable) -> Callable:
+    """Make the method private if the privacy is enforced, or leave it as is without any runtime overhead."""
+    return accessify_private(func) if PRIVACY_ENFORCED else func
+
+
+REGISTRATION_NUMBER_PATTERN: re.Pattern[str] = re.compile(r"[A-Z]{1}\d{3}[A-Z]{2}")
+
+# Number of the registration numbers matching the pattern 'LdddLL'
+REGISTRATION_CODES_COUNT: int = 26 * 1000 * 26 * 26
+
+
+def registration_code(number: str) -> int | None:
+    """
+    Get the index of the registration number among all the numbers matching the pattern 'LdddLL'.
+
+    Parametrs:
+    ---------
+    number : str
+        Registration number of the car.
+
+    Returns:
+    -------
+    int | None
+        Index from 0 to 'REGISTRATION_CODES_COUNT - 1', or None if the number is not exactly 'LdddLL'.
+    """
+    if len(number) != 6 or not number.isascii():
+        return None
+
+    first, digits, second, third = number[0], number[1:4], number[4], number[5]
+    if not (first.isupper() and digits.isdigit() and second.isupper() and third.isupper()):
+        return None
+
+    return ((ord(first) - 65) * 1000 + int(digits)) * 676 + (ord(second) - 65) * 26 + ord(third) - 65
+
+
+class RegistrationRegistry(ABC):
+    """Keeps the registration numbers in use, every number can be registered only once within the registry."""
+
+    @abstractmethod
+    def add(self, number: str) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def release(self, number: str) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def __contains__(self, number: str) -> bool:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError()
+
+
+class MemoryRegistry(RegistrationRegistry):
+    """
+    Keeps the registration numbers in memory, optionally for a limited time.
+
+    Attributes:
+    ----------
+    ttl : float | None
+        Contains the number of seconds after which the registered number is released, None to keep it forever.
+    """
+
+    def __init__(self, ttl: float | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be greater than zero")
+
+        self.__ttl: float | None = ttl
+        self.__clock: Callable[[], float] = clock
+        # Number -> expiration time, the queue keeps the expiration times in the order of registration
+        self.__numbers: dict[str, float | None] = {}
+        self.__expirations: deque[tuple[float, str]] = deque()
+
+    @property
+    def ttl(self) -> float | None:
+        """Get the number of seconds after which the registered number is released."""
+        return self.__ttl
+
+    def add(self, number: str) -> None:
+        """Register the number, or prolong the registration of the registered one."""
+        if self.__ttl is None:
+            self.__numbers[number] = None
+            return
+
+        expires_at: float = self.__clock() + self.__ttl
+        self.__numbers[number] = expires_at
+        self.__expirations.append((expires_at, number))
+
+    def release(self, number: str) -> None:
+        """Release the number, nothing happens if it is not registered."""
+        self.__numbers.pop(number, None)
+
+    def clear(self) -> None:
+        """Release all the numbers."""
+        self.__numbers.clear()
+        self.__expirations.clear()
+
+    def __contains__(self, number: str) -> bool:
+        self.__evict()
+        return number in self.__numbers
+
+    def __len__(self) -> int:
+        self.__evict()
+        return len(self.__numbers)
+
+    def __evict(self) -> None:
+        """Release the numbers with the expired registration."""
+        now: float = self.__clock()
+        while self.__expirations and self.__expirations[0][0] <= now:
+            expires_at, number = self.__expirations.popleft()
+            # The number could be released or registered again after this expiration time was queued
+            if self.__numbers.get(number) == expires_at:
+                del self.__numbers[number]
+
+
+class CompactRegistry(RegistrationRegistry):
+    """
+    Keeps the registration numbers in the bitmap with one bit per every possible 'LdddLL' number (about 2 MiB),
+    so checking tens of millions of historical numbers costs the same as checking a few.
+    Numbers that are not exactly 'LdddLL' are kept in a set, they can't contain the new line.
+
+    Methods:
+    -------
+    def write(path: str) -> None:
+        Write the registry to the file.
+    def read(path: str) -> CompactRegistry:
+        Read the registry from the file.
+    """
+
+    def __init__(self) -> None:
+        self.__bitmap: bytearray = bytearray((REGISTRATION_CODES_COUNT + 7) // 8)
+        self.__others: set[str] = set()
+        self.__codes_count: int = 0
+
+    def add(self, number: str) -> None:
+        """Register the number, raise ValueError if it contains the new line which separates the numbers in the file."""
+        code: int | None = registration_code(number)
+        if code is None:
+            if "\n" in number:
+                raise ValueError("Registration number can't contain the new line")
+            self.__others.add(number)
+        elif not self.__bitmap[code >> 3] & (1 << (code & 7)):
+            self.__bitmap[code >> 3] |= 1 << (code & 7)
+            self.__codes_count += 1
+
+    def release(self, number: str) -> None:
+        """Release the number, nothing happens if it is not registered."""
+        code: int | None = registration_code(number)
+        if code is None:
+            self.__others.discard(number)
+        elif self.__bitmap[code >> 3] & (1 << (code & 7)):
+            self.__bitmap[code >> 3] &= ~(1 << (code & 7))
+            self.__codes_count -= 1
+
+    def clear(self) -> None:
+        """Release all the numbers."""
+        self.__bitmap = bytearray(len(self.__bitmap))
+        self.__others.clear()
+        self.__codes_count = 0
+
+    def write(self, path: str) -> None:
+        """Write the bitmap followed by the other numbers each ended by the new line, so the empty one is kept too."""
+        with open(path, "wb") as file:
+            file.write(self.__bitmap)
+            file.write("".join(f"{number}\n" for number in self.__others).encode("utf-8"))
+
+    @classmethod
+    def read(cls, path: str) -> "CompactRegistry":
+        """Read the registry written by 'write' from the file."""
+        registry = cls()
+        with open(path, "rb") as file:
+            file.readinto(registry.__bitmap)
+            others: str = file.read().decode("utf-8")
+
+        # Files written before the numbers were ended by the new line have no new line after the last one
+        numbers: list[str] = others.split("\n") if others else []
+        if others.endswith("\n"):
+            numbers.pop()
+        registry.__others = set(numbers)
+        registry.__codes_count = int.from_bytes(registry.__bitmap, "little").bit_count()
+        return registry
+
+    def __contains__(self, number: str) -> bool:
+        code: int | None = registration_code(number)
+        if code is None:
+            return number in self.__others
+        return bool(self.__bitmap[code >> 3] & (1 << (code & 7)))
+
+    def __len__(self) -> int:
+        return self.__codes_count + len(self.__others)
+
+
 class Car:
     """
     Represents a car.
@@ -21,15 +231,28 @@ class Car:
         Contains the model of the car.
     registration_number : str
         Contains the registration_number of the car.
+    registry : RegistrationRegistry
+        Contains the registry where the registration number is unique.
+        Default: the registry shared by all the cars, 'Car.registration_numbers'.
+
+    Methods:
+    -------
+    def bulk_create(
+        rows: Iterable[tuple[str, str, str]], registry: RegistrationRegistry | None = None
+    ) -> tuple[list[Car], dict[int, RegistrationNumberError]]:
+        Create the cars from the rows reporting all the incorrect ones.
     """
 
-    registration_numbers: set[str] = set()
+    registration_numbers: RegistrationRegistry = MemoryRegistry()
 
-    def __init__(self, manufacturer: str, model: str, registration_number: str) -> None:
+    def __init__(
+        self, manufacturer: str, model: str, registration_number: str, registry: RegistrationRegistry | None = None
+    ) -> None:
         self.__manufacturer: str = manufacturer
         self.__model: str = model
+        self.__registry: RegistrationRegistry = self.registration_numbers if registry is None else registry
         self.__registration_number: str = self.__validate_registration_number(registration_number)
-        self.registration_numbers.add(registration_number)
+        self.__registry.add(registration_number)
 
     @property
     def manufacturer(self) -> str:
@@ -46,6 +269,65 @@ class Car:
         """Get the registration_number of the car."""
         return self.__registration_number
 
+    @property
+    def registry(self) -> RegistrationRegistry:
+        """Get the registry where the registration number is unique."""
+        return self.__registry
+
+    @classmethod
+    def bulk_create(
+        cls, rows: Iterable[tuple[str, str, str]], registry: RegistrationRegistry | None = None
+    ) -> tuple[list["Car"], dict[int, RegistrationNumberError]]:
+        """
+        Create the cars from the rows validating all the registration numbers in one pass.
+
+        Rows with incorrect numbers are skipped and reported together instead of raising on the first one,
+        the cars for the correct rows are created and registered.
+
+        Parametrs:
+        ---------
+        rows : Iterable[tuple[str, str, str]]
+            Manufacturer, model and registration number of every car.
+        registry : RegistrationRegistry | None
+            Registry where the registration numbers must be unique.
+            Default: the registry shared by all the cars, 'Car.registration_numbers'.
+
+        Returns:
+        -------
+        tuple[list[Car], dict[int, RegistrationNumberError]]
+            Created cars and the errors by the indexes of the incorrect rows.
+        """
+        if registry is None:
+            registry = cls.registration_numbers
+
+        match: Callable[[str], re.Match[str] | None] = REGISTRATION_NUMBER_PATTERN.match
+        cars: list[Car] = []
+        errors: dict[int, RegistrationNumberError] = {}
+        batch_numbers: set[str] = set()
+
+        for index, (manufacturer, model, number) in enumerate(rows):
+            if number in batch_numbers or number in registry:
+                errors[index] = RegistrationNumberError("Registration number must be unique")
+                continue
+            if not match(number):
+                errors[index] = RegistrationNumberError("Registration number pattern must be 'LdddLL'")
+                continue
+
+            batch_numbers.add(number)
+
+            # The number is already validated, so the car is built without the validating constructor
+            car: Car = cls.__new__(cls)
+            car.__manufacturer = manufacturer
+            car.__model = model
+            car.__registry = registry
+            car.__registration_number = number
+            cars.append(car)
+
+        for number in batch_numbers:
+            registry.add(number)
+
+        return cars, errors
+
     def __str__(self) -> str:
         """Get the string representation of the car."""
         return f"{self.__manufacturer} {self.__model} n. {self.__registration_number}"
@@ -70,11 +352,10 @@ class Car:
         RegistrationNumberError
             If registration_number of the car is not unique or does not match the pattern 'LdddLL'.
         """
-        if number in self.registration_numbers:
+        if number in self.__registry:
             raise RegistrationNumberError("Registration number must be unique")
 
-        pattern: re.Pattern[str] = re.compile(r"[A-Z]{1}\d{3}[A-Z]{2}")
-        if not pattern.match(number):
+        if not REGISTRATION_NUMBER_PATTERN.match(number):
             raise RegistrationNumberError("Registration number pattern must be 'LdddLL'")
 
         return number
@@ -89,14 +370,22 @@ class Parking:
     max_cars_count : int
         Contains the maximum cars count that can fit in the parking.
 
+    Every car takes the free slot with the lowest number and keeps it until it leaves.
+
     Methods:
     -------
     def get_parked_cars_count() -> int:
         Return the total weight of the plates on the barbell.
     def get_car_by_registration_number(number: str) -> Car | None:
         Return the car by registration number.
-    def register_car_parking(car: Car) -> None:
-        Register the parked car.
+    def get_slot_by_registration_number(number: str) -> int:
+        Return the slot of the car by registration number.
+    def get_car_by_slot(slot: int) -> Car | None:
+        Return the car parked in the slot.
+    def is_parked(number: str) -> bool:
+        Return True if the car with the registration number is parked.
+    def register_car_parking(car: Car) -> int:
+        Register the parked car and return its slot.
     def register_car_pleave(arg: Car | str) -> None:
         Register the parked car leave.
     def print_parking() -> None:
@@ -105,7 +394,13 @@ class Parking:
 
     def __init__(self, max_car_count: int) -> None:
         self.__max_cars_count: int = self.__validate_max_car_count(max_car_count)
-        self.__parked_cars: list[Car] = []
+        self.__car_slots: dict[str, int] = {}
+        self.__slot_cars: dict[int, Car] = {}
+        # Bit 'slot' is set if the slot is occupied
+        self.__occupancy: bytearray = bytearray((self.__max_cars_count + 7) // 8)
+        # Slots below '__next_slot' were taken at least once, the free ones among them are in the '__free_slots' heap
+        self.__free_slots: list[int] = []
+        self.__next_slot: int = 0
 
     @property
     def max_cars_count(self) -> int:
@@ -114,7 +409,7 @@ class Parking:
 
     def get_parked_cars_count(self) -> int:
         """Get the number of cars parked"""
-        return len(self.__parked_cars)
+        return len(self.__car_slots)
 
     def get_car_by_registration_number(self, number: str) -> Car | None:
         """
@@ -130,29 +425,89 @@ class Parking:
         CarDoesNotExists
             If car with the given registration number is not parked in the parking.
         """
-        for car in self.__parked_cars:
-            if car.registration_number == number:
-                return car
-        raise CarDoesNotExists("Car with the given registration number is not parked in the parking")
+        return self.__slot_cars[self.get_slot_by_registration_number(number)]
 
-    def register_car_parking(self, car: Car) -> None:
+    def get_slot_by_registration_number(self, number: str) -> int:
         """
-        Register the parked car.
+        Get the slot of the car by registration number.
+
+        Parametrs:
+        ---------
+        number : str
+            The registration number of the car.
+
+        Raises:
+        ------
+        CarDoesNotExists
+            If car with the given registration number is not parked in the parking.
+        """
+        slot: int | None = self.__car_slots.get(number)
+        if slot is None:
+            raise CarDoesNotExists("Car with the given registration number is not parked in the parking")
+        return slot
+
+    def is_parked(self, number: str) -> bool:
+        """Return True if the car with the given registration number is parked in the parking, or False."""
+        return number in self.__car_slots
+
+    def get_car_by_slot(self, slot: int) -> Car | None:
+        """
+        Get the car parked in the slot.
+
+        Parametrs:
+        ---------
+        slot : int
+            The slot number from 0 to 'max_cars_count - 1'.
+
+        Raises:
+        ------
+        IndexError
+            If there is no slot with the given number.
+        """
+        if slot not in range(self.__max_cars_count):
+            raise IndexError(f"Slot '{slot}' is out of range")
+        return self.__slot_cars.get(slot)
+
+    def register_car_parking(self, car: Car) -> int:
+        """
+        Register the parked car in the free slot with the lowest number.
 
         Parametrs:
         ---------
         car : Car
             Car that parked in the parking.
 
+        Returns:
+        -------
+        int
+            The slot taken by the car, or the slot it already takes.
+
         Raises:
         ------
         MaxCarsCountExcessError
             If there is no parking space for the car.
+        RegistrationNumberError
+            If the other car with the same registration number is parked.
         """
-        if len(self.__parked_cars) + 1 > self.__max_cars_count:
+        parked_slot: int | None = self.__car_slots.get(car.registration_number)
+        if parked_slot is not None:
+            if self.__slot_cars[parked_slot] is car:
+                return parked_slot
+            raise RegistrationNumberError(f"Other car with number {car.registration_number} is already parked")
+
+        if len(self.__car_slots) + 1 > self.__max_cars_count:
             raise MaxCarsCountExcessError("Number of parking spaces exceeded")
 
-        self.__parked_cars.append(car)
+        if self.__free_slots:
+            slot: int = heapq.heappop(self.__free_slots)
+        else:
+            slot = self.__next_slot
+            self.__next_slot += 1
+
+        self.__car_slots[car.registration_number] = slot
+        self.__slot_cars[slot] = car
+        self.__occupancy[slot >> 3] |= 1 << (slot & 7)
+        return slot
 
     @singledispatchmethod
     def register_car_leave(self, arg) -> None:
@@ -175,53 +530,59 @@ class Parking:
 
     @register_car_leave.register
     def _(self, car: Car) -> None:
-        if not self.__parked_cars:
+        if not self.__car_slots:
             print("Parking is empty")
             return
 
-        if car not in self.__parked_cars:
+        slot: int | None = self.__car_slots.get(car.registration_number)
+        if slot is None or self.__slot_cars[slot] is not car:
             raise CarDoesNotExists("This car is not parked in the parking")
 
-        self.__parked_cars.remove(car)
+        self.__release_slot(car.registration_number)
 
     @register_car_leave.register
     def _(self, registration_number: str) -> None:
-        if not self.__parked_cars:
+        if not self.__car_slots:
             print("Parking is empty")
             return
 
-        car: Car = self.get_car_by_registration_number(registration_number)
-        self.__parked_cars.remove(car)
+        self.get_slot_by_registration_number(registration_number)
+        self.__release_slot(registration_number)
 
     def print_parking(self) -> None:
         """Print the string representation of the parking."""
-        if not self.__parked_cars:
-            print("Parking is empty")
-            return
-
-        print("\nParking")
-        for _, car in enumerate(self.__parked_cars):
-            print(f"| {car.registration_number} |")
-
-        for _ in range(self.__max_cars_count - len(self.__parked_cars)):
-            print("| ______ |")
-        print()
+        print(self)
 
     def __str__(self) -> str:
-        """Get the string representation of the parking."""
-        if not self.__parked_cars:
+        """Get the string representation of the parking, one line per slot."""
+        if not self.__car_slots:
             return "Parking is empty"
 
         result = ["\nParking"]
 
-        for car in self.__parked_cars:
-            result.append(f"\n| {car.registration_number} |")
+        # Whole bytes of the free slots are rendered at once
+        for index, byte in enumerate(self.__occupancy):
+            first: int = index << 3
+            last: int = min(first + 8, self.__max_cars_count)
+            if not byte:
+                result.append("\n| ______ |" * (last - first))
+                continue
 
-        for _ in range(self.__max_cars_count - len(self.__parked_cars)):
-            result.append("\n| ______ |")
+            for slot in range(first, last):
+                if byte & (1 << (slot & 7)):
+                    result.append(f"\n| {self.__slot_cars[slot].registration_number} |")
+                else:
+                    result.append("\n| ______ |")
 
         return "".join(result) + "\n"
 
+    def __release_slot(self, registration_number: str) -> None:
+        """Free the slot of the parked car with the given registration number."""
+        slot: int = self.__car_slots.pop(registration_number)
+        del self.__slot_cars[slot]
+        self.__occupancy[slot >> 3] &= ~(1 << (slot & 7))
+        heapq.heappush(self.__free_slots, slot)
+
     @private
     def __validate_max_car_count(self, max_car_count: int) -> int:
         """
@@ -245,3 +606,226 @@ class Parking:
         if max_car_count <= 0:
             raise TypeError("Maximum cars count must be greater than zero")
         return max_car_count
+
+
+class ThreadSafeParking:
+    """
+    Represents the parking shared by the gates running in different threads.
+
+    Only the registration in the wrapped parking is done under the lock. Arrivals that find the parking full wait
+    in the FIFO queue, every leaving car hands its slot over to the first waiting arrival.
+
+    Attributes:
+    ----------
+    parking : Parking
+        Contains the wrapped parking.
+
+    Methods:
+    -------
+    def register_car_parking(car: Car, timeout: float | None = None) -> int:
+        Wait for the free slot and register the parked car.
+    def register_car_leave(arg: Car | str) -> None:
+        Register the parked car leave.
+    """
+
+    def __init__(self, parking: Parking) -> None:
+        self.__parking: Parking = parking
+        self.__lock: threading.Lock = threading.Lock()
+        self.__waiters: deque[threading.Event] = deque()
+        # Slots freed for the waiters that have not registered yet
+        self.__reserved: int = 0
+
+    @property
+    def parking(self) -> Parking:
+        """Get the wrapped parking."""
+        return self.__parking
+
+    def register_car_parking(self, car: Car, timeout: float | None = None) -> int:
+        """
+        Register the parked car waiting for the free slot if the parking is full.
+
+        Parametrs:
+        ---------
+        car : Car
+            Car that parked in the parking.
+        timeout : float | None
+            Maximum number of seconds to wait for the free slot.
+            Default: None, wait as long as needed.
+
+        Returns:
+        -------
+        int
+            The slot taken by the car.
+
+        Raises:
+        ------
+        MaxCarsCountExcessError
+            If there is no parking space for the car after the timeout.
+        """
+        with self.__lock:
+            # The car with the parked number takes no slot, so it doesn't wait for one
+            if self.__parking.is_parked(car.registration_number) or (
+                not self.__waiters and self.__free_slots_count() > self.__reserved
+            ):
+                return self.__parking.register_car_parking(car)
+
+            waiter = threading.Event()
+            self.__waiters.append(waiter)
+
+        if not waiter.wait(timeout):
+            with self.__lock:
+                # The slot could be handed over right after the timeout
+                if not waiter.is_set():
+                    self.__waiters.remove(waiter)
+                    raise MaxCarsCountExcessError("Number of parking spaces exceeded")
+
+        with self.__lock:
+            self.__reserved -= 1
+            try:
+                return self.__parking.register_car_parking(car)
+            finally:
+                # If the car has taken no slot, as its number was parked meanwhile, the slot goes to the next waiter
+                self.__hand_over()
+
+    def register_car_leave(self, arg: Car | str) -> None:
+        """
+        Register the parked car leave and hand its slot over to the first waiting arrival.
+
+        Parametrs:
+        ---------
+        arg : Car | str
+            Car that leaved the parking.
+
+        Raises:
+        ------
+        TypeError
+            If arg is not Car or str.
+        CarDoesNotExists
+            If car is not parked in the parking.
+        """
+        with self.__lock:
+            self.__parking.register_car_leave(arg)
+            self.__hand_over()
+
+    def __hand_over(self) -> None:
+        """Reserve the free slot for the first waiting arrival and wake it up, called under the lock."""
+        if self.__waiters and self.__free_slots_count() > self.__reserved:
+            self.__reserved += 1
+            self.__waiters.popleft().set()
+
+    def __free_slots_count(self) -> int:
+        """Get the number of the free slots in the wrapped parking."""
+        return self.__parking.max_cars_count - self.__parking.get_parked_cars_count()
+
+
+class AsyncParking:
+    """
+    Represents the parking shared by the gates running as asyncio tasks in one event loop.
+
+    Registration in the wrapped parking never awaits, so it needs no lock. Arrivals that find the parking full wait
+    in the FIFO queue, every leaving car hands its slot over to the first waiting arrival.
+
+    Attributes:
+    ----------
+    parking : Parking
+        Contains the wrapped parking.
+
+    Methods:
+    -------
+    async def register_car_parking(car: Car, timeout: float | None = None) -> int:
+        Wait for the free slot and register the parked car.
+    def register_car_leave(arg: Car | str) -> None:
+        Register the parked car leave.
+    """
+
+    def __init__(self, parking: Parking) -> None:
+        self.__parking: Parking = parking
+        self.__waiters: deque[asyncio.Future[None]] = deque()
+        # Slots freed for the waiters that have not registered yet
+        self.__reserved: int = 0
+
+    @property
+    def parking(self) -> Parking:
+        """Get the wrapped parking."""
+        return self.__parking
+
+    async def register_car_parking(self, car: Car, timeout: float | None = None) -> int:
+        """
+        Register the parked car waiting for the free slot if the parking is full.
+
+        Parametrs:
+        ---------
+        car : Car
+            Car that parked in the parking.
+        timeout : float | None
+            Maximum number of seconds to wait for the free slot.
+            Default: None, wait as long as needed.
+
+        Returns:
+        -------
+        int
+            The slot taken by the car.
+
+        Raises:
+        ------
+        MaxCarsCountExcessError
+            If there is no parking space for the car after the timeout.
+        """
+        # The car with the parked number takes no slot, so it doesn't wait for one
+        if self.__parking.is_parked(car.registration_number) or (
+            not self.__waiters and self.__free_slots_count() > self.__reserved
+        ):
+            return self.__parking.register_car_parking(car)
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.__waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as error:
+            if waiter.done():
+                # The slot was handed over but the arrival gave up, so it goes to the next waiter
+                self.__reserved -= 1
+                self.__hand_over()
+            else:
+                waiter.cancel()
+                self.__waiters.remove(waiter)
+
+            if isinstance(error, asyncio.TimeoutError):
+                raise MaxCarsCountExcessError("Number of parking spaces exceeded") from error
+            raise
+
+        self.__reserved -= 1
+        try:
+            return self.__parking.register_car_parking(car)
+        finally:
+            # If the car has taken no slot, as its number was parked meanwhile, the slot goes to the next waiter
+            self.__hand_over()
+
+    def register_car_leave(self, arg: Car | str) -> None:
+        """
+        Register the parked car leave and hand its slot over to the first waiting arrival.
+
+        Parametrs:
+        ---------
+        arg : Car | str
+            Car that leaved the parking.
+
+        Raises:
+        ------
+        TypeError
+            If arg is not Car or str.
+        CarDoesNotExists
+            If car is not parked in the parking.
+        """
+        self.__parking.register_car_leave(arg)
+        self.__hand_over()
+
+    def __hand_over(self) -> None:
+        """Reserve the free slot for the first waiting arrival and wake it up."""
+        if self.__waiters and self.__free_slots_count() > self.__reserved:
+            self.__reserved += 1
+            self.__waiters.popleft().set_result(None)
+
+    def __free_slots_count(self) -> int:
+        """Get the number of the free slots in the wrapped parking."""
+        return self.__parking.max_cars_count - self.__parking.get_parked_cars_count()
@@ -1,5 +1,26 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+
 import pytest
-from parking import CarDoesNotExists, MaxCarsCountExcessError, Parking, Car, RegistrationNumberError
+from accessify.errors import InaccessibleDueToItsProtectionLevelException
+
+import parking
+from parking import (
+    AsyncParking,
+    CarDoesNotExists,
+    CompactRegistry,
+    MaxCarsCountExcessError,
+    MemoryRegistry,
+    Parking,
+    Car,
+    RegistrationNumberError,
+    ThreadSafeParking,
+    private,
+    registration_code,
+)
 
 
 # Car tests
@@ -33,6 +54,123 @@ def test_car_validate_registration_number() -> None:
         Car("Honda", "A4", "a123aaa")
 
 
+@pytest.mark.car
+def test_car_registry_scope() -> None:
+    lot_a = MemoryRegistry()
+    lot_b = MemoryRegistry()
+    car = Car("Honda", "A5", "A555BC", lot_a)
+    assert car.registry is lot_a
+    assert "A555BC" in lot_a
+    assert "A555BC" not in Car.registration_numbers
+
+    Car("Honda", "A5", "A555BC", lot_b)
+    with pytest.raises(RegistrationNumberError):
+        Car("Honda", "A5", "A555BC", lot_a)
+
+    lot_a.release("A555BC")
+    lot_a.release("A555BC")
+    Car("Honda", "A5", "A555BC", lot_a)
+    assert len(lot_a) == 1
+
+
+@pytest.mark.car
+def test_car_bulk_create() -> None:
+    registry = MemoryRegistry()
+    Car("Honda", "A6", "A666BC", registry)
+    rows = [
+        ("Honda", "A6", "A667BC"),
+        ("Honda", "A6", "A666BC"),
+        ("Honda", "A6", "a668bc"),
+        ("Honda", "A6", "A667BC"),
+        ("BMW", "B6", "B666CD"),
+    ]
+    cars, errors = Car.bulk_create(rows, registry)
+
+    assert [str(car) for car in cars] == ["Honda A6 n. A667BC", "BMW B6 n. B666CD"]
+    assert all(car.registry is registry for car in cars)
+    assert sorted(errors) == [1, 2, 3]
+    assert all(isinstance(error, RegistrationNumberError) for error in errors.values())
+    assert "B666CD" in registry
+    assert "a668bc" not in registry
+
+    with pytest.raises(RegistrationNumberError):
+        Car("BMW", "B6", "B666CD", registry)
+
+
+# Registry tests
+@pytest.mark.registry
+def test_memory_registry_ttl() -> None:
+    now = [0.0]
+    registry = MemoryRegistry(ttl=10, clock=lambda: now[0])
+    registry.add("A111AA")
+    now[0] = 5
+    registry.add("B111AA")
+    assert len(registry) == 2
+
+    now[0] = 10
+    assert "A111AA" not in registry
+    assert "B111AA" in registry
+
+    registry.add("B111AA")
+    now[0] = 15
+    assert "B111AA" in registry
+    now[0] = 20
+    assert len(registry) == 0
+
+    with pytest.raises(ValueError):
+        MemoryRegistry(ttl=0)
+
+
+@pytest.mark.registry
+def test_registration_code() -> None:
+    assert registration_code("A000AA") == 0
+    assert registration_code("Z999ZZ") == 26 * 1000 * 26 * 26 - 1
+    assert registration_code("A111BCD") is None
+    assert registration_code("a111bc") is None
+    assert registration_code("A1١1BC") is None
+
+
+@pytest.mark.registry
+def test_compact_registry(tmp_path) -> None:
+    registry = CompactRegistry()
+    registry.add("A111BC")
+    registry.add("A111BC")
+    registry.add("A111BCD")
+    assert "A111BC" in registry
+    assert "A111BCD" in registry
+    assert "A112BC" not in registry
+    assert len(registry) == 2
+
+    registry.write(str(tmp_path / "registry.bin"))
+    restored = CompactRegistry.read(str(tmp_path / "registry.bin"))
+    assert "A111BC" in restored
+    assert "A111BCD" in restored
+    assert len(restored) == 2
+
+    restored.release("A111BC")
+    restored.release("A111BCD")
+    assert "A111BC" not in restored
+    assert len(restored) == 0
+
+    registry.clear()
+    assert "A111BC" not in registry
+    assert len(registry) == 0
+
+
+@pytest.mark.registry
+def test_compact_registry_other_numbers(tmp_path) -> None:
+    registry = CompactRegistry()
+    for number in ("", "A111BCD", " "):
+        registry.add(number)
+    with pytest.raises(ValueError):
+        registry.add("A1\n11BC")
+
+    registry.write(str(tmp_path / "registry.bin"))
+    restored = CompactRegistry.read(str(tmp_path / "registry.bin"))
+    assert "" in restored and " " in restored and "A111BCD" in restored
+    assert len(restored) == 3
+
+
 # Parking tests
 @pytest.mark.parking
 def test_parking_init() -> None:
@@ -107,3 +245,172 @@ def test_parking_to_str() -> None:
     p1.register_car_parking(Car("BMW", "B1", "B888CD"))
     p1.register_car_parking(Car("BMW", "B1", "B999CD"))
     assert str(p1) == "\nParking\n| B888CD |\n| B999CD |\n| ______ |\n| ______ |\n| ______ |\n"
+
+
+@pytest.mark.parking
+def test_parking_keeps_slots() -> None:
+    p = Parking(4)
+    cars = [Car("BMW", "B1", f"C{i}00CD") for i in range(1, 4)]
+    assert [p.register_car_parking(car) for car in cars] == [0, 1, 2]
+
+    p.register_car_leave("C200CD")
+    assert str(p) == "\nParking\n| C100CD |\n| ______ |\n| C300CD |\n| ______ |\n"
+    assert p.get_car_by_registration_number("C300CD") is cars[2]
+    assert p.get_slot_by_registration_number("C300CD") == 2
+    assert p.get_car_by_slot(1) is None
+
+    assert p.register_car_parking(cars[1]) == 1
+    assert p.register_car_parking(cars[1]) == 1
+    assert p.get_car_by_slot(1) is cars[1]
+    assert str(p) == "\nParking\n| C100CD |\n| C200CD |\n| C300CD |\n| ______ |\n"
+
+    with pytest.raises(IndexError):
+        p.get_car_by_slot(4)
+    with pytest.raises(CarDoesNotExists):
+        p.get_slot_by_registration_number("C400CD")
+
+
+@pytest.mark.parking
+def test_parking_rejects_other_car_with_same_number() -> None:
+    p = Parking(4)
+    car = Car("Honda", "A5", "A556BC", MemoryRegistry())
+    other = Car("Honda", "A5", "A556BC", MemoryRegistry())
+    assert p.register_car_parking(car) == 0
+
+    with pytest.raises(RegistrationNumberError):
+        p.register_car_parking(other)
+    assert p.get_parked_cars_count() == 1
+    assert p.get_car_by_slot(0) is car
+
+
+@pytest.mark.parking
+def test_parking_to_str_large() -> None:
+    p = Parking(20)
+    cars = [Car("BMW", "B1", f"D{i:03d}CD") for i in range(20)]
+    for car in cars:
+        p.register_car_parking(car)
+    for car in cars[:16]:
+        p.register_car_leave(car)
+
+    assert str(p) == "\nParking" + "\n| ______ |" * 16 + "".join(f"\n| D{i:03d}CD |" for i in range(16, 20)) + "\n"
+
+
+@pytest.mark.parking
+def test_thread_safe_parking_waits_for_slot() -> None:
+    registry = MemoryRegistry()
+    gate = ThreadSafeParking(Parking(1))
+    first = Car("BMW", "B1", "E100CD", registry)
+    second = Car("BMW", "B1", "E200CD", registry)
+    assert gate.register_car_parking(first) == 0
+
+    with pytest.raises(MaxCarsCountExcessError):
+        gate.register_car_parking(second, timeout=0.01)
+
+    slots: list[int] = []
+    arrival = threading.Thread(target=lambda: slots.append(gate.register_car_parking(second, timeout=5)))
+    arrival.start()
+    gate.register_car_leave(first)
+    arrival.join()
+
+    assert slots == [0]
+    assert gate.parking.get_car_by_slot(0) is second
+    # The parked car doesn't wait for the slot of the full parking
+    assert gate.register_car_parking(second, timeout=0.01) == 0
+
+
+@pytest.mark.parking
+def test_async_parking_passes_unused_slot() -> None:
+    registry = MemoryRegistry()
+    first, second, third, fourth = [Car("BMW", "B1", f"G{i}00CD", registry) for i in range(1, 5)]
+
+    async def run() -> list[int]:
+        gate = AsyncParking(Parking(2))
+        await gate.register_car_parking(first)
+        await gate.register_car_parking(second)
+
+        # The second wait of the same car takes no slot, so its reserved slot goes to the next waiter
+        arrivals = [asyncio.create_task(gate.register_car_parking(car)) for car in (third, third, fourth)]
+        await asyncio.sleep(0)
+        gate.register_car_leave(first)
+        gate.register_car_leave(second)
+        return await asyncio.wait_for(asyncio.gather(*arrivals), 1)
+
+    assert asyncio.run(run()) == [0, 0, 1]
+
+
+@pytest.mark.parking
+def test_async_parking_fair_queue() -> None:
+    registry = MemoryRegistry()
+    cars = [Car("BMW", "B1", f"F{i}00CD", registry) for i in range(1, 5)]
+
+    async def run() -> list[str]:
+        gate = AsyncParking(Parking(1))
+        await gate.register_car_parking(cars[0])
+
+        with pytest.raises(MaxCarsCountExcessError):
+            await gate.register_car_parking(cars[1], timeout=0.01)
+
+        order: list[str] = []
+
+        async def arrive(car: Car) -> None:
+            await gate.register_car_parking(car)
+            order.append(car.registration_number)
+
+        arrivals = [asyncio.create_task(arrive(car)) for car in cars[1:]]
+        await asyncio.sleep(0)
+        for parked, car in enumerate(cars[:3], start=1):
+            gate.register_car_leave(car)
+            while len(order) < parked:
+                await asyncio.sleep(0)
+        await asyncio.gather(*arrivals)
+        return order
+
+    assert asyncio.run(run()) == ["F200CD", "F300CD", "F400CD"]
+
+
+# Privacy tests
+@pytest.mark.car
+@pytest.mark.parking
+@pytest.mark.skipif(not parking.PRIVACY_ENFORCED, reason="privacy is not enforced")
+def test_privacy_enforced() -> None:
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        Car("BMW", "B1", "B101CD")._Car__validate_registration_number("B102CD")
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        Parking(10)._Parking__validate_max_car_count(10)
+
+
+@pytest.mark.car
+@pytest.mark.parking
+def test_privacy_not_enforced(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parking, "PRIVACY_ENFORCED", False)
+
+    def method(self) -> None: ...
+
+    assert private(method) is method
+
+
+@pytest.mark.car
+@pytest.mark.parking
+@pytest.mark.parametrize("disabled", [False, True])
+def test_privacy_modes(disabled: bool) -> None:
+    env: dict[str, str] = dict(os.environ)
+    env.pop("DISABLE_ACCESSIFY", None)
+    if disabled:
+        env["DISABLE_ACCESSIFY"] = "1"
+    code: str = (
+        "from parking import Car, Parking; "
+        "Car('BMW', 'B1', 'B101CD')._Car__validate_registration_number('B102CD'); "
+        "Parking(10)._Parking__validate_max_car_count(10)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+
+    if disabled:
+        assert result.returncode == 0, result.stderr
+    else:
+        assert "InaccessibleDueToItsProtectionLevelException" in result.stderr
@@ -0,0 +1,215 @@
+# Task 2 bench_my_queue.py
+import threading
+import time
+import timeit
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from queue import Queue
+from typing import Callable, Generic, Optional, TypeVar
+
+from my_queue import BlockingQueue, DelayQueue, MyQueue, PriorityQueue, SpscQueue
+
+
+T = TypeVar("T")
+
+ITEMS_COUNT: int = 1_000_000
+BATCH_SIZE: int = 1_000
+TRANSFERRED_COUNT: int = 200_000
+PRODUCER_COUNTS: list[int] = [1, 2, 4, 8, 16]
+MAXSIZE: int = 1_000
+OPERATIONS_COUNT: int = 100_000
+QUEUED_COUNTS: list[int] = [100, 1_000, 10_000, 100_000]
+
+
+@dataclass
+class Node(Generic[T]):
+    value: T
+    next: Optional["Node[T]"]
+    prev: Optional["Node[T]"]
+
+
+class LinkedQueue(Generic[T]):
+    """The queue as it was before the ring buffer: one 'Node' per item."""
+
+    def __init__(self) -> None:
+        self.__tail: Optional[Node[T]] = None
+        self.__head: Optional[Node[T]] = None
+        self.__size: int = 0
+
+    def push(self, item: T) -> None:
+        if self.__head is None and self.__tail is None:
+            self.__head = self.__tail = Node[T](item, None, None)
+            self.__head.prev = self.__tail
+            self.__tail.next = self.__head
+        elif self.__head is self.__tail:
+            self.__head.next = None
+            self.__tail = Node[T](item, self.__head, None)
+            self.__head.prev = self.__tail
+        else:
+            node = Node[T](item, self.__tail, None)
+            self.__tail = node
+            self.__tail.next.prev = self.__tail
+        self.__size += 1
+
+    def get(self) -> T:
+        if self.__head is self.__tail:
+            node = self.__head
+            self.__head = self.__tail = None
+            self.__size -= 1
+            return node.value
+        node = self.__head
+        self.__head = self.__head.prev
+        self.__head.next = None
+        self.__size -= 1
+        return node.value
+
+
+def push_get_one_by_one(queue_type: Callable, push: str, get: str) -> Callable[[], None]:
+    """Get the function pushing and then getting all the items one by one."""
+
+    def run() -> None:
+        queue = queue_type()
+        push_item = getattr(queue, push)
+        get_item = getattr(queue, get)
+        for i in range(ITEMS_COUNT):
+            push_item(i)
+        for _ in range(ITEMS_COUNT):
+            get_item()
+
+    return run
+
+
+def push_get_batches() -> None:
+    """Push and then get all the items by batches."""
+    queue: MyQueue[int] = MyQueue()
+    for start in range(0, ITEMS_COUNT, BATCH_SIZE):
+        queue.push_many(range(start, start + BATCH_SIZE))
+    for _ in range(ITEMS_COUNT // BATCH_SIZE):
+        queue.get_many(BATCH_SIZE)
+
+
+def measure_memory(queue_type: Callable, push: str) -> float:
+    """Get the number of bytes per queued item, the items themselves are not counted."""
+    values: list[int] = list(range(ITEMS_COUNT))
+    tracemalloc.start()
+    queue = queue_type()
+    push_item = getattr(queue, push)
+    for value in values:
+        push_item(value)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / ITEMS_COUNT
+
+
+def bench_queues() -> None:
+    """Print the push + get throughput and the per item memory of the queues."""
+    cases: dict[str, tuple[Callable[[], None], float | None]] = {
+        "linked": (push_get_one_by_one(LinkedQueue, "push", "get"), measure_memory(LinkedQueue, "push")),
+        "ring": (push_get_one_by_one(MyQueue, "push", "get"), measure_memory(MyQueue, "push")),
+        "ring batches": (push_get_batches, None),
+        "deque": (push_get_one_by_one(deque, "append", "popleft"), measure_memory(deque, "append")),
+    }
+
+    print(f"{ITEMS_COUNT} items")
+    print(f"{'queue':>12} | {'items/s':>12} | {'bytes/item':>10}")
+    for name, (run, memory) in cases.items():
+        seconds: float = timeit.timeit(run, number=1)
+        memory_text: str = "-" if memory is None else f"{memory:.1f}"
+        print(f"{name:>12} | {ITEMS_COUNT / seconds:>12.0f} | {memory_text:>10}")
+
+
+def bench_modes() -> None:
+    """Print the mean push + get cost of the FIFO, priority and delay queues holding 1M items."""
+    fifo: MyQueue[int] = MyQueue(range(ITEMS_COUNT))
+    priority: PriorityQueue[int] = PriorityQueue((i % 1_000, i) for i in range(ITEMS_COUNT))
+    delay: DelayQueue[int] = DelayQueue(clock=lambda: 0.0)
+    for i in range(ITEMS_COUNT):
+        delay.push(i, at=-(i % 1_000))
+
+    cases: dict[str, Callable[[int], None]] = {
+        "fifo": lambda i: (fifo.push(i), fifo.get()),
+        "priority": lambda i: (priority.push(i, i % 1_000), priority.get()),
+        "delay": lambda i: (delay.push(i, at=-(i % 1_000)), delay.get()),
+    }
+
+    print(f"{ITEMS_COUNT} queued items")
+    print(f"{'queue':>12} | {'push + get, us':>14}")
+    for name, run in cases.items():
+        counter = iter(range(OPERATIONS_COUNT))
+        seconds: float = timeit.timeit(lambda: run(next(counter)), number=OPERATIONS_COUNT)
+        print(f"{name:>12} | {seconds / OPERATIONS_COUNT * 1e6:>14.3f}")
+
+
+def bench_membership(number: int = 100) -> None:
+    """Print the dedup-before-push cost and the per item memory of the queues with and without membership tracking."""
+    print(f"{'queued':>8} | {'walk, us':>10} | {'tracked, us':>11}")
+    for queued_count in QUEUED_COUNTS:
+        costs: list[float] = []
+        for track_membership in (False, True):
+            queue: MyQueue[int] = MyQueue(range(queued_count), track_membership=track_membership)
+
+            def push_unique() -> None:
+                if queued_count not in queue:
+                    queue.push(queued_count)
+                queue.get()
+
+            costs.append(timeit.timeit(push_unique, number=number) / number)
+        print(f"{queued_count:>8} | {costs[0] * 1e6:>10.2f} | {costs[1] * 1e6:>11.2f}")
+
+    print(f"{ITEMS_COUNT} items")
+    print(f"{'queue':>12} | {'bytes/item':>10}")
+    for track_membership in (False, True):
+        memory: float = measure_memory(lambda: MyQueue(track_membership=track_membership), "push")
+        print(f"{'tracked' if track_membership else 'plain':>12} | {memory:>10.1f}")
+
+
+def transfer(shared: BlockingQueue[int] | SpscQueue[int] | Queue, producers_count: int) -> float:
+    """Get the number of seconds to transfer the items from the producer threads to one consumer."""
+    per_producer: int = TRANSFERRED_COUNT // producers_count
+
+    def produce() -> None:
+        put = shared.put
+        for i in range(per_producer):
+            put(i)
+
+    producers = [threading.Thread(target=produce) for _ in range(producers_count)]
+    get = shared.get
+    start: float = time.perf_counter()
+    for producer in producers:
+        producer.start()
+    for _ in range(per_producer * producers_count):
+        get()
+    seconds: float = time.perf_counter() - start
+    for producer in producers:
+        producer.join()
+    return seconds
+
+
+def bench_contention() -> None:
+    """Print the throughput of the bounded queues with one consumer and the growing number of producers."""
+    queue_types: dict[str, Callable] = {
+        "BlockingQueue": BlockingQueue,
+        "SpscQueue": SpscQueue,
+        "queue.Queue": Queue,
+    }
+
+    print(f"{TRANSFERRED_COUNT} items, maxsize {MAXSIZE}")
+    print(f"{'producers':>9} | " + " | ".join(f"{name:>13}" for name in queue_types))
+    for producers_count in PRODUCER_COUNTS:
+        row: list[str] = []
+        for name, queue_type in queue_types.items():
+            # The lock-free queue is correct only with one producer
+            if name == "SpscQueue" and producers_count > 1:
+                row.append(f"{'-':>13}")
+                continue
+            seconds: float = transfer(queue_type(MAXSIZE), producers_count)
+            row.append(f"{TRANSFERRED_COUNT / seconds:>13.0f}")
+        print(f"{producers_count:>9} | " + " | ".join(row))
+
+
+if __name__ == "__main__":
+    bench_queues()
+    bench_modes()
+    bench_membership()
+    bench_contention()
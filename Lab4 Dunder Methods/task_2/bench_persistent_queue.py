@@ -0,0 +1,61 @@
+# Task 2 bench_persistent_queue.py
+import tempfile
+import timeit
+from typing import Callable
+
+from my_queue import MyQueue
+from persistent_queue import PersistentQueue
+
+
+ITEMS_COUNT: int = 200_000
+MEMORY_ITEMS: int = 10_000
+
+
+def push_then_get(queue_factory: Callable[[str], MyQueue | PersistentQueue]) -> Callable[[], None]:
+    """Get the function pushing all the items to the new queue and then getting them."""
+
+    def run() -> None:
+        with tempfile.TemporaryDirectory() as path:
+            queue = queue_factory(path)
+            for i in range(ITEMS_COUNT):
+                queue.push(i)
+            for _ in range(ITEMS_COUNT):
+                queue.get()
+            if isinstance(queue, PersistentQueue):
+                queue.close()
+
+    return run
+
+
+def push_and_get(queue_factory: Callable[[str], MyQueue | PersistentQueue]) -> Callable[[], None]:
+    """Get the function pushing the items to the new queue and getting each one right away."""
+
+    def run() -> None:
+        with tempfile.TemporaryDirectory() as path:
+            queue = queue_factory(path)
+            for i in range(ITEMS_COUNT):
+                queue.push(i)
+                queue.get()
+            if isinstance(queue, PersistentQueue):
+                queue.close()
+
+    return run
+
+
+def bench_persistent_queue() -> None:
+    """Print the throughput of the in-memory queue and the persistent one with and without spilling to the disk."""
+    cases: dict[str, Callable[[], None]] = {
+        "MyQueue": push_then_get(lambda path: MyQueue()),
+        "in memory": push_and_get(lambda path: PersistentQueue(path, memory_items=MEMORY_ITEMS)),
+        "spilled": push_then_get(lambda path: PersistentQueue(path, memory_items=MEMORY_ITEMS)),
+    }
+
+    print(f"{ITEMS_COUNT} items, {MEMORY_ITEMS} in memory")
+    print(f"{'queue':>10} | {'items/s':>10}")
+    for name, run in cases.items():
+        seconds: float = timeit.timeit(run, number=1)
+        print(f"{name:>10} | {ITEMS_COUNT / seconds:>10.0f}")
+
+
+if __name__ == "__main__":
+    bench_persistent_queue()
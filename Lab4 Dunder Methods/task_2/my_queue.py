@@ -1,36 +1,109 @@
 # Task 2 my_queue.py
-import copy
-from curses.ascii import EM
-from dataclasses import dataclass
-from typing import Generic, Generator, Optional, TypeVar
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Callable, Generic, Generator, Iterable, Iterator, Optional, TypeVar
 
 
 T = TypeVar("T")
 
 
+# fmt: off
 class EmptyQueueError(Exception): ...
+class FullQueueError(Exception): ...
+# fmt: on
 
 
-@dataclass
-class Node(Generic[T]):
-    value: T
-    next: Optional["Node[T]"]
-    prev: Optional["Node[T]"]
+# Number of the items shown at each end of the huge queue by 'str()' and 'repr()'
+FORMAT_EDGE_ITEMS: int = 10
+
+
+def _format_items(view: "QueueView[T]", separator: str, formatter: Callable[[T], str]) -> str:
+    """Join the formatted items of the view, the middle of the huge view is replaced with the hidden items count."""
+    if len(view) <= 2 * FORMAT_EDGE_ITEMS:
+        return separator.join(map(formatter, view))
+
+    hidden: str = f"... {len(view) - 2 * FORMAT_EDGE_ITEMS} more ..."
+    edges = (map(formatter, view[:FORMAT_EDGE_ITEMS]), [hidden], map(formatter, view[-FORMAT_EDGE_ITEMS:]))
+    return separator.join(itertools.chain(*edges))
+
+
+class QueueView(Generic[T]):
+    """
+    Represents the read-only view of the queue items as they were when the view was made.
+
+    The view shares the buffer with the queue, and the queue copies the buffer before changing it,
+    so neither the buffer nor the values are copied for the view itself.
+    """
+
+    def __init__(self, buffer: list[Optional[T]], head: int, indices: range) -> None:
+        """
+        Parameters
+        ----------
+        buffer : list[Optional[T]]
+            Ring buffer of the queue, its capacity is a power of two.
+        head : int
+            Index of the first queue item in the buffer.
+        indices : range
+            Positions of the viewed items in the queue.
+        """
+        self.__buffer: list[Optional[T]] = buffer
+        self.__head: int = head
+        self.__mask: int = len(buffer) - 1
+        self.__indices: range = indices
+
+    def __len__(self) -> int:
+        """Get the number of items in the view."""
+        return len(self.__indices)
+
+    def __iter__(self) -> Iterator[T]:
+        buffer, head, mask = self.__buffer, self.__head, self.__mask
+        for index in self.__indices:
+            yield buffer[(head + index) & mask]
+
+    def __getitem__(self, index: int | slice) -> "T | QueueView[T]":
+        """Get the item by its position in the view, or the view of the slice."""
+        if isinstance(index, slice):
+            return QueueView(self.__buffer, self.__head, self.__indices[index])
+        return self.__buffer[(self.__head + self.__indices[index]) & self.__mask]
+
+    def __str__(self) -> str:
+        return _format_items(self[::-1], " -> ", str)
+
+    def __repr__(self) -> str:
+        return f"QueueView([{_format_items(self, ', ', repr)}])"
 
 
 class MyQueue(Generic[T]):
-    """Represents the queue data structure."""
+    """Represents the queue data structure backed by the growable ring buffer."""
 
-    def __init__(self) -> None:
+    # Capacity is always a power of two, so the index wraps with a bit mask
+    MIN_CAPACITY: int = 8
+
+    def __init__(self, items: Iterable[T] | None = None, track_membership: bool = False) -> None:
         """
         Parameters
         ----------
-        items : Sequence[T] | None, optional
+        items : Iterable[T] | None, optional
             Initial sequence, by default None
+        track_membership : bool, optional
+            Keep the counts of the hashable items to check membership in O(1), by default False
         """
-        self.__tail: Optional[Node[T]] = None
-        self.__head: Optional[Node[T]] = None
+        self.__buffer: list[Optional[T]] = [None] * self.MIN_CAPACITY
+        self.__head: int = 0
         self.__size: int = 0
+        # True while the buffer can be referenced by a snapshot, so it must be copied before changing
+        self.__shared: bool = False
+        # Number of the unfinished iterations over the buffer, it is copied before changing while they go on
+        self.__readers: int = 0
+        self.__counts: Optional[dict[T, int]] = {} if track_membership else None
+        self.__unhashable_count: int = 0
+
+        if items is not None:
+            self.push_many(items)
 
     @property
     def size(self) -> int:
@@ -42,6 +115,16 @@ class MyQueue(Generic[T]):
         """Return True if queue is empty, or False."""
         return self.__size == 0
 
+    @property
+    def items(self) -> list[T]:
+        """Get the list of the queue items from the first added to the last added."""
+        return list(self.__values())
+
+    @property
+    def tracks_membership(self) -> bool:
+        """Return True if queue keeps the counts of its items, or False."""
+        return self.__counts is not None
+
     def push(self, item: T) -> None:
         """
         Push new item to the queue
@@ -51,22 +134,44 @@ class MyQueue(Generic[T]):
         item : T
             New item to add to the queue.
         """
-        if self.__head is None and self.__tail is None:
-            self.__head = self.__tail = Node[T](item, None, None)
-            self.__head.prev = self.__tail
-            self.__tail.next = self.__head
+        if self.__size == len(self.__buffer):
+            self.__resize(len(self.__buffer) * 2)
+        self.__own_buffer()
 
-        elif self.__head is self.__tail:
-            self.__head.next = None
-            self.__tail = Node[T](item, self.__head, None)
-            self.__head.prev = self.__tail
+        self.__buffer[(self.__head + self.__size) & (len(self.__buffer) - 1)] = item
+        self.__size += 1
 
-        else:
-            node = Node[T](item, self.__tail, None)
-            self.__tail = node
-            self.__tail.next.prev = self.__tail
+        if self.__counts is not None:
+            self.__count(item, 1)
 
-        self.__size += 1
+    def push_many(self, items: Iterable[T]) -> None:
+        """
+        Push all the items to the queue at once.
+
+        Parameters
+        ----------
+        items : Iterable[T]
+            New items to add to the queue in the order of adding.
+        """
+        items = list(items)
+
+        capacity: int = len(self.__buffer)
+        while capacity < self.__size + len(items):
+            capacity *= 2
+        if capacity != len(self.__buffer):
+            self.__resize(capacity)
+        self.__own_buffer()
+
+        # Items are copied by at most two slices: up to the end of the buffer and from its start
+        start: int = (self.__head + self.__size) & (capacity - 1)
+        first_part: int = min(len(items), capacity - start)
+        self.__buffer[start : start + first_part] = items[:first_part]
+        self.__buffer[: len(items) - first_part] = items[first_part:]
+        self.__size += len(items)
+
+        if self.__counts is not None:
+            for item in items:
+                self.__count(item, 1)
 
     def get(self) -> T | None:
         """
@@ -84,54 +189,688 @@ class MyQueue(Generic[T]):
         """
         if self.__size == 0:
             raise EmptyQueueError("Queue is empty")
+        self.__own_buffer()
+
+        item: Optional[T] = self.__buffer[self.__head]
+        self.__buffer[self.__head] = None
+        self.__head = (self.__head + 1) & (len(self.__buffer) - 1)
+        self.__size -= 1
 
-        if self.__head is self.__tail:
-            node = self.__head
-            self.__head = self.__tail = None
-            self.__size -= 1
-            return node.value
+        if self.__size * 4 < len(self.__buffer) > self.MIN_CAPACITY:
+            self.__resize(len(self.__buffer) // 2)
 
-        node = self.__head
-        self.__head = self.__head.prev
-        self.__head.next = None
+        if self.__counts is not None:
+            self.__count(item, -1)
 
-        self.__size -= 1
+        return item
+
+    def get_many(self, count: int) -> list[T]:
+        """
+        Pop the given number of the first added to the queue items at once.
+
+        Parameters
+        ----------
+        count : int
+            Number of the items to pop.
+
+        Returns
+        -------
+        list[T]
+            The first added to the queue items from the first added to the last added.
+
+        Raises
+        ------
+        ValueError
+            If count is negative.
+        EmptyQueueError
+            If queue has less items than count.
+        """
+        if count < 0:
+            raise ValueError("Count must not be negative")
+        if count > self.__size:
+            raise EmptyQueueError(f"Queue has only {self.__size} items")
+        self.__own_buffer()
+
+        capacity: int = len(self.__buffer)
+        first_part: int = min(count, capacity - self.__head)
+        items: list[T] = self.__buffer[self.__head : self.__head + first_part]
+        items += self.__buffer[: count - first_part]
+        self.__buffer[self.__head : self.__head + first_part] = [None] * first_part
+        self.__buffer[: count - first_part] = [None] * (count - first_part)
+
+        self.__head = (self.__head + count) & (capacity - 1)
+        self.__size -= count
+
+        new_capacity: int = capacity
+        while self.__size * 4 < new_capacity > self.MIN_CAPACITY:
+            new_capacity //= 2
+        if new_capacity != capacity:
+            self.__resize(new_capacity)
+
+        if self.__counts is not None:
+            for item in items:
+                self.__count(item, -1)
+
+        return items
+
+    def __resize(self, capacity: int) -> None:
+        """Move the items to the new buffer of the given capacity starting from its beginning."""
+        end: int = self.__head + self.__size
+        items: list[Optional[T]] = self.__buffer[self.__head : end] + self.__buffer[: max(0, end - len(self.__buffer))]
+        self.__buffer = items + [None] * (capacity - self.__size)
+        self.__head = 0
+        self.__shared = False
+        self.__readers = 0
+
+    def __own_buffer(self) -> None:
+        """Copy the buffer referenced by the views before changing it, the values themselves are not copied."""
+        if self.__shared or self.__readers:
+            self.__buffer = self.__buffer[:]
+            self.__shared = False
+            self.__readers = 0
+
+    def snapshot(self) -> QueueView[T]:
+        """
+        Get the view of all the queue items which is not changed by the later queue changes.
+
+        Returns
+        -------
+        QueueView[T]
+            The view of the items from the first added to the last added.
+        """
+        self.__shared = True
+        return QueueView(self.__buffer, self.__head, range(self.__size))
 
-        return node.value
+    def peek(self, count: int = 1) -> QueueView[T]:
+        """
+        Get the view of the given number of the first added to the queue items without popping them.
+
+        Parameters
+        ----------
+        count : int, optional
+            Number of the items to view, all of them if queue has less, by default 1
+
+        Raises
+        ------
+        ValueError
+            If count is negative.
+        """
+        if count < 0:
+            raise ValueError("Count must not be negative")
+        return self.snapshot()[:count]
+
+    def __view(self) -> QueueView[T]:
+        """Get the view of the current buffer without sharing it, the queue must not be changed while it is used."""
+        return QueueView(self.__buffer, self.__head, range(self.__size))
+
+    def __read(self, buffer: list[Optional[T]], head: int, size: int) -> Generator:
+        """Iterate over the buffer as the reader of it, the first yielded value only registers the reader."""
+        self.__readers += 1
+        try:
+            yield None
+            mask: int = len(buffer) - 1
+            for index in range(size):
+                yield buffer[(head + index) & mask]
+        finally:
+            # The buffer could be already replaced by the copy which has no readers
+            if self.__buffer is buffer:
+                self.__readers -= 1
+
+    def __values(self) -> Generator:
+        """Iterate over the current buffer without sharing it, the queue must not be changed during the iteration."""
+        mask: int = len(self.__buffer) - 1
+        for index in range(self.__size):
+            yield self.__buffer[(self.__head + index) & mask]
+
+    def __count(self, item: T, delta: int) -> None:
+        """Change the count of the item, the unhashable items are only counted in total."""
+        try:
+            count: int = self.__counts.get(item, 0) + delta
+        except TypeError:
+            self.__unhashable_count += delta
+            return
+
+        if count:
+            self.__counts[item] = count
+        else:
+            del self.__counts[item]
 
     def __bool__(self) -> bool:
         """Get the boolen represenation of the queue."""
-        return self.__size == 0
+        return self.__size != 0
 
     def __len__(self) -> int:
         """Get the number of items in the queue."""
         return self.__size
 
     def __contains__(self, value: T) -> bool:
-        temp = self.__head
-        while temp is not None:
-            if temp.value == value:
+        if self.__counts is not None:
+            try:
+                if value in self.__counts:
+                    return True
+            except TypeError:
+                pass
+            else:
+                # Only an unhashable item can still be equal to the value
+                if self.__unhashable_count == 0:
+                    return False
+
+        for item in self.__values():
+            if item == value:
                 return True
-            temp = temp.prev
         return False
 
-    def __iter__(self) -> Generator:
-        temp = self.__head
-        while temp is not None:
-            yield temp.value
-            temp = temp.prev
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterate over the items as they were when the iteration started, so the queue can be changed meanwhile.
+
+        The buffer is copied by a change only while the iteration is not finished or closed.
+        """
+        iterator: Generator = self.__read(self.__buffer, self.__head, self.__size)
+        next(iterator)
+        return iterator
+
+    def __getitem__(self, index: int | slice) -> "T | QueueView[T]":
+        """Get the item by its position from the first added, or the view of the slice."""
+        if isinstance(index, slice):
+            return self.snapshot()[index]
+        return self.__buffer[(self.__head + range(self.__size)[index]) & (len(self.__buffer) - 1)]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MyQueue):
+            return NotImplemented
+        return self.items == other.items
+
+    def __add__(self, other: "MyQueue[T]") -> "MyQueue[T]":
+        """Get the new queue with the items of this queue followed by the items of the other one."""
+        if not isinstance(other, MyQueue):
+            return NotImplemented
+        queue: MyQueue[T] = MyQueue(self.__values(), track_membership=self.tracks_membership)
+        queue.push_many(other)
+        return queue
+
+    def __iadd__(self, other: "MyQueue[T]") -> "MyQueue[T]":
+        """Push the items of the other queue to this one."""
+        if not isinstance(other, MyQueue):
+            return NotImplemented
+        self.push_many(other)
+        return self
 
     def __str__(self) -> str:
-        res: list[str] = []
+        return str(self.__view())
 
-        temp = self.__tail
-        while temp is not None:
-            res.append(f"{temp.value}")
-            temp = temp.next
+    def __repr__(self) -> str:
+        return f"MyQueue([{_format_items(self.__view(), ', ', repr)}])"
 
+
+class _HeapQueue(Generic[T]):
+    """Represents the queue which items are got in the order of their keys, equal keys in the order of adding."""
+
+    def __init__(self) -> None:
+        # The counter breaks the ties, so the items themselves are never compared
+        self.__heap: list[tuple[float, int, T]] = []
+        self.__counter: Iterator[int] = itertools.count()
+
+    @property
+    def size(self) -> int:
+        """Get the queue items count."""
+        return len(self.__heap)
+
+    @property
+    def empty(self) -> bool:
+        """Return True if queue is empty, or False."""
+        return not self.__heap
+
+    @property
+    def items(self) -> list[T]:
+        """Get the list of the queue items in the order of getting."""
+        return list(self)
+
+    def _push(self, key: float, item: T) -> None:
+        """Push the item with the given key to the heap."""
+        heapq.heappush(self.__heap, (key, next(self.__counter), item))
+
+    def _first_key(self) -> float:
+        """Get the smallest key, or raise EmptyQueueError if queue is empty."""
+        if not self.__heap:
+            raise EmptyQueueError("Queue is empty")
+        return self.__heap[0][0]
+
+    def _pop(self) -> T:
+        """Pop the item with the smallest key, or raise EmptyQueueError if queue is empty."""
+        if not self.__heap:
+            raise EmptyQueueError("Queue is empty")
+        return heapq.heappop(self.__heap)[2]
+
+    def __bool__(self) -> bool:
+        """Get the boolen represenation of the queue."""
+        return bool(self.__heap)
+
+    def __len__(self) -> int:
+        """Get the number of items in the queue."""
+        return len(self.__heap)
+
+    def __iter__(self) -> Generator:
+        """Iterate over the items in the order of getting, the heap itself is not changed."""
+        for _, _, item in sorted(self.__heap):
+            yield item
+
+    def __str__(self) -> str:
+        res: list[str] = [f"{item}" for item in self]
+        res.reverse()
         return " -> ".join(res)
 
 
+class PriorityQueue(_HeapQueue[T]):
+    """Represents the queue which items with the smaller priority are got first."""
+
+    def __init__(self, items: Iterable[tuple[float, T]] | None = None) -> None:
+        """
+        Parameters
+        ----------
+        items : Iterable[tuple[float, T]] | None, optional
+            Initial sequence of the pairs of the priority and the item, by default None
+        """
+        super().__init__()
+        if items is not None:
+            for priority, item in items:
+                self.push(item, priority)
+
+    def push(self, item: T, priority: float = 0) -> None:
+        """
+        Push new item to the queue
+
+        Parameters
+        ----------
+        item : T
+            New item to add to the queue.
+        priority : float, optional
+            Item priority, the smaller one is got first, by default 0
+        """
+        self._push(priority, item)
+
+    def get(self) -> T:
+        """
+        Pop the item with the smallest priority, the first added one for the equal priorities.
+
+        Raises
+        ------
+        EmptyQueueError
+            If queue is empty.
+        """
+        return self._pop()
+
+
+class DelayQueue(_HeapQueue[T]):
+    """Represents the queue which items can be got only after their delivery time."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Parameters
+        ----------
+        clock : Callable[[], float], optional
+            Source of the current time in seconds, by default time.monotonic
+        """
+        super().__init__()
+        self.__clock: Callable[[], float] = clock
+
+    @property
+    def ready(self) -> bool:
+        """Return True if the first item can be got now, or False."""
+        return bool(self) and self._first_key() <= self.__clock()
+
+    @property
+    def next_delivery(self) -> float | None:
+        """Get the delivery time of the first item, or None if queue is empty."""
+        return self._first_key() if self else None
+
+    def push(self, item: T, at: float | None = None, delay: float = 0) -> None:
+        """
+        Push new item to the queue
+
+        Parameters
+        ----------
+        item : T
+            New item to add to the queue.
+        at : float | None, optional
+            Delivery time by the queue clock, by default None, the current time.
+        delay : float, optional
+            Number of seconds added to the delivery time, by default 0
+        """
+        self._push((self.__clock() if at is None else at) + delay, item)
+
+    def get(self) -> T:
+        """
+        Pop the item with the earliest delivery time if it has already come.
+
+        Raises
+        ------
+        EmptyQueueError
+            If queue is empty or its first item is not ready yet.
+        """
+        if self._first_key() > self.__clock():
+            raise EmptyQueueError("Queue has no ready items")
+        return self._pop()
+
+
+def _validate_maxsize(maxsize: int) -> int:
+    """Get the maximum queue size if it is greater than zero, or raise ValueError."""
+    if maxsize <= 0:
+        raise ValueError("Maximum size must be greater than zero")
+    return maxsize
+
+
+class BlockingQueue(Generic[T]):
+    """
+    Represents the bounded queue shared by any number of producer and consumer threads.
+
+    'put' waits while the queue is full and 'get' waits while it is empty, both under one lock.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of items in the queue.
+        """
+        self.__maxsize: int = _validate_maxsize(maxsize)
+        self.__queue: MyQueue[T] = MyQueue()
+        self.__lock: threading.Lock = threading.Lock()
+        self.__not_empty: threading.Condition = threading.Condition(self.__lock)
+        self.__not_full: threading.Condition = threading.Condition(self.__lock)
+
+    @property
+    def maxsize(self) -> int:
+        """Get the maximum number of items in the queue."""
+        return self.__maxsize
+
+    def put(self, item: T, block: bool = True, timeout: float | None = None) -> None:
+        """
+        Push the item to the queue waiting for the free space if the queue is full.
+
+        Parameters
+        ----------
+        item : T
+            New item to add to the queue.
+        block : bool, optional
+            Wait for the free space, by default True
+        timeout : float | None, optional
+            Maximum number of seconds to wait, by default None, wait as long as needed.
+
+        Raises
+        ------
+        FullQueueError
+            If queue is still full after the timeout or if it is full and block is False.
+        """
+        with self.__not_full:
+            if not self.__not_full.wait_for(lambda: len(self.__queue) < self.__maxsize, timeout if block else 0):
+                raise FullQueueError("Queue is full")
+            self.__queue.push(item)
+            self.__not_empty.notify()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> T:
+        """
+        Pop the first added to the queue item waiting for it if the queue is empty.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Wait for the item, by default True
+        timeout : float | None, optional
+            Maximum number of seconds to wait, by default None, wait as long as needed.
+
+        Raises
+        ------
+        EmptyQueueError
+            If queue is still empty after the timeout or if it is empty and block is False.
+        """
+        with self.__not_empty:
+            if not self.__not_empty.wait_for(lambda: len(self.__queue) > 0, timeout if block else 0):
+                raise EmptyQueueError("Queue is empty")
+            item: T = self.__queue.get()
+            self.__not_full.notify()
+            return item
+
+    def __len__(self) -> int:
+        """Get the number of items in the queue."""
+        return len(self.__queue)
+
+
+class SpscQueue(Generic[T]):
+    """
+    Represents the bounded queue shared by exactly one producer thread and one consumer thread.
+
+    The producer only moves the tail and the consumer only moves the head, so while the queue is neither empty
+    nor full 'put' and 'get' take no lock. The lock is taken only to wait, and to wake up the waiting side.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of items in the queue.
+        """
+        self.__maxsize: int = _validate_maxsize(maxsize)
+        self.__buffer: list[Optional[T]] = [None] * maxsize
+        # Total numbers of the got and the put items, written only by the consumer and only by the producer
+        self.__head: int = 0
+        self.__tail: int = 0
+        self.__condition: threading.Condition = threading.Condition()
+        self.__consumer_waiting: bool = False
+        self.__producer_waiting: bool = False
+
+    @property
+    def maxsize(self) -> int:
+        """Get the maximum number of items in the queue."""
+        return self.__maxsize
+
+    def put(self, item: T, block: bool = True, timeout: float | None = None) -> None:
+        """
+        Push the item to the queue waiting for the free space if the queue is full.
+
+        Parameters
+        ----------
+        item : T
+            New item to add to the queue.
+        block : bool, optional
+            Wait for the free space, by default True
+        timeout : float | None, optional
+            Maximum number of seconds to wait, by default None, wait as long as needed.
+
+        Raises
+        ------
+        FullQueueError
+            If queue is still full after the timeout or if it is full and block is False.
+        """
+        if self.__tail - self.__head == self.__maxsize:
+            with self.__condition:
+                # The flag is set before the check, so the consumer either sees it or the check sees the free space
+                self.__producer_waiting = True
+                has_space: bool = self.__condition.wait_for(
+                    lambda: self.__tail - self.__head < self.__maxsize, timeout if block else 0
+                )
+                self.__producer_waiting = False
+            if not has_space:
+                raise FullQueueError("Queue is full")
+
+        self.__buffer[self.__tail % self.__maxsize] = item
+        self.__tail += 1
+
+        if self.__consumer_waiting:
+            with self.__condition:
+                self.__condition.notify()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> T:
+        """
+        Pop the first added to the queue item waiting for it if the queue is empty.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Wait for the item, by default True
+        timeout : float | None, optional
+            Maximum number of seconds to wait, by default None, wait as long as needed.
+
+        Raises
+        ------
+        EmptyQueueError
+            If queue is still empty after the timeout or if it is empty and block is False.
+        """
+        if self.__tail == self.__head:
+            with self.__condition:
+                self.__consumer_waiting = True
+                has_item: bool = self.__condition.wait_for(lambda: self.__tail > self.__head, timeout if block else 0)
+                self.__consumer_waiting = False
+            if not has_item:
+                raise EmptyQueueError("Queue is empty")
+
+        index: int = self.__head % self.__maxsize
+        item: Optional[T] = self.__buffer[index]
+        self.__buffer[index] = None
+        self.__head += 1
+
+        if self.__producer_waiting:
+            with self.__condition:
+                self.__condition.notify()
+
+        return item
+
+    def __len__(self) -> int:
+        """Get the number of items in the queue."""
+        return self.__tail - self.__head
+
+
+class AsyncQueue(Generic[T]):
+    """
+    Represents the bounded queue shared by the asyncio tasks of one event loop.
+
+    'put' and 'get' return without awaiting anything while the queue is neither full nor empty,
+    otherwise the task waits in the FIFO queue of the waiting producers or consumers.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of items in the queue.
+        """
+        self.__maxsize: int = _validate_maxsize(maxsize)
+        self.__queue: MyQueue[T] = MyQueue()
+        self.__putters: deque[asyncio.Future[None]] = deque()
+        self.__getters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def maxsize(self) -> int:
+        """Get the maximum number of items in the queue."""
+        return self.__maxsize
+
+    async def put(self, item: T, timeout: float | None = None) -> None:
+        """
+        Push the item to the queue waiting for the free space if the queue is full.
+
+        Parameters
+        ----------
+        item : T
+            New item to add to the queue.
+        timeout : float | None, optional
+            Maximum number of seconds to wait, by default None, wait as long as needed.
+
+        Raises
+        ------
+        FullQueueError
+            If queue is still full after the timeout.
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                while len(self.__queue) >= self.__maxsize:
+                    await self.__wait(self.__putters, lambda: len(self.__queue) < self.__maxsize)
+        except TimeoutError:
+            raise FullQueueError("Queue is full") from None
+
+        self.put_nowait(item)
+
+    def put_nowait(self, item: T) -> None:
+        """
+        Push the item to the queue without waiting.
+
+        Raises
+        ------
+        FullQueueError
+            If queue is full.
+        """
+        if len(self.__queue) >= self.__maxsize:
+            raise FullQueueError("Queue is full")
+        self.__queue.push(item)
+        self.__wake_up(self.__getters)
+
+    async def get(self, timeout: float | None = None) -> T:
+        """
+        Pop the first added to the queue item waiting for it if the queue is empty.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Maximum number of seconds to wait, by default None, wait as long as needed.
+
+        Raises
+        ------
+        EmptyQueueError
+            If queue is still empty after the timeout.
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                while not self.__queue:
+                    await self.__wait(self.__getters, lambda: bool(self.__queue))
+        except TimeoutError:
+            raise EmptyQueueError("Queue is empty") from None
+
+        return self.get_nowait()
+
+    def get_nowait(self) -> T:
+        """
+        Pop the first added to the queue item without waiting.
+
+        Raises
+        ------
+        EmptyQueueError
+            If queue is empty.
+        """
+        item: T = self.__queue.get()
+        self.__wake_up(self.__putters)
+        return item
+
+    def __len__(self) -> int:
+        """Get the number of items in the queue."""
+        return len(self.__queue)
+
+    async def __wait(self, waiters: deque[asyncio.Future[None]], ready: Callable[[], bool]) -> None:
+        """Wait in the queue of the waiters until woken up."""
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            if waiter in waiters:
+                waiters.remove(waiter)
+            # The task was woken up but gave up, so the next waiter gets the chance
+            elif ready():
+                self.__wake_up(waiters)
+            raise
+
+    @staticmethod
+    def __wake_up(waiters: deque[asyncio.Future[None]]) -> None:
+        """Wake up the first waiter that is still waiting."""
+        while waiters:
+            waiter: asyncio.Future[None] = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+
 if __name__ == "__main__":
     queue = MyQueue[int]()
 
@@ -0,0 +1,297 @@
+# Task 2 persistent_queue.py
+import itertools
+import mmap
+import os
+import pickle
+import struct
+import zlib
+from typing import Generator, Generic, TypeVar
+
+from my_queue import EmptyQueueError, MyQueue
+
+
+T = TypeVar("T")
+
+# Record is the payload length and its CRC-32 followed by the pickled item, the zero length ends the segment
+RECORD_HEADER: struct.Struct = struct.Struct("<II")
+# Position of the first not consumed record: the segment number and the offset in it
+HEAD: struct.Struct = struct.Struct("<QQ")
+HEAD_FILE_NAME: str = "head"
+SEGMENT_SUFFIX: str = ".seg"
+
+
+class PersistentQueue(Generic[T]):
+    """
+    Represents the durable queue which items are appended to the memory-mapped segment files.
+
+    Only the head of the queue is kept in memory: up to 'memory_items' items are got without reading the disk,
+    the rest is spilled to the segments and read back by batches. The segments that are fully consumed are deleted.
+
+    The consumed position is saved by 'sync()', 'close()' and when a segment is reclaimed. After a crash the queue
+    is restored from the segments, and the items got after the last saved position are got again.
+    """
+
+    def __init__(self, path: str, memory_items: int = 10_000, segment_size: int = 4 * 1024 * 1024) -> None:
+        """
+        Parameters
+        ----------
+        path : str
+            Directory of the segment files, created if missing.
+        memory_items : int, optional
+            Maximum number of items kept in memory, by default 10_000
+        segment_size : int, optional
+            Size of one segment file in bytes, by default 4 MiB
+
+        Raises
+        ------
+        ValueError
+            If memory_items is not positive or segment_size can not hold a record header.
+        """
+        if memory_items <= 0:
+            raise ValueError("Number of items in memory must be greater than zero")
+        if segment_size <= RECORD_HEADER.size:
+            raise ValueError(f"Segment size must be greater than {RECORD_HEADER.size} bytes")
+
+        self.__path: str = path
+        self.__memory_items: int = memory_items
+        self.__segment_size: int = segment_size
+
+        # Items loaded into memory with the position right after their records
+        self.__memory: MyQueue[tuple[T, int, int]] = MyQueue()
+        self.__size: int = 0
+
+        self.__first_segment: int = 0
+        self.__head_segment: int = 0
+        self.__head_offset: int = 0
+        # Position of the first record not loaded into memory
+        self.__read_segment: int = 0
+        self.__read_offset: int = 0
+        self.__write_segment: int = 0
+        self.__write_offset: int = 0
+        self.__write_map: mmap.mmap | None = None
+
+        os.makedirs(path, exist_ok=True)
+        self.__recover()
+
+    @property
+    def path(self) -> str:
+        """Get the directory of the segment files."""
+        return self.__path
+
+    @property
+    def size(self) -> int:
+        """Get the queue items count."""
+        return self.__size
+
+    @property
+    def empty(self) -> bool:
+        """Return True if queue is empty, or False."""
+        return self.__size == 0
+
+    @property
+    def spilled(self) -> bool:
+        """Return True if some items are only on the disk, or False."""
+        return (self.__read_segment, self.__read_offset) != (self.__write_segment, self.__write_offset)
+
+    def push(self, item: T) -> None:
+        """
+        Push new item to the queue
+
+        Parameters
+        ----------
+        item : T
+            New item to add to the queue, must be picklable.
+        """
+        payload: bytes = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        record_size: int = RECORD_HEADER.size + len(payload)
+        if self.__write_offset + record_size > len(self.__write_map):
+            self.__roll(record_size)
+
+        start: int = self.__write_offset + RECORD_HEADER.size
+        end: int = start + len(payload)
+        self.__write_map[start:end] = payload
+        # The header is written last, so the torn record is never taken for the complete one
+        RECORD_HEADER.pack_into(self.__write_map, self.__write_offset, len(payload), zlib.crc32(payload))
+
+        if not self.spilled and len(self.__memory) < self.__memory_items:
+            self.__memory.push((item, self.__write_segment, end))
+            self.__read_offset = end
+        self.__write_offset = end
+        self.__size += 1
+
+    def get(self) -> T:
+        """
+        Pop the first added to the queue item.
+
+        Raises
+        ------
+        EmptyQueueError
+            If queue is empty.
+        """
+        if self.__size == 0:
+            raise EmptyQueueError("Queue is empty")
+        if not self.__memory:
+            self.__load()
+
+        item, segment, offset = self.__memory.get()
+        self.__size -= 1
+
+        crossed_segment: bool = segment != self.__head_segment
+        self.__head_segment, self.__head_offset = segment, offset
+        if crossed_segment:
+            self.__reclaim()
+
+        return item
+
+    def sync(self) -> None:
+        """Flush the written records to the disk and save the consumed position."""
+        self.__write_map.flush()
+        self.__write_head()
+
+    def close(self) -> None:
+        """Save the queue and release the mapped segment."""
+        if self.__write_map is not None:
+            self.sync()
+            self.__write_map.close()
+            self.__write_map = None
+
+    def __recover(self) -> None:
+        """Restore the positions and the size of the queue from the segment files."""
+        segments: list[int] = sorted(
+            int(name.removesuffix(SEGMENT_SUFFIX)) for name in os.listdir(self.__path) if name.endswith(SEGMENT_SUFFIX)
+        )
+
+        head_path: str = os.path.join(self.__path, HEAD_FILE_NAME)
+        if os.path.exists(head_path):
+            with open(head_path, "rb") as file:
+                self.__head_segment, self.__head_offset = HEAD.unpack(file.read(HEAD.size))
+        elif segments:
+            self.__head_segment, self.__head_offset = segments[0], 0
+
+        self.__first_segment = self.__head_segment
+        self.__reclaim(segments)
+        segments = [segment for segment in segments if segment >= self.__head_segment]
+
+        if not segments:
+            self.__head_offset = 0
+            self.__write_segment = self.__head_segment
+            self.__write_map = self.__create_segment(self.__write_segment, self.__segment_size)
+        else:
+            for segment in segments[:-1]:
+                with self.__map_segment(segment, mmap.ACCESS_READ) as buffer:
+                    start: int = self.__head_offset if segment == self.__head_segment else 0
+                    self.__size += sum(1 for _ in self.__scan(buffer, start))
+
+            self.__write_segment = segments[-1]
+            self.__write_map = self.__map_segment(self.__write_segment, mmap.ACCESS_WRITE)
+            start = self.__head_offset if self.__write_segment == self.__head_segment else 0
+            self.__write_offset = start
+            for _, end in self.__scan(self.__write_map, start):
+                self.__size += 1
+                self.__write_offset = end
+            # Clear the torn record if any, so it can not be read after the new records
+            self.__write_map[self.__write_offset :] = bytes(len(self.__write_map) - self.__write_offset)
+
+        self.__read_segment, self.__read_offset = self.__head_segment, self.__head_offset
+
+    def __load(self) -> None:
+        """Load the next batch of the spilled items into memory."""
+        records = self.__records(self.__read_segment, self.__read_offset)
+        for item, segment, offset in itertools.islice(records, self.__memory_items):
+            self.__memory.push((item, segment, offset))
+            self.__read_segment, self.__read_offset = segment, offset
+        records.close()
+
+    def __records(self, segment: int, offset: int) -> Generator[tuple[T, int, int], None, None]:
+        """Iterate over the items from the given position with the position right after their records."""
+        while segment <= self.__write_segment:
+            if segment == self.__write_segment:
+                buffer: mmap.mmap = self.__write_map
+            else:
+                buffer = self.__map_segment(segment, mmap.ACCESS_READ)
+            try:
+                for start, end in self.__scan(buffer, offset):
+                    yield pickle.loads(buffer[start:end]), segment, end
+            finally:
+                if buffer is not self.__write_map:
+                    buffer.close()
+            segment, offset = segment + 1, 0
+
+    @staticmethod
+    def __scan(buffer: mmap.mmap, offset: int) -> Generator[tuple[int, int], None, None]:
+        """Iterate over the payload bounds of the complete records from the given offset."""
+        while offset + RECORD_HEADER.size <= len(buffer):
+            length, checksum = RECORD_HEADER.unpack_from(buffer, offset)
+            start: int = offset + RECORD_HEADER.size
+            end: int = start + length
+            if length == 0 or end > len(buffer) or zlib.crc32(buffer[start:end]) != checksum:
+                return
+            yield start, end
+            offset = end
+
+    def __roll(self, record_size: int) -> None:
+        """Start the new segment large enough for the record."""
+        if not self.spilled:
+            self.__read_segment, self.__read_offset = self.__write_segment + 1, 0
+
+        self.__write_map.flush()
+        self.__write_map.close()
+        self.__write_segment += 1
+        self.__write_offset = 0
+        self.__write_map = self.__create_segment(self.__write_segment, max(self.__segment_size, record_size))
+
+    def __reclaim(self, segments: list[int] | None = None) -> None:
+        """Save the consumed position and delete the segments before it."""
+        if segments is None:
+            segments = list(range(self.__first_segment, self.__head_segment))
+            self.__write_head()
+
+        for segment in segments:
+            if segment < self.__head_segment:
+                os.remove(self.__segment_path(segment))
+        self.__first_segment = self.__head_segment
+
+    def __write_head(self) -> None:
+        """Atomically replace the saved consumed position."""
+        head_path: str = os.path.join(self.__path, HEAD_FILE_NAME)
+        with open(head_path + ".tmp", "wb") as file:
+            file.write(HEAD.pack(self.__head_segment, self.__head_offset))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(head_path + ".tmp", head_path)
+
+    def __segment_path(self, segment: int) -> str:
+        """Get the path to the segment file."""
+        return os.path.join(self.__path, f"{segment:020d}{SEGMENT_SUFFIX}")
+
+    def __create_segment(self, segment: int, size: int) -> mmap.mmap:
+        """Create the zero filled segment file of the given size and map it for writing."""
+        with open(self.__segment_path(segment), "w+b") as file:
+            file.truncate(size)
+            return mmap.mmap(file.fileno(), size, access=mmap.ACCESS_WRITE)
+
+    def __map_segment(self, segment: int, access: int) -> mmap.mmap:
+        """Map the existing segment file."""
+        with open(self.__segment_path(segment), "rb" if access == mmap.ACCESS_READ else "r+b") as file:
+            return mmap.mmap(file.fileno(), 0, access=access)
+
+    def __enter__(self) -> "PersistentQueue[T]":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __bool__(self) -> bool:
+        """Get the boolen represenation of the queue."""
+        return self.__size != 0
+
+    def __len__(self) -> int:
+        """Get the number of items in the queue."""
+        return self.__size
+
+    def __iter__(self) -> Generator:
+        """Iterate over the items from the first added to the last added, the spilled ones are read from the disk."""
+        for item, _, _ in self.__memory:
+            yield item
+        for item, _, _ in self.__records(self.__read_segment, self.__read_offset):
+            yield item
@@ -1,6 +1,19 @@
 # Task 2 test_my_queue.py
+import asyncio
+import threading
+
 import pytest
-from my_queue import EmptyQueueError, MyQueue
+from my_queue import (
+    AsyncQueue,
+    BlockingQueue,
+    DelayQueue,
+    EmptyQueueError,
+    FullQueueError,
+    MyQueue,
+    PriorityQueue,
+    QueueView,
+    SpscQueue,
+)
 
 
 # Fixtures
@@ -57,3 +70,228 @@ def test_queue_add_iadd(queue: MyQueue[int]) -> None:
 
     queue += MyQueue[int]([5, 6])
     assert queue == MyQueue[int]([1, 2, 3, 4, 5, 6])
+
+
+def test_queue_push_many_get_many(queue: MyQueue[int], empty_queue: MyQueue[int]) -> None:
+    queue.push_many(range(5, 21))
+    assert queue.items == list(range(1, 21))
+    assert queue.get_many(3) == [1, 2, 3]
+    assert queue.get_many(0) == []
+    assert len(queue) == 17
+
+    with pytest.raises(EmptyQueueError):
+        empty_queue.get_many(1)
+    with pytest.raises(ValueError):
+        queue.get_many(-1)
+
+
+def test_queue_wraps_around(empty_queue: MyQueue[int]) -> None:
+    for i in range(6):
+        empty_queue.push(i)
+    assert empty_queue.get_many(5) == [0, 1, 2, 3, 4]
+
+    empty_queue.push_many(range(6, 12))
+    assert empty_queue.items == list(range(5, 12))
+    assert 11 in empty_queue
+    assert str(empty_queue) == "11 -> 10 -> 9 -> 8 -> 7 -> 6 -> 5"
+    assert [empty_queue.get() for _ in range(7)] == list(range(5, 12))
+    assert empty_queue.empty is True
+
+
+def test_queue_track_membership() -> None:
+    queue: MyQueue = MyQueue([1, 2, 2], track_membership=True)
+    assert queue.tracks_membership is True
+    assert MyQueue().tracks_membership is False
+
+    assert 2 in queue and 3 not in queue
+    queue.get_many(2)
+    assert 2 in queue and 1 not in queue
+    queue.get()
+    assert 2 not in queue
+
+    # Unhashable items are found by the fallback walk through the queue
+    queue.push_many([[1], 5])
+    assert [1] in queue and [2] not in queue and 5 in queue
+    queue.get()
+    assert [1] not in queue and 5 in queue
+    assert (queue + MyQueue([6])).tracks_membership is True
+
+
+def test_queue_snapshot_iteration(queue: MyQueue[int]) -> None:
+    seen: list[int] = []
+    for item in queue:
+        seen.append(item)
+        queue.get()
+        queue.push(item * 10)
+    assert seen == [1, 2, 3, 4]
+    assert queue.items == [10, 20, 30, 40]
+
+    snapshot: QueueView[int] = queue.snapshot()
+    queue.get_many(2)
+    queue.push_many(range(8))
+    assert list(snapshot) == [10, 20, 30, 40]
+
+
+def test_queue_reads_dont_share_buffer(queue: MyQueue[int]) -> None:
+    iterator = iter(queue)
+    queue.get()
+    assert list(iterator) == [1, 2, 3, 4]
+
+    str(queue)
+    repr(queue)
+    for _ in queue:
+        break
+    # Only the unfinished iteration and the snapshot make the next change copy the buffer
+    assert queue._MyQueue__shared is False and queue._MyQueue__readers == 0
+
+    iterator = iter(queue)
+    queue.push(5)
+    queue.push(6)
+    assert list(iterator) == [2, 3, 4]
+    assert queue.items == [2, 3, 4, 5, 6]
+
+
+def test_queue_peek_and_slices(queue: MyQueue[int]) -> None:
+    assert list(queue.peek(2)) == [1, 2]
+    assert list(queue.peek(10)) == [1, 2, 3, 4]
+    assert len(queue.peek(0)) == 0
+    with pytest.raises(ValueError):
+        queue.peek(-1)
+
+    assert queue[0] == 1 and queue[-1] == 4
+    with pytest.raises(IndexError):
+        queue[4]
+    view = queue[1:]
+    assert list(view) == [2, 3, 4]
+    assert list(view[::-1]) == [4, 3, 2]
+    assert view[0] == 2
+    assert len(queue) == 4
+
+
+def test_queue_str_repr_truncated(queue: MyQueue[int]) -> None:
+    assert repr(queue) == "MyQueue([1, 2, 3, 4])"
+    assert repr(queue.peek(2)) == "QueueView([1, 2])"
+    assert str(queue.peek(2)) == "2 -> 1"
+
+    huge: MyQueue[int] = MyQueue(range(1_000_000))
+    newest, oldest = map(str, range(999_999, 999_989, -1)), map(str, range(9, -1, -1))
+    assert str(huge) == " -> ".join([*newest, "... 999980 more ...", *oldest])
+    assert repr(huge).startswith("MyQueue([0, 1, 2") and repr(huge).endswith("999998, 999999])")
+    assert "... 999980 more ..." in repr(huge)
+
+
+# Priority and delay queues tests
+def test_priority_queue() -> None:
+    queue: PriorityQueue[str] = PriorityQueue([(2, "b"), (1, "a")])
+    queue.push("c", priority=2)
+    queue.push("first", priority=-1)
+
+    assert len(queue) == 4
+    assert queue.items == ["first", "a", "b", "c"]
+    assert str(queue) == "c -> b -> a -> first"
+    assert [queue.get() for _ in range(4)] == ["first", "a", "b", "c"]
+    assert queue.empty is True
+    with pytest.raises(EmptyQueueError):
+        queue.get()
+
+
+def test_delay_queue() -> None:
+    now: list[float] = [100.0]
+    queue: DelayQueue[str] = DelayQueue(clock=lambda: now[0])
+    queue.push("later", delay=10)
+    queue.push("at", at=105)
+    queue.push("now")
+
+    assert len(queue) == 3
+    assert list(queue) == ["now", "at", "later"]
+    assert queue.get() == "now"
+    assert queue.ready is False
+    assert queue.next_delivery == 105
+    with pytest.raises(EmptyQueueError):
+        queue.get()
+
+    now[0] = 110
+    assert queue.ready is True
+    assert [queue.get(), queue.get()] == ["at", "later"]
+    assert queue.next_delivery is None
+
+
+# Concurrent queues tests
+@pytest.mark.parametrize("queue_type", [BlockingQueue, SpscQueue])
+def test_concurrent_queue_timeouts(queue_type: type) -> None:
+    queue = queue_type(2)
+    queue.put(1)
+    queue.put(2, block=False)
+    assert len(queue) == 2
+
+    with pytest.raises(FullQueueError):
+        queue.put(3, block=False)
+    with pytest.raises(FullQueueError):
+        queue.put(3, timeout=0.01)
+
+    assert queue.get() == 1
+    assert queue.get(timeout=0.01) == 2
+    with pytest.raises(EmptyQueueError):
+        queue.get(block=False)
+    with pytest.raises(EmptyQueueError):
+        queue.get(timeout=0.01)
+    with pytest.raises(ValueError):
+        queue_type(0)
+
+
+@pytest.mark.parametrize("queue_type", [BlockingQueue, SpscQueue])
+def test_concurrent_queue_backpressure(queue_type: type) -> None:
+    queue = queue_type(4)
+    producer = threading.Thread(target=lambda: [queue.put(i) for i in range(10_000)])
+    producer.start()
+
+    got: list[int] = [queue.get(timeout=5) for _ in range(10_000)]
+    producer.join()
+    assert got == list(range(10_000))
+    assert len(queue) == 0
+
+
+def test_blocking_queue_many_producers() -> None:
+    queue: BlockingQueue[int] = BlockingQueue(8)
+    producers = [
+        threading.Thread(target=lambda start=start: [queue.put(i) for i in range(start, start + 1_000)])
+        for start in range(0, 4_000, 1_000)
+    ]
+    for producer in producers:
+        producer.start()
+
+    got: list[int] = [queue.get(timeout=5) for _ in range(4_000)]
+    for producer in producers:
+        producer.join()
+    assert sorted(got) == list(range(4_000))
+
+
+def test_async_queue() -> None:
+    async def run() -> None:
+        queue: AsyncQueue[int] = AsyncQueue(2)
+        await queue.put(1)
+        queue.put_nowait(2)
+        with pytest.raises(FullQueueError):
+            queue.put_nowait(3)
+        with pytest.raises(FullQueueError):
+            await queue.put(3, timeout=0.01)
+
+        # The blocked producer gets the space as soon as an item is got
+        waiting_put = asyncio.create_task(queue.put(3))
+        await asyncio.sleep(0)
+        assert await queue.get() == 1
+        await waiting_put
+        assert [queue.get_nowait(), await queue.get()] == [2, 3]
+
+        with pytest.raises(EmptyQueueError):
+            queue.get_nowait()
+        with pytest.raises(EmptyQueueError):
+            await queue.get(timeout=0.01)
+
+        getters = [asyncio.create_task(queue.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        for i in range(3):
+            await queue.put(i)
+        assert await asyncio.gather(*getters) == [0, 1, 2]
+
+    asyncio.run(run())
@@ -0,0 +1,74 @@
+# Task 2 test_persistent_queue.py
+import os
+import pickle
+
+import pytest
+from my_queue import EmptyQueueError
+from persistent_queue import RECORD_HEADER, SEGMENT_SUFFIX, PersistentQueue
+
+
+def segment_files(path: str) -> list[str]:
+    return sorted(name for name in os.listdir(path) if name.endswith(SEGMENT_SUFFIX))
+
+
+def test_persistent_queue_spills(tmp_path) -> None:
+    with PersistentQueue(str(tmp_path), memory_items=3, segment_size=64) as queue:
+        assert queue.empty is True
+        with pytest.raises(EmptyQueueError):
+            queue.get()
+
+        for i in range(20):
+            queue.push({"job": i})
+        assert queue.spilled is True
+        assert len(queue) == 20
+        assert [item["job"] for item in queue] == list(range(20))
+
+        assert [queue.get()["job"] for _ in range(15)] == list(range(15))
+        queue.push({"job": 20})
+        assert [queue.get()["job"] for _ in range(6)] == list(range(15, 21))
+        assert queue.empty is True and queue.spilled is False
+
+    with pytest.raises(ValueError):
+        PersistentQueue(str(tmp_path), memory_items=0)
+
+
+def test_persistent_queue_reclaims_segments(tmp_path) -> None:
+    queue: PersistentQueue[bytes] = PersistentQueue(str(tmp_path), memory_items=2, segment_size=64)
+    for _ in range(10):
+        queue.push(b"x" * 30)
+    assert len(segment_files(str(tmp_path))) == 10
+
+    for _ in range(8):
+        queue.get()
+    assert len(segment_files(str(tmp_path))) == 3
+    queue.close()
+
+
+def test_persistent_queue_recovers(tmp_path) -> None:
+    queue: PersistentQueue[int] = PersistentQueue(str(tmp_path), memory_items=2, segment_size=64)
+    for i in range(10):
+        queue.push(i)
+    assert [queue.get(), queue.get()] == [0, 1]
+    queue.sync()
+    queue.get()
+
+    # The crash: the queue is never closed, so the item got after the sync is got again
+    del queue
+    # End of the last record in the last segment, the segment is changed when the record doesn't fit in it
+    torn_offset: int = 0
+    for i in range(10):
+        record_size: int = RECORD_HEADER.size + len(pickle.dumps(i, pickle.HIGHEST_PROTOCOL))
+        torn_offset = torn_offset + record_size if torn_offset + record_size <= 64 else record_size
+    with open(os.path.join(str(tmp_path), segment_files(str(tmp_path))[-1]), "r+b") as file:
+        file.seek(torn_offset)
+        file.write(RECORD_HEADER.pack(100, 0) + b"torn")
+
+    recovered: PersistentQueue[int] = PersistentQueue(str(tmp_path), memory_items=2, segment_size=64)
+    assert len(recovered) == 8
+    recovered.push(10)
+    assert list(recovered) == list(range(2, 11))
+    assert [recovered.get() for _ in range(9)] == list(range(2, 11))
+    recovered.close()
+
+    with PersistentQueue(str(tmp_path)) as reopened:
+        assert reopened.empty is True
@@ -0,0 +1,137 @@
+# Task 9 bench_user.py
+import os
+import re
+import timeit
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from user import EMAIL_PATTERN, PasswordHasher, User, is_strong_password
+
+
+USERS_COUNT: int = 100_000
+HASH_SETTINGS: list[tuple[str, int]] = [
+    ("scrypt", 2**12),
+    ("scrypt", 2**14),
+    ("scrypt", 2**15),
+    ("pbkdf2_sha256", 100_000),
+    ("pbkdf2_sha256", 600_000),
+]
+VERIFICATIONS_COUNT: int = 32
+
+# Creating benchmarks measure the users themselves, the hashing is measured by 'bench_password_hashing'
+User.password_hasher = PasswordHasher("pbkdf2_sha256", cost=1)
+
+
+class LegacyUser:
+    """The user as it was before '__slots__': the '__dict__' per instance and '__setattr__' guarding every write."""
+
+    __private_attrs: set[str] = {"name", "age", "gender", "address"}
+
+    def __init__(self, name: str, password: str, age: int, gender: str, address: str, email: str | None = None) -> None:
+        self.name: str = name
+        self.age: int = age
+        self.gender: str = gender
+        self.address: str = address
+        self.__password: str = password
+        self.__email: str | None = email
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if (name in self.__private_attrs) and (name in self.__dict__):
+            raise AttributeError(f"You can't change the value of attribute '{name}' after initialization")
+        super().__setattr__(name, value)
+
+
+def legacy_validate(password: str, email: str) -> None:
+    """Validate the password and the email the way 'User' did before, compiling the patterns on every call."""
+    password_pattern = re.compile(r"(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[#@$!%*?&])[A-Za-z\d#@$!%*?&]{8,}$")
+    email_pattern = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    if not password_pattern.match(password) or not email_pattern.match(email):
+        raise ValueError("Incorrect row")
+
+
+def validate(password: str, email: str) -> None:
+    """Validate the password and the email with the precompiled pattern and the password scanner."""
+    if not is_strong_password(password) or not EMAIL_PATTERN.match(email):
+        raise ValueError("Incorrect row")
+
+
+def bench_bulk_create() -> None:
+    """Print the throughput of the legacy and the current validators, and of the one by one and the bulk creation."""
+    rows: list[tuple[str, str, int, str, str, str]] = [
+        (f"User {i}", f"{i:08d}#passWORD", 18 + i % 60, "female", "Samara", f"user{i}@mail.ru")
+        for i in range(USERS_COUNT)
+    ]
+
+    cases = {
+        "legacy validators": lambda: [legacy_validate(row[1], row[5]) for row in rows],
+        "validators": lambda: [validate(row[1], row[5]) for row in rows],
+        "User()": lambda: [User(*row) for row in rows],
+        "User.bulk_create": lambda: User.bulk_create(rows),
+    }
+
+    print(f"{USERS_COUNT} users")
+    for name, run in cases.items():
+        seconds: float = timeit.timeit(run, number=1)
+        print(f"{name:>18}: {USERS_COUNT / seconds:>10.0f} rows/s")
+
+
+def measure_memory(factory: Callable[[], list]) -> int:
+    """Get the number of bytes allocated by the factory call and still alive."""
+    tracemalloc.start()
+    result = factory()  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def bench_memory() -> None:
+    """Print the per user memory and the construction throughput of the legacy and the slotted users."""
+    rows: list[tuple[str, str, int, str, str, str]] = [
+        (f"User {i}", f"{i:08d}#passWORD", 18 + i % 60, "female", "Samara", f"user{i}@mail.ru")
+        for i in range(USERS_COUNT)
+    ]
+    # The field values are shared by all the users, but every User also keeps its own password hash string
+    factories: dict[str, Callable[[], list]] = {
+        "LegacyUser()": lambda: [LegacyUser(*row) for row in rows],
+        "User()": lambda: [User(*row) for row in rows],
+        "User.bulk_create": lambda: User.bulk_create(rows)[0],
+    }
+
+    print(f"{'users':>18} | {'bytes/user':>10} | {'users/s':>10}")
+    for name, factory in factories.items():
+        memory: int = measure_memory(factory)
+        seconds: float = timeit.timeit(factory, number=1)
+        print(f"{name:>18} | {memory / USERS_COUNT:>10.1f} | {USERS_COUNT / seconds:>10.0f}")
+
+
+def bench_password_hashing() -> None:
+    """Print the verifications per second per core for every cost setting, in one thread and in the thread pool."""
+    cores: int = os.cpu_count() or 1
+    password: str = "166161#passWORD"
+
+    print(f"{cores} cores, {VERIFICATIONS_COUNT} verifications")
+    print(f"{'algorithm':>14} | {'cost':>8} | {'1 thread, /s':>12} | {'pool, /s/core':>13} | {'cached, /s':>10}")
+    for algorithm, cost in HASH_SETTINGS:
+        hasher = PasswordHasher(algorithm, cost, cache_size=0)
+        password_hash: str = hasher.hash(password)
+
+        one_thread: float = timeit.timeit(lambda: hasher.verify(password_hash, password), number=VERIFICATIONS_COUNT)
+        hashes, passwords = [password_hash] * VERIFICATIONS_COUNT, [password] * VERIFICATIONS_COUNT
+        with ThreadPoolExecutor(cores) as executor:
+            in_pool: float = timeit.timeit(lambda: list(executor.map(hasher.verify, hashes, passwords)), number=1)
+
+        cached_hasher = PasswordHasher(algorithm, cost)
+        cached_hasher.verify(password_hash, password)
+        cached: float = timeit.timeit(lambda: cached_hasher.verify(password_hash, password), number=10_000)
+
+        print(
+            f"{algorithm:>14} | {cost:>8} | {VERIFICATIONS_COUNT / one_thread:>12.1f} | "
+            f"{VERIFICATIONS_COUNT / in_pool / cores:>13.1f} | {10_000 / cached:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    bench_bulk_create()
+    bench_memory()
+    bench_password_hashing()
@@ -0,0 +1,55 @@
+# Task 9 bench_user_directory.py
+import timeit
+from typing import Callable
+
+from user import PasswordHasher, User
+from user_directory import UserDirectory
+
+
+USERS_COUNT: int = 1_000_000
+ADDRESSES: list[str] = [f"City {i}" for i in range(1_000)]
+
+# The users are only looked up, so their passwords are hashed with the cheapest cost
+User.password_hasher = PasswordHasher("pbkdf2_sha256", cost=1)
+
+
+def create_users() -> list[User]:
+    """Get the users with the unique emails, 1000 addresses and ages from 1 to 100."""
+    rows = [
+        (f"User {i}", "166161#passWORD", 1 + i % 100, ("female", "male")[i % 2], ADDRESSES[i % 1_000], f"u{i}@mail.ru")
+        for i in range(USERS_COUNT)
+    ]
+    return User.bulk_create(rows)[0]
+
+
+def bench_lookups(number: int = 5) -> None:
+    """Print the lookup latency of scanning the list of 1M users and of the directory indexes."""
+    users: list[User] = create_users()
+    build: float = timeit.timeit(lambda: UserDirectory(users), number=1)
+    directory = UserDirectory(users)
+
+    lookups: dict[str, tuple[Callable[[], object], Callable[[], object]]] = {
+        "email": (
+            lambda: next(user for user in users if user.email == "u999999@mail.ru"),
+            lambda: directory.get_by_email("u999999@mail.ru"),
+        ),
+        "address": (
+            lambda: [user for user in users if user.address == "City 500"],
+            lambda: directory.find_by_address("City 500"),
+        ),
+        "age 30-32": (
+            lambda: [user for user in users if 30 <= user.age <= 32],
+            lambda: directory.find_by_age(30, 32),
+        ),
+    }
+
+    print(f"{USERS_COUNT} users, directory built in {build:.2f} s")
+    print(f"{'lookup':>10} | {'list scan, ms':>13} | {'directory, ms':>13}")
+    for name, (scan, indexed) in lookups.items():
+        by_scan: float = timeit.timeit(scan, number=number) / number
+        by_index: float = timeit.timeit(indexed, number=number) / number
+        print(f"{name:>10} | {by_scan * 1e3:>13.3f} | {by_index * 1e3:>13.3f}")
+
+
+if __name__ == "__main__":
+    bench_lookups()
@@ -1,9 +1,28 @@
 # Task 9 test_user.py
+import asyncio
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import pytest
-from user import User, EmailPatternError, PasswordError
+from user import (
+    EmailPatternError,
+    NegativeOrZeroAgeError,
+    PasswordError,
+    PasswordHasher,
+    User,
+    derive_key,
+    is_strong_password,
+)
 
 
 # Fixtures
+@pytest.fixture(autouse=True)
+def fixture_cheap_password_hasher(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Users are hashed with the cheapest cost, the hashing itself is checked by the hasher tests
+    monkeypatch.setattr(User, "password_hasher", PasswordHasher("pbkdf2_sha256", cost=1))
+
+
 @pytest.fixture(name="aduch")
 def fixture_user() -> User:
     return User("Aduch", "166161#passWORD", 8, "male", "Piter")
@@ -28,6 +47,17 @@ def test_user_private_attrs(aduch) -> None:
         aduch.address = "Amsterdam"
 
 
+def test_user_slots(aduch) -> None:
+    assert not hasattr(aduch, "__dict__")
+    with pytest.raises(AttributeError):
+        aduch.nickname = "Aduchik"
+    with pytest.raises(AttributeError):
+        del aduch.name
+    with pytest.raises(AttributeError):
+        del aduch.email
+    assert User.name.__get__(None, User) is User.name
+
+
 def test_user_validate_email(aduch) -> None:
     with pytest.raises(EmailPatternError):
         aduch.email = "incorrect@email"
@@ -43,3 +73,111 @@ def test_user_validate_password(aduch) -> None:
         aduch.change_password("166161#passWORD", "123insorect")
     with pytest.raises(PasswordError):
         User("New Aduch", "inCor@", 12, "male", "Ryazan", "correct@mail.ru")
+
+
+def test_is_strong_password() -> None:
+    assert is_strong_password("166161#passWORD") is True
+    assert is_strong_password("passWORD#") is False
+    assert is_strong_password("166161#password") is False
+    assert is_strong_password("166161#passWORD ") is False
+
+
+def test_is_strong_password_matches_old_pattern() -> None:
+    pattern = re.compile(r"(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[#@$!%*?&])[A-Za-z\d#@$!%*?&]{8,}$")
+    passwords = ["166161#passWORD\n", "166161#passWORD\n\n", "\n166161#passWORD", "Abcde1#\n", "Abcdef1#\n", "Ab1#"]
+    passwords += ["166161#pass\nWORD", "١٢٣#passWORD", "166161#passWORD\r"]
+    for password in passwords:
+        assert is_strong_password(password) is bool(pattern.match(password)), repr(password)
+
+
+def test_user_bulk_create() -> None:
+    rows = [
+        ("Aduch", "166161#passWORD", 8, "male", "Piter"),
+        ("Bad", "short", 0, "male", "Piter", "incorrect@email"),
+        ("Mail", "166161#passWORD", 9, "female", "Samara", "correct@mail.ru"),
+        ("Short row",),
+    ]
+    users, errors = User.bulk_create(rows)
+
+    assert [repr(user) for user in users] == [
+        "User('Aduch', 'CONFIDENTIALLY', 8, 'male', 'Piter', 'None')",
+        "User('Mail', 'CONFIDENTIALLY', 9, 'female', 'Samara', 'correct@mail.ru')",
+    ]
+    assert [type(error) for error in errors[1]] == [NegativeOrZeroAgeError, PasswordError, EmailPatternError]
+    assert [type(error) for error in errors[3]] == [TypeError]
+    assert sorted(errors) == [1, 3]
+
+    with pytest.raises(AttributeError):
+        users[0].name = "NotAduch"
+    users[0].change_password("166161#passWORD", "new#passWORD1")
+
+
+# Password hashing tests
+def test_user_password_is_hashed(aduch) -> None:
+    assert aduch.check_password("166161#passWORD") is True
+    assert aduch.check_password("166161#passWORd") is False
+    assert "166161#passWORD" not in [getattr(aduch, slot) for slot in ("_User__password_hash", "_User__email")]
+
+    aduch.change_password("166161#passWORD", "new#passWORD1")
+    assert aduch.check_password("new#passWORD1") is True
+    with pytest.raises(PasswordError):
+        aduch.change_password("166161#passWORD", "other#passWORD1")
+
+
+def test_user_password_hasher_is_set_by_class() -> None:
+    class ScryptUser(User):
+        __slots__ = ()
+        password_hasher = PasswordHasher("scrypt", cost=2**4)
+
+    user = ScryptUser("Aduch", "166161#passWORD", 8, "male", "Piter")
+    assert user._User__password_hash.startswith("scrypt$16$")
+    assert user.check_password("166161#passWORD") is True
+
+
+def test_password_hasher() -> None:
+    hasher = PasswordHasher("pbkdf2_sha256", cost=1_000, cache_size=1)
+    first, second = hasher.hash("166161#passWORD"), hasher.hash("166161#passWORD")
+    assert first != second
+    assert first.startswith("pbkdf2_sha256$1000$")
+    assert hasher.verify(first, "166161#passWORD") and hasher.verify(second, "166161#passWORD")
+    assert not hasher.verify(first, "wrong")
+
+    assert hasher.needs_rehash(first) is False
+    assert PasswordHasher("pbkdf2_sha256", cost=2_000).needs_rehash(first) is True
+    assert PasswordHasher("pbkdf2_sha256", cost=2_000).verify(first, "166161#passWORD") is True
+
+    with pytest.raises(ValueError):
+        PasswordHasher("md5")
+    with pytest.raises(ValueError):
+        PasswordHasher("scrypt", cost=1_000)
+    with pytest.raises(ValueError):
+        PasswordHasher.calibrate(0.001, "md5")
+    with pytest.raises(ValueError):
+        derive_key("md5", "166161#passWORD", bytes(16), 1_000)
+    with pytest.raises(ValueError):
+        hasher.verify(first.replace("pbkdf2_sha256", "md5", 1), "166161#passWORD")
+
+    calibrated = PasswordHasher.calibrate(0.001, "scrypt")
+    assert calibrated.cost >= 2
+    assert calibrated.verify(calibrated.hash("166161#passWORD"), "166161#passWORD") is True
+    for cost in (2, 4):
+        scrypt_hasher = PasswordHasher("scrypt", cost=cost)
+        assert scrypt_hasher.verify(scrypt_hasher.hash("166161#passWORD"), "166161#passWORD") is True
+    assert pickle.loads(pickle.dumps(hasher)).verify(first, "166161#passWORD") is True
+
+
+def test_password_hasher_async() -> None:
+    hasher = PasswordHasher("scrypt", cost=2**10)
+
+    async def run(executor) -> None:
+        password_hash: str = await hasher.hash_async("166161#passWORD", executor)
+        assert await hasher.verify_async(password_hash, "166161#passWORD", executor) is True
+        assert await hasher.verify_async(password_hash, "wrong", executor) is False
+
+    with ThreadPoolExecutor(2) as threads, ProcessPoolExecutor(1) as processes:
+        asyncio.run(run(None))
+        asyncio.run(run(threads))
+        asyncio.run(run(processes))
+
+        users, _ = User.bulk_create([("Aduch", "166161#passWORD", 8, "male", "Piter")], executor=threads)
+        assert asyncio.run(users[0].check_password_async("166161#passWORD")) is True
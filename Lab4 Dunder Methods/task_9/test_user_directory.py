@@ -0,0 +1,111 @@
+# Task 9 test_user_directory.py
+import pickle
+import weakref
+
+import pytest
+from user import DuplicateEmailError, PasswordHasher, User
+from user_directory import UserDirectory
+
+
+# Fixtures
+@pytest.fixture(autouse=True)
+def fixture_cheap_password_hasher(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Users are hashed with the cheapest cost, the hashing itself is checked by the hasher tests
+    monkeypatch.setattr(User, "password_hasher", PasswordHasher("pbkdf2_sha256", cost=1))
+
+
+@pytest.fixture(name="users")
+def fixture_users() -> list[User]:
+    rows = [
+        ("Aduch", "166161#passWORD", 8, "male", "Piter", "aduch@mail.ru"),
+        ("Olga", "166161#passWORD", 30, "female", "Samara", "olga@mail.ru"),
+        ("Ivan", "166161#passWORD", 18, "male", "Samara"),
+        ("Anna", "166161#passWORD", 18, "female", "Piter", "anna@mail.ru"),
+    ]
+    return User.bulk_create(rows)[0]
+
+
+@pytest.fixture(name="directory")
+def fixture_directory(users: list[User]) -> UserDirectory:
+    return UserDirectory(users)
+
+
+# UserDirectory tests
+def test_directory_lookups(directory: UserDirectory, users: list[User]) -> None:
+    aduch, olga, ivan, anna = users
+    assert len(directory) == 4
+    assert list(directory) == users
+    assert directory.get_by_email("olga@mail.ru") is olga
+    assert directory.get_by_email("nobody@mail.ru") is None
+    assert directory.find_by_address("Samara") == [olga, ivan]
+    assert directory.find_by_gender("female") == [olga, anna]
+    assert directory.find_by_age(10, 30) == [ivan, anna, olga]
+    assert directory.find_by_age(9, 17) == []
+
+
+def test_directory_add_remove(directory: UserDirectory, users: list[User]) -> None:
+    aduch, olga, ivan, anna = users
+    with pytest.raises(ValueError):
+        directory.add(aduch)
+    with pytest.raises(DuplicateEmailError):
+        directory.add(User("Other", "166161#passWORD", 40, "male", "Moscow", "olga@mail.ru"))
+
+    directory.remove(ivan)
+    assert ivan not in directory
+    assert directory.find_by_address("Samara") == [olga]
+    assert directory.find_by_age(18, 18) == [anna]
+    with pytest.raises(ValueError):
+        directory.remove(ivan)
+
+    # The removed user is not tracked any more
+    ivan.email = "aduch@mail.ru"
+
+
+def test_directory_follows_email_setter(directory: UserDirectory, users: list[User]) -> None:
+    aduch, olga, ivan, anna = users
+    other = UserDirectory([aduch])
+
+    aduch.email = "new@mail.ru"
+    assert directory.get_by_email("new@mail.ru") is aduch
+    assert other.get_by_email("new@mail.ru") is aduch
+    assert directory.get_by_email("aduch@mail.ru") is None
+
+    with pytest.raises(DuplicateEmailError):
+        aduch.email = "olga@mail.ru"
+    assert aduch.email == "new@mail.ru"
+
+    ivan.email = "ivan@mail.ru"
+    assert directory.get_by_email("ivan@mail.ru") is ivan
+    ivan.email = None
+    assert directory.get_by_email("ivan@mail.ru") is None
+
+
+def test_directory_rejects_incomparable_fields(directory: UserDirectory, users: list[User]) -> None:
+    aduch, olga, ivan, anna = users
+    # The address is accepted by the address index, the gender can't be sorted with the other genders
+    other = User("Other", "166161#passWORD", 40, None, "Moscow", "other@mail.ru")
+    with pytest.raises(TypeError):
+        directory.add(other)
+
+    assert other not in directory and len(directory) == 4
+    assert directory.get_by_email("other@mail.ru") is None
+    assert directory.find_by_address("Moscow") == []
+    assert directory.find_by_gender("female") == [olga, anna]
+    directory.add(User("Other", "166161#passWORD", 40, "male", "Moscow", "other@mail.ru"))
+    assert [user.name for user in directory.find_by_address("Moscow")] == ["Other"]
+
+
+def test_directory_is_freed_when_dropped(users: list[User]) -> None:
+    aduch, olga, ivan, anna = users
+    directory = UserDirectory([aduch, olga])
+    directory_ref = weakref.ref(directory)
+    del directory
+    assert directory_ref() is None
+
+    # The dropped directory doesn't check the emails any more
+    aduch.email = "olga@mail.ru"
+    assert aduch.email == "olga@mail.ru"
+
+    copy = pickle.loads(pickle.dumps(aduch))
+    assert copy.email == "olga@mail.ru" and copy.name == "Aduch"
+    UserDirectory([copy]).remove(copy)
@@ -1,19 +1,323 @@
 # Task 9 user.py
+import asyncio
+import hashlib
+import hmac
+import os
 import re
-from typing import Any
+import string
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+if TYPE_CHECKING:
+    from user_directory import UserDirectory
 
 
 # fmt: off
 class NegativeOrZeroAgeError(Exception): ...
 class EmailPatternError(Exception): ...
 class PasswordError(Exception): ...
+class DuplicateEmailError(Exception): ...
 # fmt: on
 
 
+EMAIL_PATTERN: re.Pattern[str] = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
+PASSWORD_UPPERCASE: frozenset[str] = frozenset(string.ascii_uppercase)
+PASSWORD_LOWERCASE: frozenset[str] = frozenset(string.ascii_lowercase)
+PASSWORD_DIGITS: frozenset[str] = frozenset(string.digits)
+PASSWORD_SPECIAL: frozenset[str] = frozenset("#@$!%*?&")
+PASSWORD_MIN_LENGTH: int = 8
+PASSWORD_ALPHABET: frozenset[str] = PASSWORD_UPPERCASE | PASSWORD_LOWERCASE | PASSWORD_DIGITS | PASSWORD_SPECIAL
+
+
+def is_strong_password(password: str) -> bool:
+    """
+    Check that the password has at least 8 characters, an uppercase letter, a lowercase letter, a digit and a special
+    character, and has no other characters. Every character class is checked by one set lookup pass over the password.
+    """
+    # One trailing newline is allowed and not counted, like '$' of the password regex this check has replaced
+    if password.endswith("\n"):
+        password = password[:-1]
+    if len(password) < PASSWORD_MIN_LENGTH:
+        return False
+
+    if PASSWORD_ALPHABET.issuperset(password):
+        has_digit: bool = not PASSWORD_DIGITS.isdisjoint(password)
+    # Besides the ASCII ones any decimal digits are allowed, like '\d' does
+    elif all(char in PASSWORD_ALPHABET or char.isdecimal() for char in password):
+        has_digit = True
+    else:
+        return False
+
+    return (
+        has_digit
+        and not PASSWORD_UPPERCASE.isdisjoint(password)
+        and not PASSWORD_LOWERCASE.isdisjoint(password)
+        and not PASSWORD_SPECIAL.isdisjoint(password)
+    )
+
+
+# Minimal and maximal costs of the key derivation algorithms:
+# 'scrypt' cost is its CPU/memory cost 'n' (a power of two), 'pbkdf2_sha256' cost is the number of iterations
+PASSWORD_HASH_COSTS: dict[str, tuple[int, int]] = {"scrypt": (2, 2**20), "pbkdf2_sha256": (1, 2**30)}
+SCRYPT_BLOCK_SIZE: int = 8
+SCRYPT_PARALLELISM: int = 1
+KEY_SIZE: int = 32
+
+
+def derive_key(algorithm: str, password: str, salt: bytes, cost: int) -> bytes:
+    """
+    Get the key derived from the password, the function can be sent to the process pool.
+
+    Parameters
+    ----------
+    algorithm : str
+        Key derivation algorithm, 'scrypt' or 'pbkdf2_sha256'.
+    password : str
+        Password to derive the key from.
+    salt : bytes
+        Random salt of the password.
+    cost : int
+        Cost of the derivation.
+
+    Returns
+    -------
+    bytes
+        Derived key.
+
+    Raises
+    ------
+    ValueError
+        If the algorithm is unknown.
+    """
+    if algorithm == "scrypt":
+        # OpenSSL needs 128 * r * (n + p + 2) bytes, the limit has the 1 MiB margin above it
+        maxmem: int = 128 * SCRYPT_BLOCK_SIZE * (cost + SCRYPT_PARALLELISM + 2) + 2**20
+        return hashlib.scrypt(
+            password.encode(),
+            salt=salt,
+            n=cost,
+            r=SCRYPT_BLOCK_SIZE,
+            p=SCRYPT_PARALLELISM,
+            maxmem=maxmem,
+            dklen=KEY_SIZE,
+        )
+    if algorithm == "pbkdf2_sha256":
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, cost, KEY_SIZE)
+    raise ValueError(f"Algorithm must be one of {', '.join(PASSWORD_HASH_COSTS)}")
+
+
+class PasswordHasher:
+    """
+    Represents the salted password hashing with the tunable cost.
+
+    The hash is kept as the string 'algorithm$cost$salt$key', so the hashes made with the old cost are still verified
+    after the cost is changed. The recent successful verifications are kept in the bounded LRU cache, the cache keys
+    are the keyed digests of the hashes and the passwords, so the cache does not keep the passwords themselves.
+    """
+
+    def __init__(
+        self, algorithm: str = "scrypt", cost: int = 2**14, salt_size: int = 16, cache_size: int = 1024
+    ) -> None:
+        """
+        Parameters
+        ----------
+        algorithm : str, optional
+            Key derivation algorithm, 'scrypt' or 'pbkdf2_sha256', by default 'scrypt'
+        cost : int, optional
+            Cost of the derivation, a power of two for 'scrypt', by default 2**14
+        salt_size : int, optional
+            Number of the random salt bytes, by default 16
+        cache_size : int, optional
+            Maximum number of the cached successful verifications, 0 to disable the cache, by default 1024
+
+        Raises
+        ------
+        ValueError
+            If the algorithm is unknown or the cost is out of the algorithm bounds.
+        """
+        if algorithm not in PASSWORD_HASH_COSTS:
+            raise ValueError(f"Algorithm must be one of {', '.join(PASSWORD_HASH_COSTS)}")
+        min_cost, max_cost = PASSWORD_HASH_COSTS[algorithm]
+        if not min_cost <= cost <= max_cost or (algorithm == "scrypt" and cost & (cost - 1)):
+            raise ValueError(f"Cost of '{algorithm}' must be from {min_cost} to {max_cost}")
+
+        self.__algorithm: str = algorithm
+        self.__cost: int = cost
+        self.__salt_size: int = salt_size
+        self.__cache_size: int = cache_size
+        self.__cache: OrderedDict[bytes, None] = OrderedDict()
+        self.__cache_lock: threading.Lock = threading.Lock()
+        self.__cache_key: bytes = os.urandom(KEY_SIZE)
+
+    @classmethod
+    def calibrate(cls, budget: float, algorithm: str = "scrypt", **kwargs: Any) -> "PasswordHasher":
+        """
+        Get the hasher with the greatest power of two cost which hashes the password within the time budget.
+
+        Parameters
+        ----------
+        budget : float
+            Maximum number of seconds to hash one password.
+        algorithm : str, optional
+            Key derivation algorithm, by default 'scrypt'
+        **kwargs : Any
+            Other parameters of the hasher.
+
+        Raises
+        ------
+        ValueError
+            If the algorithm is unknown.
+        """
+        if algorithm not in PASSWORD_HASH_COSTS:
+            raise ValueError(f"Algorithm must be one of {', '.join(PASSWORD_HASH_COSTS)}")
+        min_cost, max_cost = PASSWORD_HASH_COSTS[algorithm]
+        cost: int = max(min_cost, 2)
+        while cost * 2 <= max_cost:
+            start: float = time.perf_counter()
+            derive_key(algorithm, "calibration", bytes(16), cost * 2)
+            if time.perf_counter() - start > budget:
+                break
+            cost *= 2
+        return cls(algorithm, cost, **kwargs)
+
+    @property
+    def algorithm(self) -> str:
+        """Get the key derivation algorithm."""
+        return self.__algorithm
+
+    @property
+    def cost(self) -> int:
+        """Get the cost of the new hashes."""
+        return self.__cost
+
+    def hash(self, password: str) -> str:
+        """Get the hash of the password with the new random salt."""
+        salt: bytes = os.urandom(self.__salt_size)
+        return self.__format(salt, derive_key(self.__algorithm, password, salt, self.__cost))
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        """Return True if the password matches the hash, or False."""
+        cache_key: bytes = self.__verification_key(password_hash, password)
+        if self.__cached(cache_key):
+            return True
+
+        algorithm, cost, salt, key = password_hash.split("$")
+        derived: bytes = derive_key(algorithm, password, bytes.fromhex(salt), int(cost))
+        return self.__check(cache_key, derived, bytes.fromhex(key))
+
+    async def hash_async(self, password: str, executor: Executor | None = None) -> str:
+        """Get the hash of the password derived in the executor, the default one of the event loop if None."""
+        salt: bytes = os.urandom(self.__salt_size)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        key: bytes = await loop.run_in_executor(executor, derive_key, self.__algorithm, password, salt, self.__cost)
+        return self.__format(salt, key)
+
+    async def verify_async(self, password_hash: str, password: str, executor: Executor | None = None) -> bool:
+        """
+        Check the password deriving its key in the executor, the default one of the event loop if None.
+        The cache is checked and updated in the event loop, so it works with the process pools too.
+        """
+        cache_key: bytes = self.__verification_key(password_hash, password)
+        if self.__cached(cache_key):
+            return True
+
+        algorithm, cost, salt, key = password_hash.split("$")
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        derived: bytes = await loop.run_in_executor(
+            executor, derive_key, algorithm, password, bytes.fromhex(salt), int(cost)
+        )
+        return self.__check(cache_key, derived, bytes.fromhex(key))
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Return True if the hash was made with the other algorithm or cost, or False."""
+        algorithm, cost, *_ = password_hash.split("$")
+        return algorithm != self.__algorithm or int(cost) != self.__cost
+
+    def __format(self, salt: bytes, key: bytes) -> str:
+        """Get the hash string of the derived key."""
+        return f"{self.__algorithm}${self.__cost}${salt.hex()}${key.hex()}"
+
+    def __verification_key(self, password_hash: str, password: str) -> bytes:
+        """Get the cache key of the verification, which doesn't reveal the password."""
+        return hmac.digest(self.__cache_key, f"{password_hash}\0{password}".encode(), "sha256")
+
+    def __check(self, cache_key: bytes, derived: bytes, key: bytes) -> bool:
+        """Compare the keys in constant time caching the successful verification."""
+        if not hmac.compare_digest(derived, key):
+            return False
+        self.__remember(cache_key)
+        return True
+
+    def __cached(self, cache_key: bytes) -> bool:
+        """Return True if the verification is cached moving it to the end of the cache, or False."""
+        with self.__cache_lock:
+            if cache_key not in self.__cache:
+                return False
+            self.__cache.move_to_end(cache_key)
+            return True
+
+    def __remember(self, cache_key: bytes) -> None:
+        """Cache the successful verification dropping the least recently used one if the cache is full."""
+        if self.__cache_size == 0:
+            return
+        with self.__cache_lock:
+            self.__cache[cache_key] = None
+            if len(self.__cache) > self.__cache_size:
+                self.__cache.popitem(last=False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state to send the hasher to the process pool, without the lock and the cache."""
+        state: dict[str, Any] = dict(vars(self))
+        del state["_PasswordHasher__cache_lock"]
+        state["_PasswordHasher__cache"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        vars(self).update(state)
+        self.__cache_lock = threading.Lock()
+
+
+class FrozenField:
+    """Represents the attribute which is set once by the constructor and can't be changed after that."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.__name: str = name
+        # The value is kept in the private slot of the same name, which the constructor sets directly
+        self.__slot: Any = owner.__dict__[f"_{owner.__name__}__{name}"]
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        return self.__slot.__get__(instance, owner)
+
+    def __set__(self, instance: object, value: Any) -> None:
+        raise AttributeError(f"You can't change the value of attribute '{self.__name}' after initialization")
+
+    def __delete__(self, instance: object) -> None:
+        raise AttributeError(f"You can't delete attribute with name '{self.__name}'")
+
+
 class User:
-    """Represents the user."""
+    """
+    Represents the user.
+
+    Passwords are hashed by the 'password_hasher' of the class, the slow scrypt one by default. The code which doesn't
+    keep the real credentials, like the tests and the benchmarks, sets the cheap hasher on the class or its subclass.
+    """
 
-    __private_attrs: set[str] = {"name", "age", "gender", "address"}
+    __slots__ = ("__name", "__age", "__gender", "__address", "__password_hash", "__email", "__directories")
+
+    password_hasher: PasswordHasher = PasswordHasher()
+
+    name: FrozenField = FrozenField()
+    age: FrozenField = FrozenField()
+    gender: FrozenField = FrozenField()
+    address: FrozenField = FrozenField()
 
     def __init__(
         self, name: str, password: str, age: int, gender: str, address: str, email: str | None = None
@@ -44,12 +348,14 @@ class User:
         EmailPatternError
             If given email didn't match the pattern 'youremail@site.com'.
         """
-        self.name: str = name
-        self.age: int = self.__validate_age(age)
-        self.gender: str = gender
-        self.address: str = address
-        self.__password: str = self.__validate_password(password)
+        self.__name: str = name
+        self.__age: int = self.__validate_age(age)
+        self.__gender: str = gender
+        self.__address: str = address
+        self.__password_hash: str = self.password_hasher.hash(self.__validate_password(password))
         self.__email: str | None = self.__validate_email(email)
+        # Directories are weak references, so the user doesn't keep the dropped directory alive
+        self.__directories: tuple[weakref.ref[UserDirectory], ...] = ()
 
     @property
     def email(self) -> str | None:
@@ -65,8 +371,61 @@ class User:
         ------
         EmailPatternError
             If given email didn't match the pattern 'youremail@site.com'.
+        DuplicateEmailError
+            If the email belongs to the other user of one of the user's directories.
+        """
+        new_e = self.__validate_email(new_e)
+        directories: list[UserDirectory] = self.__live_directories()
+        for directory in directories:
+            directory._check_email(self, new_e)
+
+        old_e: str | None = self.__email
+        self.__email = new_e
+        for directory in directories:
+            directory._move_email(self, old_e, new_e)
+
+    def _attach(self, directory: "UserDirectory") -> None:
+        """Notify the directory about the email changes, called by the directory when the user is added."""
+        self.__directories += (weakref.ref(directory),)
+
+    def _detach(self, directory: "UserDirectory") -> None:
+        """Stop notifying the directory, called by the directory when the user is removed."""
+        self.__directories = tuple(ref for ref in self.__directories if ref() not in (directory, None))
+
+    def __live_directories(self) -> list["UserDirectory"]:
+        """Get the directories of the user which still exist, the references to the freed ones are dropped."""
+        directories: list[UserDirectory] = [directory for ref in self.__directories if (directory := ref()) is not None]
+        if len(directories) != len(self.__directories):
+            self.__directories = tuple(weakref.ref(directory) for directory in directories)
+        return directories
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        """Get the state to pickle the user without the weak references, so the copy is in none of the directories."""
+        _, slots = object.__getstate__(self)
+        del slots["_User__directories"]
+        return None, slots
+
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None:
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self.__directories = ()
+
+    def check_password(self, password: str) -> bool:
+        """Return True if the password is the user's password, or False."""
+        return self.password_hasher.verify(self.__password_hash, password)
+
+    async def check_password_async(self, password: str, executor: Executor | None = None) -> bool:
         """
-        self.__email = self.__validate_email(new_e)
+        Check the password in the executor, so the event loop is not blocked.
+
+        Parameters
+        ----------
+        password : str
+            Password to check.
+        executor : Executor | None, optional
+            Thread or process pool to hash the password, by default None, the default one of the event loop.
+        """
+        return await self.password_hasher.verify_async(self.__password_hash, password, executor)
 
     def change_password(self, old_p: str, new_p: str) -> None:
         """
@@ -85,30 +444,83 @@ class User:
             If password didn't contain at least one uppercase letter (A-Z), one lowercase letter (a-z),
             one digit (0-9) and one special character from the '@$!%*?&' set
         """
-        if old_p != self.__password:
+        if not self.check_password(old_p):
             raise PasswordError(f"Password {old_p} is incorrect")
-        self.__password = self.__validate_password(new_p)
+        self.__password_hash = self.password_hasher.hash(self.__validate_password(new_p))
 
-    def __setattr__(self, name: str, value: Any) -> None:
+    @classmethod
+    def bulk_create(
+        cls, rows: Iterable[Sequence[Any]], executor: Executor | None = None
+    ) -> tuple[list["User"], dict[int, list[Exception]]]:
         """
-        Add the attribute with name 'name' and value 'value' or change it's value of existing attribute.
+        Create the users from the rows reporting all the incorrect ones.
+
+        Every row is checked completely, so all the errors of the row are reported together,
+        the users for the correct rows are created without validating them again.
 
         Parameters
         ----------
-        name : str
-            Name of the attribute.
-        value : Any
-            Value of the attribute.
+        rows : Iterable[Sequence[Any]]
+            Name, password, age, gender, address and optional email of every user.
+        executor : Executor | None, optional
+            Thread or process pool to hash the passwords, by default None, the passwords are hashed one by one.
 
-        Raises
-        ------
-        AttributeError
-            If the attribute contaiend in private attributes set ("name", "age", "gender", "address").
+        Returns
+        -------
+        tuple[list[User], dict[int, list[Exception]]]
+            Created users and the errors by the indexes of the incorrect rows.
         """
-        if (name in self.__private_attrs) and (name in self.__dict__):
-            raise AttributeError(f"You can't change the value of attribute '{name}' after initialization")
+        users: list[User] = []
+        passwords: list[str] = []
+        errors: dict[int, list[Exception]] = {}
+
+        for index, row in enumerate(rows):
+            if not 5 <= len(row) <= 6:
+                errors[index] = [TypeError(f"Row must have 5 or 6 fields, not {len(row)}")]
+                continue
+
+            name, password, age, gender, address = row[:5]
+            email = row[5] if len(row) == 6 else None
+
+            try:
+                cls.__validate_age(age)
+                cls.__validate_password(password)
+                cls.__validate_email(email)
+            except (TypeError, NegativeOrZeroAgeError, PasswordError, EmailPatternError):
+                errors[index] = cls.__row_errors(age, password, email)
+                continue
+
+            # The fields are already validated, so the user is built without the validating constructor
+            user: User = cls.__new__(cls)
+            user.__name = name
+            user.__age = age
+            user.__gender = gender
+            user.__address = address
+            user.__email = email
+            user.__directories = ()
+            users.append(user)
+            passwords.append(password)
+
+        hashes: Iterable[str] = (map if executor is None else executor.map)(cls.password_hasher.hash, passwords)
+        for user, password_hash in zip(users, hashes):
+            user.__password_hash = password_hash
+
+        return users, errors
 
-        super().__setattr__(name, value)
+    @classmethod
+    def __row_errors(cls, age: int, password: str, email: str | None) -> list[Exception]:
+        """Get all the errors of the incorrect row fields."""
+        row_errors: list[Exception] = []
+        for validate, value in ((cls.__validate_age, age), (cls.__validate_password, password)):
+            try:
+                validate(value)
+            except (TypeError, NegativeOrZeroAgeError, PasswordError) as error:
+                row_errors.append(error)
+        try:
+            cls.__validate_email(email)
+        except (TypeError, EmailPatternError) as error:
+            row_errors.append(error)
+        return row_errors
 
     def __delattr__(self, name: str) -> None:
         """Prohibits the deletion of object attributes."""
@@ -169,11 +581,10 @@ class User:
         if not isinstance(password, str):
             raise TypeError("Password type must be 'str'")
 
-        if len(password) < 8:
+        if len(password) < PASSWORD_MIN_LENGTH:
             raise PasswordError(f"Password '{password}' is too short")
 
-        pattern: re.Pattern[str] = re.compile(r"(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[#@$!%*?&])[A-Za-z\d#@$!%*?&]{8,}$")
-        if not pattern.match(password):
+        if not is_strong_password(password):
             raise PasswordError(
                 "Password must contain at least one uppercase letter (A-Z), one lowercase letter (a-z), "
                 "one digit (0-9) and one special character from the '@$!%*?&' set"
@@ -208,8 +619,7 @@ class User:
         if not isinstance(email, str):
             raise TypeError("Email type must be 'str'")
 
-        pattern: re.Pattern[str] = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
-        if not pattern.match(email):
+        if not EMAIL_PATTERN.match(email):
             raise EmailPatternError("Email should match the pattern 'youremail@site.com'")
 
         return email
@@ -0,0 +1,175 @@
+# Task 9 user_directory.py
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Generic, Hashable, Iterable, Iterator, TypeVar
+
+from user import DuplicateEmailError, User
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+class _Index(Generic[K]):
+    """
+    Represents the index of the users by the attribute value.
+
+    Users of every value are kept in the dict used as the ordered set, so they are found in the order of adding,
+    and the distinct values are kept sorted for the range queries.
+    """
+
+    def __init__(self) -> None:
+        self.__users: dict[K, dict[User, None]] = {}
+        self.__keys: list[K] = []
+
+    def add(self, key: K, user: User) -> None:
+        """Add the user with the given attribute value."""
+        users: dict[User, None] | None = self.__users.get(key)
+        if users is None:
+            # Sorted keys go first, so the key which can't be compared with the others leaves the index unchanged
+            insort(self.__keys, key)
+            users = self.__users[key] = {}
+        users[user] = None
+
+    def remove(self, key: K, user: User) -> None:
+        """Remove the user with the given attribute value."""
+        users: dict[User, None] = self.__users[key]
+        del users[user]
+        if not users:
+            del self.__users[key]
+            del self.__keys[bisect_left(self.__keys, key)]
+
+    def find(self, key: K) -> list[User]:
+        """Get the users with the given attribute value."""
+        return list(self.__users.get(key, ()))
+
+    def find_range(self, low: K, high: K) -> list[User]:
+        """Get the users with the attribute value from low to high inclusive, ordered by the value."""
+        users: list[User] = []
+        for key in self.__keys[bisect_left(self.__keys, low) : bisect_right(self.__keys, high)]:
+            users.extend(self.__users[key])
+        return users
+
+
+class UserDirectory:
+    """
+    Represents the collection of the users indexed by their email, address, gender and age.
+
+    Emails are unique in the directory. Other fields of the user can't be changed, and the email changes
+    made through the 'email' setter are passed to every directory of the user.
+    """
+
+    def __init__(self, users: Iterable[User] | None = None) -> None:
+        """
+        Parameters
+        ----------
+        users : Iterable[User] | None, optional
+            Initial users, by default None
+
+        Raises
+        ------
+        DuplicateEmailError
+            If two users have the same email.
+        """
+        self.__users: dict[User, None] = {}
+        # Users without email are kept in the indexes of the other fields only
+        self.__by_email: dict[str, User] = {}
+        self.__by_address: _Index[str] = _Index()
+        self.__by_gender: _Index[str] = _Index()
+        self.__by_age: _Index[int] = _Index()
+
+        if users is not None:
+            for user in users:
+                self.add(user)
+
+    def add(self, user: User) -> None:
+        """
+        Add the user to the directory.
+
+        Raises
+        ------
+        ValueError
+            If the user is already in the directory.
+        DuplicateEmailError
+            If the other user of the directory has the same email.
+        TypeError
+            If the address, gender or age of the user can't be compared with the ones of the other users.
+        """
+        if user in self.__users:
+            raise ValueError("User is already in the directory")
+        self._check_email(user, user.email)
+
+        # The user is added to the other indexes only if all the sorted ones have accepted it
+        indexed: list[tuple[_Index[Any], Any]] = []
+        try:
+            keys: tuple[Any, Any, Any] = (user.address, user.gender, user.age)
+            for index, key in zip((self.__by_address, self.__by_gender, self.__by_age), keys):
+                index.add(key, user)
+                indexed.append((index, key))
+        except TypeError:
+            for index, key in indexed:
+                index.remove(key, user)
+            raise
+
+        self.__users[user] = None
+        if user.email is not None:
+            self.__by_email[user.email] = user
+        user._attach(self)
+
+    def remove(self, user: User) -> None:
+        """
+        Remove the user from the directory.
+
+        Raises
+        ------
+        ValueError
+            If the user is not in the directory.
+        """
+        if user not in self.__users:
+            raise ValueError("User is not in the directory")
+
+        del self.__users[user]
+        if user.email is not None:
+            del self.__by_email[user.email]
+        self.__by_address.remove(user.address, user)
+        self.__by_gender.remove(user.gender, user)
+        self.__by_age.remove(user.age, user)
+        user._detach(self)
+
+    def get_by_email(self, email: str) -> User | None:
+        """Get the user with the given email, or None if there is no such user."""
+        return self.__by_email.get(email)
+
+    def find_by_address(self, address: str) -> list[User]:
+        """Get the users with the given address in the order of adding."""
+        return self.__by_address.find(address)
+
+    def find_by_gender(self, gender: str) -> list[User]:
+        """Get the users with the given gender in the order of adding."""
+        return self.__by_gender.find(gender)
+
+    def find_by_age(self, min_age: int, max_age: int) -> list[User]:
+        """Get the users which age is from min_age to max_age inclusive, ordered by age."""
+        return self.__by_age.find_range(min_age, max_age)
+
+    def _check_email(self, user: User, email: str | None) -> None:
+        """Raise DuplicateEmailError if the email belongs to the other user, called by the user email setter."""
+        owner: User | None = self.__by_email.get(email) if email is not None else None
+        if owner is not None and owner is not user:
+            raise DuplicateEmailError(f"Email '{email}' already belongs to the other user")
+
+    def _move_email(self, user: User, old_email: str | None, new_email: str | None) -> None:
+        """Index the user by the new email instead of the old one, called by the user email setter."""
+        if old_email is not None:
+            del self.__by_email[old_email]
+        if new_email is not None:
+            self.__by_email[new_email] = user
+
+    def __len__(self) -> int:
+        """Get the number of users in the directory."""
+        return len(self.__users)
+
+    def __contains__(self, user: object) -> bool:
+        return user in self.__users
+
+    def __iter__(self) -> Iterator[User]:
+        """Iterate over the users in the order of adding."""
+        return iter(list(self.__users))
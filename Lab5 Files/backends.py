@@ -0,0 +1,202 @@
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Iterator
+
+
+class StorageNotFoundError(Exception): ...
+
+
+class Backend(ABC):
+    @abstractmethod
+    def save(self, id: str, data: bytes) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def load(self, id: str) -> bytes:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete(self, id: str) -> None:
+        raise NotImplementedError()
+
+    # Streaming serializers write to and read from the file objects, backends without files buffer them in memory
+    def open_writer(self, id: str) -> BinaryIO:
+        return _WriteBuffer(self, id)
+
+    def open_reader(self, id: str) -> BinaryIO:
+        return io.BytesIO(self.load(id))
+
+
+# Saves the written bytes to the backend on close, unless the 'with' block has failed
+class _WriteBuffer(io.BytesIO):
+    def __init__(self, backend: Backend, id: str) -> None:
+        super().__init__()
+        self.__backend: Backend = backend
+        self.__id: str = id
+        self.__failed: bool = False
+
+    def close(self) -> None:
+        if not self.closed and not self.__failed:
+            self.__backend.save(self.__id, self.getvalue())
+        super().close()
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        self.__failed = exc_type is not None
+        super().__exit__(exc_type, *args)
+
+
+# Writes to the temporary file next to the target and replaces the target with it on close, unless the 'with' block
+# has failed, so the previous file is never replaced by the partly written one
+class _ReplacingWriter(io.BufferedWriter):
+    def __init__(self, path: str) -> None:
+        directory, name = os.path.split(path)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+        super().__init__(io.FileIO(fd, "wb"))
+        self.__path: str = path
+        self.__temp_path: str = temp_path
+        self.__failed: bool = False
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            super().close()
+        except BaseException:
+            os.remove(self.__temp_path)
+            raise
+        if self.__failed:
+            os.remove(self.__temp_path)
+        else:
+            os.replace(self.__temp_path, self.__path)
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        self.__failed = exc_type is not None
+        super().__exit__(exc_type, *args)
+
+
+class DirectoryBackend(Backend):
+    # Every storage is the file named by its id in the root directory, which is created on the first write
+    def __init__(self, root: str, suffix: str = "") -> None:
+        self.__root: str = root
+        self.__suffix: str = suffix
+        self.__root_created: bool = False
+
+    @property
+    def root(self) -> str:
+        return self.__root
+
+    def save(self, id: str, data: bytes) -> None:
+        with self.open_writer(id) as file:
+            file.write(data)
+
+    def load(self, id: str) -> bytes:
+        with self.open_reader(id) as file:
+            return file.read()
+
+    def delete(self, id: str) -> None:
+        try:
+            os.remove(self.__path(id))
+        except FileNotFoundError as error:
+            raise StorageNotFoundError(f"Storage {id} not found") from error
+
+    def open_writer(self, id: str) -> BinaryIO:
+        if not self.__root_created:
+            os.makedirs(self.__root, exist_ok=True)
+            self.__root_created = True
+        return _ReplacingWriter(self.__path(id))
+
+    def open_reader(self, id: str) -> BinaryIO:
+        try:
+            return open(self.__path(id), "rb")
+        except FileNotFoundError as error:
+            raise StorageNotFoundError(f"Storage {id} not found") from error
+
+    def __path(self, id: str) -> str:
+        return os.path.join(self.__root, f"{id}{self.__suffix}")
+
+
+class SqliteBackend(Backend):
+    # All the storages are in one database file, a row per storage
+    def __init__(self, path: str, table: str = "storages") -> None:
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name '{table}'")
+        self.__table: str = table
+        self.__in_batch: bool = False
+        self.__connection: sqlite3.Connection = sqlite3.connect(path)
+        # Commits of the write-ahead log are not synced to the disk one by one, so saving a storage is cheap
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        with self.__connection:
+            self.__connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, data BLOB NOT NULL)")
+
+    # Storages saved in the block are committed together at its end, or none of them if it fails
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        if self.__in_batch:
+            raise RuntimeError("Batch is already started")
+        self.__in_batch = True
+        try:
+            with self.__connection:
+                yield
+        finally:
+            self.__in_batch = False
+
+    def save(self, id: str, data: bytes) -> None:
+        query: str = f"INSERT OR REPLACE INTO {self.__table} (id, data) VALUES (?, ?)"
+        if self.__in_batch:
+            self.__connection.execute(query, (id, data))
+        else:
+            with self.__connection:
+                self.__connection.execute(query, (id, data))
+
+    def load(self, id: str) -> bytes:
+        row: tuple[bytes] | None = self.__connection.execute(
+            f"SELECT data FROM {self.__table} WHERE id = ?", (id,)
+        ).fetchone()
+        if row is None:
+            raise StorageNotFoundError(f"Storage {id} not found")
+        return row[0]
+
+    def delete(self, id: str) -> None:
+        query: str = f"DELETE FROM {self.__table} WHERE id = ?"
+        if self.__in_batch:
+            cursor: sqlite3.Cursor = self.__connection.execute(query, (id,))
+        else:
+            with self.__connection:
+                cursor = self.__connection.execute(query, (id,))
+        if cursor.rowcount == 0:
+            raise StorageNotFoundError(f"Storage {id} not found")
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    def __enter__(self) -> "SqliteBackend":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class MemoryBackend(Backend):
+    def __init__(self) -> None:
+        self.__data: dict[str, bytes] = {}
+
+    def save(self, id: str, data: bytes) -> None:
+        self.__data[id] = data
+
+    def load(self, id: str) -> bytes:
+        try:
+            return self.__data[id]
+        except KeyError as error:
+            raise StorageNotFoundError(f"Storage {id} not found") from error
+
+    def delete(self, id: str) -> None:
+        if self.__data.pop(id, None) is None:
+            raise StorageNotFoundError(f"Storage {id} not found")
+
+    def __len__(self) -> int:
+        return len(self.__data)
@@ -0,0 +1,52 @@
+import contextlib
+import os
+import tempfile
+import timeit
+from typing import Callable, ContextManager
+
+from backends import Backend, DirectoryBackend, MemoryBackend, SqliteBackend
+from serializers import JsonSerializer
+from storage import Item, Storage
+
+
+STORAGES_COUNT: int = 100_000
+
+
+def bench_backends() -> None:
+    storages: list[Storage] = [Storage([Item(f"item{i}"), Item(f"item{i + 1}")]) for i in range(STORAGES_COUNT)]
+    ids: list[str] = [str(storage.id) for storage in storages]
+
+    with tempfile.TemporaryDirectory() as path:
+        backends: dict[str, Callable[[], Backend]] = {
+            "directory": lambda: DirectoryBackend(os.path.join(path, "json"), ".json"),
+            "sqlite": lambda: SqliteBackend(os.path.join(path, "data.db")),
+            "sqlite batch": lambda: SqliteBackend(os.path.join(path, "batch.db")),
+            "memory": MemoryBackend,
+        }
+
+        print(f"{STORAGES_COUNT} storages of 2 items")
+        print(f"{'backend':>12} | {'write, storages/s':>17} | {'read, storages/s':>16}")
+        for name, make_backend in backends.items():
+            serializer = JsonSerializer(backend=make_backend())
+            batch: Callable[[], ContextManager[None]] = contextlib.nullcontext
+            if name == "sqlite batch":
+                batch = serializer.backend.batch  # type: ignore
+
+            def write() -> None:
+                with batch():
+                    for storage in storages:
+                        storage.write_to_file(serializer)
+
+            def read() -> None:
+                for id in ids:
+                    Storage.read_from_file(id, serializer=serializer)
+
+            by_write: float = timeit.timeit(write, number=1)
+            by_read: float = timeit.timeit(read, number=1)
+            print(f"{name:>12} | {STORAGES_COUNT / by_write:>17.0f} | {STORAGES_COUNT / by_read:>16.0f}")
+            if isinstance(serializer.backend, SqliteBackend):
+                serializer.backend.close()
+
+
+if __name__ == "__main__":
+    bench_backends()
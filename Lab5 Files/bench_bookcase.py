@@ -0,0 +1,55 @@
+import copy
+import timeit
+from decimal import Decimal
+
+from bookcase import Book, Bookcase, MaxWeightExcessError
+
+
+BOOKS_COUNTS: list[int] = [1_000, 10_000, 100_000]
+
+
+class LegacyBookcase(Bookcase):
+    # 'add' as it was before the items views and the running weight: deep copy of all the books on every call
+    def add(self, item: Book) -> None:
+        if sum(copy.deepcopy(list(self.items))) + item.weight > self.max_weight:  # type: ignore
+            raise MaxWeightExcessError("Total weight of books exceeds max weight of bookcase")
+        super().add(item)
+
+
+def make_books(count: int) -> list[Book]:
+    return [Book(f"book{i}", 1, f"author{i % 100}", Decimal("9.99")) for i in range(count)]
+
+
+def bench_add_latency() -> None:
+    print(f"{'books':>8} | {'legacy add(), ms':>16} | {'add(), us':>10}")
+    for count in BOOKS_COUNTS:
+        books: list[Book] = make_books(count)
+        legacy = LegacyBookcase(count * 2, books)
+        bookcase = Bookcase(count * 2, books)
+        number: int = max(1, 10_000 // count)
+        # Ids of the storage items are unique, so every call adds the new book
+        legacy_added = iter(make_books(number))
+        added = iter(make_books(1_000))
+
+        by_legacy: float = timeit.timeit(lambda: legacy.add(next(legacy_added)), number=number) / number
+        by_current: float = timeit.timeit(lambda: bookcase.add(next(added)), number=1_000) / 1_000
+        print(f"{count:>8} | {by_legacy * 1e3:>16.3f} | {by_current * 1e6:>10.3f}")
+
+
+def bench_bulk_add(count: int = 100_000) -> None:
+    books: list[Book] = make_books(count)
+
+    def add_all() -> None:
+        bookcase = Bookcase(count)
+        for book in books:
+            bookcase.add(book)
+
+    seconds: float = timeit.timeit(add_all, number=1)
+    # The legacy total is the sum of its per call costs, which grow linearly with the number of books
+    legacy_book_cost: float = timeit.timeit(lambda: copy.deepcopy(books[:1_000]), number=10) / 10 / 1_000
+    print(f"{count} x add(): {seconds:.2f} s, legacy estimate: {legacy_book_cost * count * count / 2 / 3600:.1f} h")
+
+
+if __name__ == "__main__":
+    bench_add_latency()
+    bench_bulk_add()
@@ -0,0 +1,38 @@
+import json
+import timeit
+from decimal import Decimal
+from typing import Any, Callable
+
+from bookcase import Book, Bookcase
+from serializers import BinarySerializer, _to_json
+
+
+BOOKS_COUNTS: list[int] = [100, 10_000, 100_000]
+
+
+def make_bookcase(count: int) -> Bookcase:
+    return Bookcase(count, [Book(f"book{i}", 1, f"author{i % 100}", Decimal("9.99")) for i in range(count)])
+
+
+def bench_encode_decode() -> None:
+    serializer = BinarySerializer()
+    # JSON is encoded and decoded the same way as JsonSerializer does it, without the file
+    formats: dict[str, tuple[Callable[[dict[str, Any]], Any], Callable[[Any], dict[str, Any]]]] = {
+        "json": (lambda data: json.dumps(data, indent=4, default=_to_json), json.loads),
+        "binary": (serializer.encode, serializer.decode),
+    }
+
+    print(f"{'books':>8} | {'format':>6} | {'size, KiB':>9} | {'encode, books/s':>15} | {'decode, books/s':>15}")
+    for count in BOOKS_COUNTS:
+        data: dict[str, Any] = make_bookcase(count).to_dict()
+        number: int = max(1, 100_000 // count)
+        for name, (encode, decode) in formats.items():
+            encoded: Any = encode(data)
+            by_encode: float = timeit.timeit(lambda: encode(data), number=number) / number
+            by_decode: float = timeit.timeit(lambda: decode(encoded), number=number) / number
+            size: float = len(encoded) / 1024
+            print(f"{count:>8} | {name:>6} | {size:>9.1f} | {count / by_encode:>15.0f} | {count / by_decode:>15.0f}")
+
+
+if __name__ == "__main__":
+    bench_encode_decode()
@@ -1,6 +1,6 @@
 import uuid
 from decimal import Decimal
-from typing import Any, Sequence
+from typing import Any, Iterable, Iterator
 
 from storage import Storage, Item
 
@@ -28,11 +28,6 @@ class Book(Item):
     def price(self) -> Decimal:
         return self.__price
 
-    def to_dict(self) -> dict[str, Any]:
-        data: dict[str, Any] = super().to_dict()
-        data["price"] = float(self.price)
-        return data
-
     def __str__(self) -> str:
         return f"Book #{self.id}: {self.title} by {self.author} with weight {self.weight} and price {self.price}"
 
@@ -71,11 +66,11 @@ class Book(Item):
 
 
 class Bookcase(Storage):
-    def __init__(self, max_weight: int, items: Sequence[Book] | None = None, id: uuid.UUID | None = None) -> None:
-        self.__max_weight: int = self.validate_max_weight(max_weight)
+    transient_attrs: frozenset[str] = Storage.transient_attrs | {"total_weight"}
 
-        if items is not None and sum(items) > self.__max_weight:  # type: ignore
-            raise MaxWeightExcessError("Total weight of books exceeds max weight of bookcase")
+    def __init__(self, max_weight: int, items: Iterable[Book] | None = None, id: uuid.UUID | None = None) -> None:
+        self.__max_weight: int = self.validate_max_weight(max_weight)
+        self.__total_weight: int = 0
         super().__init__(items, id)
 
     @property
@@ -84,16 +79,23 @@ class Bookcase(Storage):
 
     @property
     def total_book_weight(self) -> int:
-        return sum(self.items)  # type: ignore
+        self._materialize()
+        return self.__total_weight
 
     @property
     def total_book_price(self) -> Decimal:
         return sum(book.price for book in self.items)  # type: ignore
 
-    def add(self, item: Book) -> None:
-        if sum(self.items) + item.weight > self.__max_weight:  # type: ignore
+    # Every book is checked before it is put, so the lazy books are checked while they are loaded
+    def _check_item(self, item: Book) -> None:
+        if self.__total_weight + item.weight > self.__max_weight:
             raise MaxWeightExcessError("Total weight of books exceeds max weight of bookcase")
-        super().add(item)
+
+    def _item_added(self, item: Book) -> None:
+        self.__total_weight += item.weight
+
+    def _item_removed(self, item: Book) -> None:
+        self.__total_weight -= item.weight
 
     def find_book_by_author(self, author: str) -> Book | None:
         for book in self.items:
@@ -102,8 +104,10 @@ class Bookcase(Storage):
         return None
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Bookcase":
-        data["items"] = [Book(**it) for it in data["items"]]
+    def from_dict(cls, data: dict[str, Any], lazy: bool = False) -> "Bookcase":
+        items: Iterator[Book] = (Book.from_dict(it) for it in data["items"])  # type: ignore
+        data["items"] = items if lazy else list(items)
+        data["id"] = uuid.UUID(data["id"])
         return cls(**data)
 
     @classmethod
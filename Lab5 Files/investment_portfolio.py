@@ -2,7 +2,7 @@ import uuid
 import enum
 import os
 import datetime
-from typing import Any
+from typing import Any, Iterator
 from decimal import Decimal
 import requests
 
@@ -58,11 +58,6 @@ class Stock(Item):
     def total_price(self) -> Decimal:
         return self.amount * self.price
 
-    def to_dict(self) -> dict[str, Any]:
-        data: dict[str, Any] = super().to_dict()
-        data["price"] = float(self.price)
-        return data
-
     @classmethod
     def validate_amount(cls, amount: int) -> int:
         if amount <= 0:
@@ -109,8 +104,9 @@ class InvestmentPortfolio(Storage):
         return total_price
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "InvestmentPortfolio":
-        data["items"] = [Stock.from_dict(it) for it in data["items"]]
+    def from_dict(cls, data: dict[str, Any], lazy: bool = False) -> "InvestmentPortfolio":
+        items: Iterator[Stock] = (Stock.from_dict(it) for it in data["items"])
+        data["items"] = items if lazy else list(items)
         data["id"] = uuid.UUID(data["id"])
         return cls(**data)
 
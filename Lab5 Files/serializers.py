@@ -1,35 +1,311 @@
+import enum
+import io
+import itertools
 import json
-from typing import Any
+import os
+import struct
+import uuid
+from decimal import Decimal
+from typing import Any, Iterator
 from abc import ABC, abstractmethod
 
+from backends import Backend, DirectoryBackend
+
+
+# Decimals are kept by 'to_dict' and written to the text formats as numbers
+def _to_json(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Every format is kept in its own directory under the data root, unless the other backend is given
+DATA_ROOT: str = "Lab5 Files/data"
+
 
 class Serilizer(ABC):
+    # Streaming serializers get the items as an iterator and read them back as an iterator
+    streaming: bool = False
+    # Directory of the format under the data root and the suffix of its files
+    directory: str = ""
+    suffix: str = ""
+
+    def __init__(self, root: str | None = None, backend: Backend | None = None) -> None:
+        if root is not None and backend is not None:
+            raise ValueError("Only one of root and backend can be given")
+        if backend is None:
+            backend = DirectoryBackend(os.path.join(DATA_ROOT if root is None else root, self.directory), self.suffix)
+        self.__backend: Backend = backend
+
+    @property
+    def backend(self) -> Backend:
+        return self.__backend
+
+    def write(self, data: dict[str, Any]) -> None:
+        self.__backend.save(data["id"], self.encode(data))
+
+    def read(self, id: str) -> dict[str, Any]:
+        return self.decode(self.__backend.load(id))
+
     @abstractmethod
-    def write(self, data) -> None:
+    def encode(self, data: dict[str, Any]) -> bytes:
         raise NotImplementedError()
 
     @abstractmethod
-    def read(self, id) -> dict[str, Any]:
+    def decode(self, raw: bytes) -> dict[str, Any]:
         raise NotImplementedError()
 
 
 class JsonSerializer(Serilizer):
-    def write(self, data: dict[str, Any]) -> None:
-        with open(f"Lab5 Files/data/json/{data['id']}.json", "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=4)
+    directory: str = "json"
+    suffix: str = ".json"
 
-    def read(self, id: str) -> dict[str, Any]:
-        with open(f"Lab5 Files/data/json/{id}.json", "r", encoding="utf-8") as file:
-            data = json.load(file)
-        return data
+    def encode(self, data: dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=4, default=_to_json).encode("utf-8")
+
+    def decode(self, raw: bytes) -> dict[str, Any]:
+        return json.loads(raw)
 
 
 class TxtSerializer(Serilizer):
+    directory: str = "txt"
+    suffix: str = ".txt"
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        return str(json.loads(json.dumps(data, default=_to_json))).encode("utf-8")
+
+    def decode(self, raw: bytes) -> dict[str, Any]:
+        return json.loads(raw.decode("utf-8").replace("'", '"'))
+
+
+class JsonLinesSerializer(Serilizer):
+    # The first line is the storage without items, then every item is written on its own line,
+    # so neither writing nor reading keeps all the items in memory
+    streaming: bool = True
+    directory: str = "jsonl"
+    suffix: str = ".jsonl"
+
     def write(self, data: dict[str, Any]) -> None:
-        with open(f"Lab5 Files/data/txt/{data['id']}.txt", "w", encoding="utf-8") as file:
-            file.write(str(data))
+        header: dict[str, Any] = {key: value for key, value in data.items() if key != "items"}
+        with self.backend.open_writer(data["id"]) as raw:
+            file = io.TextIOWrapper(raw, encoding="utf-8")
+            file.write(json.dumps(header, default=_to_json) + "\n")
+            for item in data["items"]:
+                file.write(json.dumps(item, default=_to_json) + "\n")
+            file.detach()
 
     def read(self, id: str) -> dict[str, Any]:
-        with open(f"Lab5 Files/data/txt/{id}.txt", "r", encoding="utf-8") as file:
-            data = json.loads(file.read().replace("'", '"'))
+        file = io.TextIOWrapper(self.backend.open_reader(id), encoding="utf-8")
+        try:
+            data: dict[str, Any] = json.loads(file.readline())
+        except Exception:
+            file.close()
+            raise
+        data["items"] = self.__read_items(file)
+        return data
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        header: dict[str, Any] = {key: value for key, value in data.items() if key != "items"}
+        lines: list[str] = [json.dumps(it, default=_to_json) for it in [header, *data["items"]]]
+        return "".join(line + "\n" for line in lines).encode("utf-8")
+
+    def decode(self, raw: bytes) -> dict[str, Any]:
+        header, *items = raw.decode("utf-8").splitlines()
+        data: dict[str, Any] = json.loads(header)
+        data["items"] = [json.loads(item) for item in items]
         return data
+
+    @staticmethod
+    def __read_items(file: Any) -> Iterator[dict[str, Any]]:
+        with file:
+            for line in file:
+                yield json.loads(line)
+
+
+# Binary file is the magic and the schema version, then the table of the storage fields with one row and the table
+# of the items. Table is its schema, the fixed-width rows and the text of the string columns, column after column
+BINARY_MAGIC: bytes = b"STRG"
+BINARY_VERSION: int = 1
+BINARY_PREFIX: struct.Struct = struct.Struct("<4sH")
+# Number of columns and rows, size of the text in bytes
+TABLE_HEADER: struct.Struct = struct.Struct("<HII")
+# Type of the column, scale of its decimals and size of its name in bytes
+COLUMN_HEADER: struct.Struct = struct.Struct("<BBH")
+
+INT64_MIN: int = -(2**63)
+INT64_MAX: int = 2**63 - 1
+
+
+class ColumnType(enum.IntEnum):
+    UUID = 0
+    INT = 1
+    # Decimals scaled to the integers by the scale of the column
+    DECIMAL = 2
+    # Decimals which don't fit to the 8 bytes after scaling are kept as text
+    DECIMAL_TEXT = 3
+    FLOAT = 4
+    BOOL = 5
+    STR = 6
+    # Integers which don't fit to the 8 bytes are kept as text
+    INT_TEXT = 7
+
+
+# Format of the column in the row, the text columns keep the length of the value in characters
+COLUMN_FORMATS: dict[ColumnType, str] = {
+    ColumnType.UUID: "16s",
+    ColumnType.INT: "q",
+    ColumnType.DECIMAL: "q",
+    ColumnType.DECIMAL_TEXT: "I",
+    ColumnType.FLOAT: "d",
+    ColumnType.BOOL: "?",
+    ColumnType.STR: "I",
+    ColumnType.INT_TEXT: "I",
+}
+TEXT_COLUMNS: frozenset[ColumnType] = frozenset({ColumnType.STR, ColumnType.DECIMAL_TEXT, ColumnType.INT_TEXT})
+# Types of the values which can be written, bool goes before int as it is its subclass
+VALUE_TYPES: tuple[type, ...] = (bool, int, float, Decimal, str)
+
+
+class BinarySerializer(Serilizer):
+    # Columns are found from the values of the first item, so all the items must have the same fields.
+    # The 'id' fields are written as 16 raw bytes and the decimals exactly, they are read back as Decimal
+    directory: str = "bin"
+    suffix: str = ".bin"
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        fields: dict[str, Any] = {key: value for key, value in data.items() if key != "items"}
+        return b"".join(
+            (
+                BINARY_PREFIX.pack(BINARY_MAGIC, BINARY_VERSION),
+                self.__encode_table([fields]),
+                self.__encode_table(list(data["items"])),
+            )
+        )
+
+    def decode(self, raw: bytes) -> dict[str, Any]:
+        magic, version = BINARY_PREFIX.unpack_from(raw)
+        if magic != BINARY_MAGIC:
+            raise ValueError("Data is not a binary storage")
+        if version != BINARY_VERSION:
+            raise ValueError(f"Unsupported schema version {version}")
+
+        buffer: memoryview = memoryview(raw)
+        fields, offset = self.__decode_table(buffer, BINARY_PREFIX.size)
+        items, _ = self.__decode_table(buffer, offset)
+        data: dict[str, Any] = fields[0]
+        data["items"] = items
+        return data
+
+    @classmethod
+    def __encode_table(cls, rows: list[dict[str, Any]]) -> bytes:
+        names: list[str] = list(rows[0]) if rows else []
+        for row in rows:
+            if len(row) != len(names):
+                raise ValueError("All the items must have the same fields")
+
+        types: list[ColumnType] = []
+        scales: list[int] = []
+        columns: list[list[Any]] = []
+        texts: list[str] = []
+        for name in names:
+            column_type, scale, values = cls.__encode_column(name, [row[name] for row in rows])
+            if column_type in TEXT_COLUMNS:
+                texts.extend(values)
+                values = [len(value) for value in values]
+            types.append(column_type)
+            scales.append(scale)
+            columns.append(values)
+
+        row_struct: struct.Struct = struct.Struct("<" + "".join(COLUMN_FORMATS[column_type] for column_type in types))
+        text: bytes = "".join(texts).encode("utf-8")
+        schema: list[bytes] = [TABLE_HEADER.pack(len(names), len(rows), len(text))]
+        for name, column_type, scale in zip(names, types, scales):
+            encoded_name: bytes = name.encode("utf-8")
+            schema.append(COLUMN_HEADER.pack(column_type, scale, len(encoded_name)) + encoded_name)
+
+        packed_rows: bytes = b"".join(itertools.starmap(row_struct.pack, zip(*columns))) if names else b""
+        return b"".join(schema) + packed_rows + text
+
+    @staticmethod
+    def __encode_column(name: str, values: list[Any]) -> tuple[ColumnType, int, list[Any]]:
+        first: Any = values[0]
+        if name == "id":
+            # Hex is converted directly, making the UUID objects takes the most of the time
+            ids: list[bytes] = [
+                it.bytes if isinstance(it, uuid.UUID) else bytes.fromhex(it.replace("-", "")) for it in values
+            ]
+            if any(len(id) != 16 for id in ids):
+                raise ValueError(f"Field '{name}' must be UUID")
+            return ColumnType.UUID, 0, ids
+        # All the values of the column must be of the type of the first one, and the bools are not taken for the ints
+        value_type: type | None = next((it for it in VALUE_TYPES if isinstance(first, it)), None)
+        if value_type is None:
+            raise TypeError(f"Field '{name}' of type {type(first).__name__} can't be written")
+        for other_type in {type(value) for value in values}:
+            if not issubclass(other_type, value_type) or (value_type is int and issubclass(other_type, bool)):
+                raise TypeError(
+                    f"Field '{name}' must have values of one type, not {value_type.__name__} and {other_type.__name__}"
+                )
+
+        if value_type is bool:
+            return ColumnType.BOOL, 0, values
+        if value_type is int:
+            if INT64_MIN <= min(values) and max(values) <= INT64_MAX:
+                return ColumnType.INT, 0, values
+            return ColumnType.INT_TEXT, 0, [str(value) for value in values]
+        if value_type is float:
+            return ColumnType.FLOAT, 0, values
+        if value_type is Decimal:
+            exponents: list[int | str] = [value.as_tuple().exponent for value in values]
+            if all(isinstance(exponent, int) for exponent in exponents):
+                scale: int = max(0, -min(exponents))  # type: ignore
+                if scale <= 255:
+                    scaled: list[int] = [int(value.scaleb(scale)) for value in values]
+                    if all(INT64_MIN <= value <= INT64_MAX for value in scaled):
+                        return ColumnType.DECIMAL, scale, scaled
+            return ColumnType.DECIMAL_TEXT, 0, [str(value) for value in values]
+        return ColumnType.STR, 0, [str(value) for value in values]
+
+    @staticmethod
+    def __decode_table(buffer: memoryview, offset: int) -> tuple[list[dict[str, Any]], int]:
+        columns_count, rows_count, text_size = TABLE_HEADER.unpack_from(buffer, offset)
+        offset += TABLE_HEADER.size
+
+        names: list[str] = []
+        types: list[ColumnType] = []
+        scales: list[int] = []
+        for _ in range(columns_count):
+            column_type, scale, name_size = COLUMN_HEADER.unpack_from(buffer, offset)
+            offset += COLUMN_HEADER.size
+            names.append(str(buffer[offset : offset + name_size], "utf-8"))
+            types.append(ColumnType(column_type))
+            scales.append(scale)
+            offset += name_size
+        if not names:
+            return [{} for _ in range(rows_count)], offset + text_size
+
+        row_struct: struct.Struct = struct.Struct("<" + "".join(COLUMN_FORMATS[column_type] for column_type in types))
+        rows_end: int = offset + row_struct.size * rows_count
+        text: str = str(buffer[rows_end : rows_end + text_size], "utf-8")
+        text_offset: int = 0
+
+        columns: list[tuple[Any, ...]] = list(zip(*row_struct.iter_unpack(buffer[offset:rows_end])))
+        for i, (column_type, scale) in enumerate(zip(types, scales)):
+            values: tuple[Any, ...] = columns[i]
+            if column_type in TEXT_COLUMNS:
+                ends: list[int] = list(itertools.accumulate(values, initial=text_offset))
+                values = tuple(text[start:end] for start, end in itertools.pairwise(ends))
+                text_offset = ends[-1]
+            if column_type == ColumnType.UUID:
+                hexes: Iterator[str] = (value.hex() for value in values)
+                columns[i] = tuple(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}" for h in hexes)
+            elif column_type == ColumnType.DECIMAL:
+                columns[i] = tuple(Decimal(value).scaleb(-scale) for value in values)
+            elif column_type == ColumnType.DECIMAL_TEXT:
+                columns[i] = tuple(Decimal(value) for value in values)
+            elif column_type == ColumnType.INT_TEXT:
+                columns[i] = tuple(int(value) for value in values)
+            else:
+                columns[i] = values
+
+        return [dict(zip(names, row)) for row in zip(*columns)], rows_end + text_size
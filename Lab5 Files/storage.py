@@ -1,6 +1,6 @@
-import copy
+import itertools
 import uuid
-from typing import Generator, Sequence, Any
+from typing import Generator, Iterable, Iterator, Sequence, Any
 
 from serializers import Serilizer, JsonSerializer
 
@@ -49,105 +49,248 @@ class Item:
         return self.id == other.id and self.title == other.title
 
 
-class Storage:
-    __serializer: Serilizer = JsonSerializer()
+# Read-only view of the storage items as they were when the view was made, nothing is copied to make it
+class ItemsView(Sequence[Item]):
+    def __init__(self, items: list[Item]) -> None:
+        self.__items: list[Item] = items
+
+    def __getitem__(self, index: int | slice) -> "Item | ItemsView":
+        if isinstance(index, slice):
+            return ItemsView(self.__items[index])
+        return self.__items[index]
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(self.__items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.__items
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ItemsView):
+            return self.__items == other.__items
+        if isinstance(other, list):
+            return self.__items == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ItemsView({self.__items!r})"
+
 
-    def __init__(self, items: Sequence[Item] | None = None, id: uuid.UUID | None = None) -> None:
+class Storage:
+    # Subclasses choose the format and the backend of their files by their own serializer
+    serializer: Serilizer = JsonSerializer()
+    # Attributes of the state which are not written by 'to_dict'
+    transient_attrs: frozenset[str] = frozenset({"serializer", "shared", "index", "removed_ids", "pending"})
+
+    def __init__(self, items: Iterable[Item] | None = None, id: uuid.UUID | None = None) -> None:
+        # Sequences are copied at once, other iterables are consumed on the first access to the items
+        self.__pending: Iterator[Item] | None = None
         if items is None:
             self.__items: list[Item] = []
-        else:
+        elif isinstance(items, Sequence):
             self.__items: list[Item] = list(items)
+        else:
+            self.__items: list[Item] = []
+            self.__pending = iter(items)
+        # The list is shared with the views while True, so it is copied before the next change
+        self.__shared: bool = False
+        # Items by their ids, which must be unique, the lazy items are indexed when they are loaded
+        self.__index: dict[uuid.UUID, Item] = {}
+        # Items removed by id stay in the list until the next access by position, so removal is O(1)
+        self.__removed_ids: set[uuid.UUID] = set()
 
         if id is None:
             self.__id: uuid.UUID = uuid.uuid4()
         else:
             self.__id: uuid.UUID = id
 
+        for item in self.__items:
+            self.__index_item(item)
+            self._item_added(item)
+
     @property
     def id(self) -> uuid.UUID:
         return self.__id
 
     @property
-    def items(self) -> list[Item]:
-        return copy.deepcopy(self.__items)
+    def items(self) -> ItemsView:
+        self.__compact()
+        self.__shared = True
+        return ItemsView(self.__items)
+
+    def get_by_id(self, id: uuid.UUID) -> Item | None:
+        self._materialize()
+        return self.__index.get(id)
 
     def add(self, item: Item) -> None:
+        self.__index_item(item)
+        self.__own_items()
         self.__items.append(item)
+        self._item_added(item)
 
     def pop(self, index: int = -1) -> Item:
+        self.__compact()
         if index not in range(-len(self.__items), len(self.__items)):
             raise IndexError(f"Index '{index}' is out of range")
-        return self.__items.pop(index)
+        self.__own_items()
+        item: Item = self.__items.pop(index)
+        self.__unindex_item(item)
+        self._item_removed(item)
+        return item
 
     def remove(self, item: Item) -> None:
-        if item not in self.__items:
+        if item not in self:
             raise ValueError(f"Item {item.title} not in storage")
-        self.__items.remove(item)
+        stored: Item = self.__index.pop(item.id)
+        self.__removed_ids.add(item.id)
+        self._item_removed(stored)
 
     def clear(self) -> None:
-        self.__items.clear()
-
-    def to_dict(self) -> dict[str, Any]:
+        self.__compact()
+        removed: list[Item] = self.__items
+        self.__items = []
+        self.__shared = False
+        self.__index.clear()
+        for item in removed:
+            self._item_removed(item)
+
+    # Loads the items of the lazy storage, subclasses call it before reading their running aggregates.
+    # The rejected item, like the one with the id already loaded, raises and stays pending with the items after it,
+    # so nothing is lost and every later access raises again
+    def _materialize(self) -> None:
+        if self.__pending is not None:
+            pending: Iterator[Item] = self.__pending
+            self.__pending = None
+            for item in pending:
+                try:
+                    self.__index_item(item)
+                except Exception:
+                    self.__pending = itertools.chain((item,), pending)
+                    raise
+                self.__items.append(item)
+                self._item_added(item)
+
+    # Called before every item is put to the storage, including the lazy items, subclasses raise to reject it
+    def _check_item(self, item: Item) -> None:
+        pass
+
+    # Called after every item is put to or taken from the storage, so subclasses can keep running aggregates
+    def _item_added(self, item: Item) -> None:
+        pass
+
+    def _item_removed(self, item: Item) -> None:
+        pass
+
+    def __own_items(self) -> None:
+        if self.__shared:
+            self.__items = list(self.__items)
+            self.__shared = False
+
+    def __index_item(self, item: Item) -> None:
+        self._materialize()
+        if item.id in self.__index:
+            raise ValueError(f"Item with id {item.id} is already in storage")
+        self._check_item(item)
+        # The removed item is put back, so its old place must be dropped before
+        if item.id in self.__removed_ids:
+            self.__compact()
+        self.__index[item.id] = item
+
+    def __unindex_item(self, item: Item) -> None:
+        del self.__index[item.id]
+
+    def __compact(self) -> None:
+        self._materialize()
+        if self.__removed_ids:
+            removed_ids: set[uuid.UUID] = self.__removed_ids
+            self.__items = [item for item in self.__items if item.id not in removed_ids]
+            self.__shared = False
+            self.__removed_ids = set()
+
+    def to_dict(self, lazy: bool = False) -> dict[str, Any]:
+        # The lazy items are converted while they are written, from the snapshot of the storage items
+        items: ItemsView = self.items
         data: dict[str, Any] = {}
         for attr, item in self.__dict__.items():
-            if "serializer" in attr:
-                continue
             if "__" in attr:
                 attr: str = attr.rsplit("__", maxsplit=1)[-1]
+            if attr in self.transient_attrs:
+                continue
             data[attr] = item
 
-        data["items"] = [it.to_dict() for it in data["items"]]
+        items_data: Iterator[dict[str, Any]] = (it.to_dict() for it in items)
+        data["items"] = items_data if lazy else list(items_data)
         data["id"] = str(self.id)
 
         return data
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Storage":
-        data["items"] = [Item.from_dict(it) for it in data["items"]]
+    def from_dict(cls, data: dict[str, Any], lazy: bool = False) -> "Storage":
+        items: Iterator[Item] = (Item.from_dict(it) for it in data["items"])
+        data["items"] = items if lazy else list(items)
         data["id"] = uuid.UUID(data["id"])
         return cls(**data)
 
-    def write_to_file(self) -> None:
-        data: dict[str, Any] = self.to_dict()
-        self.__serializer.write(data)
+    def write_to_file(self, serializer: Serilizer | None = None) -> None:
+        serializer = self.serializer if serializer is None else serializer
+        serializer.write(self.to_dict(lazy=serializer.streaming))
 
     @classmethod
-    def read_from_file(cls, id: str) -> "Storage":
-        data: dict[str, Any] = cls.__serializer.read(id)
-        return cls.from_dict(data)
+    def read_from_file(cls, id: str, lazy: bool = False, serializer: Serilizer | None = None) -> "Storage":
+        serializer = cls.serializer if serializer is None else serializer
+        data: dict[str, Any] = serializer.read(id)
+        return cls.from_dict(data, lazy)
 
     def __getitem__(self, index: int) -> Item:
+        self.__compact()
         if index not in range(-len(self.__items), len(self.__items)):
             raise IndexError(f"Index '{index}' is out of range")
         return self.__items[index]
 
     def __setitem__(self, index: int, item: Item) -> None:
+        self.__index_item(item)
+        self.__compact()
+        self.__own_items()
         self.__items.insert(index, item)
+        self._item_added(item)
 
     def __delitem__(self, index: int) -> None:
+        self.__compact()
         if index not in range(-len(self.__items), len(self.__items)):
             raise IndexError(f"Index '{index}' is out of range")
-        del self.__items[index]
+        self.__own_items()
+        item: Item = self.__items.pop(index)
+        self.__unindex_item(item)
+        self._item_removed(item)
 
     def __contains__(self, item: Item) -> bool:
-        return item in self.__items
+        if not isinstance(item, Item):
+            return False
+        # Equal items have equal ids, so only the item with the same id is compared
+        self._materialize()
+        stored: Item | None = self.__index.get(item.id)
+        return stored is not None and stored == item
 
     def __iter__(self) -> Generator[Item, Any, None]:
         return StorageIterator(self.items)
 
     def __len__(self) -> int:
-        return len(self.__items)
+        self._materialize()
+        return len(self.__items) - len(self.__removed_ids)
 
     def __str__(self) -> str:
-        return f"Storage #{self.id}\n" "Items:\n" + "\n".join([str(item) for item in self.__items])
+        return f"Storage #{self.id}\n" "Items:\n" + "\n".join([str(item) for item in self.items])
 
     def __repr__(self) -> str:
-        return f"Storage(items={[repr(item) for item in self.__items]})"
+        return f"Storage(items={[repr(item) for item in self.items]})"
 
 
 class StorageIterator(Generator[Item, Any, None]):
-    def __init__(self, storage_items: list[Item]) -> None:
-        self.__items: list[Item] = storage_items
+    def __init__(self, storage_items: Sequence[Item]) -> None:
+        self.__items: Sequence[Item] = storage_items
         self.__index: int = 0
 
     def __iter__(self) -> "StorageIterator":
@@ -169,6 +312,9 @@ class StorageIterator(Generator[Item, Any, None]):
         self.__index = index
 
     def send(self, value: Item) -> None:
+        # The sent items are added to the iterator only, the read-only view is copied on the first one
+        if not isinstance(self.__items, list):
+            self.__items = list(self.__items)
         self.__items.append(value)
 
     def throw(self, typ: Exception, val: Any = None, tb: Any = None) -> None:
@@ -0,0 +1,132 @@
+import pytest
+
+from backends import DirectoryBackend, MemoryBackend, SqliteBackend, StorageNotFoundError
+from serializers import BinarySerializer, JsonLinesSerializer, JsonSerializer, TxtSerializer
+from storage import Item, Storage
+
+
+@pytest.fixture(params=["directory", "sqlite", "memory"])
+def backend(request, tmp_path):
+    if request.param == "directory":
+        yield DirectoryBackend(str(tmp_path / "data"), ".bin")
+    elif request.param == "sqlite":
+        with SqliteBackend(str(tmp_path / "data.db")) as backend:
+            yield backend
+    else:
+        yield MemoryBackend()
+
+
+def test_backend_save_load_delete(backend):
+    backend.save("a", b"first")
+    backend.save("b", b"")
+    backend.save("a", b"second")
+    assert backend.load("a") == b"second"
+    assert backend.load("b") == b""
+
+    backend.delete("a")
+    with pytest.raises(StorageNotFoundError):
+        backend.load("a")
+    with pytest.raises(StorageNotFoundError):
+        backend.delete("a")
+
+
+def test_backend_streams(backend):
+    with backend.open_writer("a") as file:
+        file.write(b"line\n")
+    with backend.open_reader("a") as file:
+        assert file.read() == b"line\n"
+
+    with pytest.raises(StorageNotFoundError):
+        backend.open_reader("b")
+
+
+def test_memory_backend_failed_write():
+    backend = MemoryBackend()
+    with pytest.raises(RuntimeError):
+        with backend.open_writer("a") as file:
+            file.write(b"partial")
+            raise RuntimeError()
+    assert len(backend) == 0
+
+
+def test_backend_failed_write_keeps_previous(backend):
+    backend.save("a", b"previous")
+    with pytest.raises(RuntimeError):
+        with backend.open_writer("a") as file:
+            file.write(b"partial")
+            raise RuntimeError()
+    assert backend.load("a") == b"previous"
+
+
+def test_json_lines_failed_write_keeps_previous(tmp_path):
+    def items():
+        yield Item("first").to_dict()
+        raise RuntimeError()
+
+    serializer = JsonLinesSerializer(root=str(tmp_path))
+    storage = Storage([Item("kept")])
+    storage.write_to_file(serializer)
+    with pytest.raises(RuntimeError):
+        serializer.write({"id": str(storage.id), "items": items()})
+
+    assert Storage.read_from_file(str(storage.id), serializer=serializer).items == storage.items
+    assert [path.name for path in (tmp_path / "jsonl").iterdir()] == [f"{storage.id}.jsonl"]
+
+
+def test_sqlite_backend_one_file(tmp_path):
+    path = str(tmp_path / "data.db")
+    with SqliteBackend(path) as backend:
+        backend.save("a", b"data")
+    with SqliteBackend(path) as backend:
+        assert backend.load("a") == b"data"
+
+    with SqliteBackend(path) as backend:
+        with backend.batch():
+            backend.save("b", b"data")
+            backend.save("c", b"data")
+        with pytest.raises(RuntimeError):
+            with backend.batch():
+                backend.save("d", b"data")
+                raise RuntimeError()
+        assert backend.load("c") == b"data"
+        with pytest.raises(StorageNotFoundError):
+            backend.load("d")
+
+        # Deletions in the failed batch are rolled back with its saves
+        with pytest.raises(RuntimeError):
+            with backend.batch():
+                backend.delete("b")
+                backend.save("d", b"data")
+                raise RuntimeError()
+        assert backend.load("b") == b"data"
+        with pytest.raises(StorageNotFoundError):
+            backend.load("d")
+
+    with pytest.raises(ValueError):
+        SqliteBackend(path, table="storages; DROP TABLE storages")
+
+
+@pytest.mark.parametrize("serializer_class", [JsonSerializer, TxtSerializer, JsonLinesSerializer, BinarySerializer])
+def test_serializers_backend(backend, serializer_class):
+    serializer = serializer_class(backend=backend)
+    storage = Storage([Item("book1"), Item("book2")])
+    storage.write_to_file(serializer)
+    assert Storage.read_from_file(str(storage.id), serializer=serializer).items == storage.items
+
+
+def test_serializer_root(tmp_path):
+    serializer = JsonSerializer(root=str(tmp_path))
+    assert serializer.backend.root == str(tmp_path / "json")
+    with pytest.raises(ValueError):
+        JsonSerializer(root=str(tmp_path), backend=MemoryBackend())
+
+
+def test_storage_subclass_backend():
+    class MemoryStorage(Storage):
+        serializer = BinarySerializer(backend=MemoryBackend())
+
+    storage = MemoryStorage([Item("book1")])
+    storage.write_to_file()
+    assert len(MemoryStorage.serializer.backend) == 1
+    assert MemoryStorage.read_from_file(str(storage.id)).items == storage.items
+    assert isinstance(Storage.serializer.backend, DirectoryBackend)
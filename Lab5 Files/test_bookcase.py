@@ -2,6 +2,7 @@ from decimal import Decimal
 import pytest
 
 from bookcase import Book, Bookcase, MaxWeightExcessError
+from serializers import BinarySerializer
 
 
 # Book tests
@@ -46,6 +47,24 @@ def test_bookcase_add():
         bookcase.add(Book("book2", 20, "author2", Decimal(10)))
 
 
+def test_bookcase_checks_weight_of_every_book():
+    light, heavy = Book("light", 10, "author1", Decimal(10)), Book("heavy", 50, "author2", Decimal(10))
+    with pytest.raises(MaxWeightExcessError):
+        Bookcase(50, [light, heavy])
+
+    bookcase = Bookcase(50, (book for book in [light, heavy, light]))
+    for _ in range(2):
+        with pytest.raises(MaxWeightExcessError):
+            bookcase.total_book_weight
+    with pytest.raises(MaxWeightExcessError):
+        len(bookcase)
+
+    bookcase = Bookcase(50, [light])
+    with pytest.raises(MaxWeightExcessError):
+        bookcase[0] = heavy
+    assert bookcase.items == [light]
+
+
 def test_bookcase_find_book_by_author():
     bookcase = Bookcase(100)
     book1 = Book("book1", 10, "author1", Decimal(10))
@@ -57,3 +76,40 @@ def test_bookcase_find_book_by_author():
     assert bookcase.find_book_by_author("author1") == book1
     assert bookcase.find_book_by_author("author2") == book2
     assert bookcase.find_book_by_author("author3") is None
+
+
+def test_bookcase_total_book_weight_after_changes():
+    book1 = Book("book1", 10, "author1", Decimal(10))
+    book2 = Book("book2", 20, "author2", Decimal(10))
+    bookcase = Bookcase(100, [book1, book2])
+    assert bookcase.total_book_weight == 30
+
+    bookcase.remove(book1)
+    assert bookcase.total_book_weight == 20
+    bookcase[0] = book1
+    del bookcase[1]
+    assert bookcase.total_book_weight == 10
+    bookcase.pop()
+    assert bookcase.total_book_weight == 0
+
+    bookcase.add(book2)
+    bookcase.clear()
+    assert bookcase.total_book_weight == 0
+    assert "total_weight" not in bookcase.to_dict()
+
+
+def test_bookcase_binary_round_trip():
+    books = [
+        Book("It's a title", 10, "author1", Decimal("19.99")),
+        Book("книга", 20, "", Decimal("0.1")),
+        Book("book3", 30, "author3", Decimal(7)),
+    ]
+    bookcase = Bookcase(100, books)
+    serializer = BinarySerializer()
+
+    read_bookcase = Bookcase.from_dict(serializer.decode(serializer.encode(bookcase.to_dict())))
+    assert read_bookcase.id == bookcase.id
+    assert read_bookcase.max_weight == 100
+    assert read_bookcase.items == bookcase.items
+    assert read_bookcase.total_book_price == Decimal("27.09")
+    assert all(isinstance(book.price, Decimal) for book in read_bookcase)
@@ -1,5 +1,6 @@
 from decimal import Decimal
 from investment_portfolio import InvestmentPortfolio, Stock, Currency
+from serializers import BinarySerializer
 
 
 # Stock tests
@@ -74,3 +75,18 @@ def test_investment_portfolio_get_total_price():
     ]
     portfolio = InvestmentPortfolio(stocks)
     assert portfolio.get_total_price(Currency.USD) == Decimal(2500)
+
+
+def test_investment_portfolio_binary_round_trip():
+    portfolio = InvestmentPortfolio(
+        [
+            Stock(compain="Apple", amount=10, price=Decimal("100.25"), currency=Currency.USD, title="Apple"),
+            Stock(compain="Tesla", amount=3, price=Decimal(300), currency=Currency.EUR, title="Tesla"),
+        ]
+    )
+    serializer = BinarySerializer()
+
+    read_portfolio = InvestmentPortfolio.from_dict(serializer.decode(serializer.encode(portfolio.to_dict())))
+    assert read_portfolio.id == portfolio.id
+    assert read_portfolio.items == portfolio.items
+    assert read_portfolio[0].price == Decimal("100.25")
@@ -1,3 +1,9 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from serializers import BINARY_PREFIX, BinarySerializer, JsonLinesSerializer
 from storage import Item, Storage
 
 
@@ -77,3 +83,136 @@ def test_storage_from_dict():
     from_dict_storage = Storage.from_dict(storage.to_dict())
     assert from_dict_storage.items == storage.items
     assert from_dict_storage.id == storage.id
+
+
+def test_storage_items_view():
+    first, second = Item("first"), Item("second")
+    storage = Storage([first])
+    items = storage.items
+    assert items[0] is first
+    assert not hasattr(items, "append")
+
+    storage.add(second)
+    storage.pop(0)
+    assert items == [first]
+    assert storage.items == [second]
+
+    for item in storage:
+        storage.add(Item("third"))
+    assert len(storage) == 2
+
+
+def test_storage_get_by_id():
+    first, second = Item("first"), Item("second")
+    storage = Storage.from_dict(Storage([first, second]).to_dict())
+    assert storage.get_by_id(first.id) == first
+    assert storage.get_by_id(uuid.uuid4()) is None
+    assert Item("first", first.id) in storage
+    assert Item("renamed", first.id) not in storage
+    assert "first" not in storage
+
+    with pytest.raises(ValueError):
+        storage.add(Item("copy", first.id))
+
+
+def test_storage_index_after_changes():
+    items = [Item(f"item{i}") for i in range(5)]
+    storage = Storage(items)
+
+    storage.remove(items[1])
+    storage.remove(items[3])
+    assert len(storage) == 3
+    assert storage.get_by_id(items[1].id) is None
+    assert storage[1] == items[2]
+
+    storage[0] = items[1]
+    del storage[1]
+    assert storage.pop() == items[4]
+    assert storage.items == [items[1], items[2]]
+    assert [storage.get_by_id(item.id) is not None for item in items] == [False, True, True, False, False]
+
+    storage.remove(items[2])
+    storage.add(items[2])
+    assert storage.items == [items[1], items[2]]
+    assert storage.to_dict()["items"] == [items[1].to_dict(), items[2].to_dict()]
+
+    storage.clear()
+    assert items[1] not in storage
+    storage.add(items[1])
+    assert len(storage) == 1
+
+
+def test_storage_rejects_duplicate_ids():
+    first, second = Item("first"), Item("second")
+    with pytest.raises(ValueError):
+        Storage([first, second, first])
+    with pytest.raises(ValueError):
+        Storage([first, Item("copy", first.id)])
+
+    # The duplicate and the items after it are not dropped, every access raises until they are loaded
+    storage = Storage(item for item in [first, Item("copy", first.id), second])
+    for access in (len, lambda it: it.items, lambda it: it.get_by_id(second.id), lambda it: first in it):
+        with pytest.raises(ValueError):
+            access(storage)
+
+
+def test_storage_json_lines_lazy_read(tmp_path):
+    serializer = JsonLinesSerializer(root=str(tmp_path))
+    storage = Storage([Item(f"item{i}") for i in range(3)])
+    storage.write_to_file(serializer)
+
+    lines = (tmp_path / "jsonl" / f"{storage.id}.jsonl").read_text().splitlines()
+    assert len(lines) == 4
+
+    data = serializer.read(str(storage.id))
+    assert data["id"] == str(storage.id)
+    assert next(data["items"]) == storage[0].to_dict()
+    data["items"].close()
+
+    lazy_storage = Storage.read_from_file(str(storage.id), lazy=True, serializer=serializer)
+    assert lazy_storage.id == storage.id
+    assert lazy_storage.get_by_id(storage[2].id) == storage[2]
+    assert lazy_storage.items == storage.items
+    assert Storage.read_from_file(str(storage.id), serializer=serializer).items == storage.items
+
+
+def test_binary_serializer_round_trip(tmp_path):
+    serializer = BinarySerializer(root=str(tmp_path))
+
+    storage = Storage([Item("it's"), Item("")])
+    storage.write_to_file(serializer)
+    assert Storage.read_from_file(str(storage.id), serializer=serializer).items == storage.items
+
+    empty = Storage()
+    assert Storage.from_dict(serializer.decode(serializer.encode(empty.to_dict()))).items == []
+
+
+def test_binary_serializer_values():
+    serializer = BinarySerializer()
+    id = str(uuid.uuid4())
+    items = [
+        {"id": id, "flag": True, "count": -(2**63), "ratio": 0.5, "price": Decimal("1.5"), "big": Decimal(0.1)},
+        {"id": id, "flag": False, "count": 2**63 - 1, "ratio": -1.0, "price": Decimal(2), "big": Decimal("NaN")},
+    ]
+    data = serializer.decode(serializer.encode({"id": id, "items": items}))
+    assert data["id"] == id
+    assert data["items"][0] == items[0]
+    assert data["items"][1]["big"].is_nan()
+    assert data["items"][1]["price"] == Decimal(2)
+
+    with pytest.raises(ValueError):
+        serializer.encode({"id": id, "items": [{"title": "a"}, {"title": "b", "extra": 1}]})
+    with pytest.raises(TypeError):
+        serializer.encode({"id": id, "items": [{"title": None}]})
+    for mixed in ([1, 1.5], [1, True], [True, 1], [Decimal(1), 1], ["a", 1]):
+        with pytest.raises(TypeError):
+            serializer.encode({"id": id, "items": [{"weight": value} for value in mixed]})
+
+    # Integers which don't fit to the 8 bytes are kept as text
+    counts = [1, 2**63, -(2**100)]
+    data = serializer.decode(serializer.encode({"id": id, "items": [{"count": count} for count in counts]}))
+    assert [item["count"] for item in data["items"]] == counts
+
+    raw = serializer.encode({"id": id, "items": []})
+    with pytest.raises(ValueError):
+        serializer.decode(BINARY_PREFIX.pack(b"STRG", 99) + raw[BINARY_PREFIX.size :])